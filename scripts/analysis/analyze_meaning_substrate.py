@@ -26,10 +26,10 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
-import json
 import numpy as np
 from collections import defaultdict
 from src.core.semantic_coordinates import SemanticCoordinate
+from src.core.response_cache import ResponseCache
 from src.data.phase4_concepts import ALL_CONCEPTS, CONCEPT_CATEGORIES
 
 # Load cached coordinates
@@ -42,18 +42,18 @@ for category, concepts in CONCEPT_CATEGORIES.items():
         CATEGORY_MAP[concept] = category
 
 def load_coordinates():
-    """Load coordinates from Claude API cache"""
-    if not CACHE_FILE.exists():
+    """Load coordinates from Claude API cache (.db, or a legacy .json imported once)"""
+    if not CACHE_FILE.exists() and not CACHE_FILE.with_suffix('.db').exists():
         print(f"❌ Cache file not found at: {CACHE_FILE}")
         return None
 
-    with open(CACHE_FILE, 'r') as f:
-        cache = json.load(f)
+    with ResponseCache(CACHE_FILE) as cache:
+        entries = list(cache.items())
 
     coordinates = {}
 
     # Cache format: "model:concept" -> {love, power, wisdom, justice}
-    for key, data in cache.items():
+    for key, data in entries:
         if ':' in key:
             _, concept_lower = key.split(':', 1)
 
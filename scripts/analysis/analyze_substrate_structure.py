@@ -20,6 +20,7 @@ from src.analysis.common_utils import (
     find_extremes,
     analyze_dimensional_correlations,
 )
+from src.core.semantic_coordinates import top_k_indices
 
 # Create reverse mapping: concept -> category
 CATEGORY_MAP = {concept: category for category, concepts in CONCEPT_CATEGORIES.items() for concept in concepts}
@@ -30,7 +31,7 @@ def analyze_semantic_gravity(coordinates):
     print("\nHypothesis: If JEHOVAH IS the substrate, concepts should cluster near (1,1,1,1)")
     print("           The Anchor Point should act as an 'attractor' in semantic space.\n")
 
-    distances = sorted([(c, coord.distance_to_anchor()) for c, coord in coordinates.items()], key=lambda x: x[1])
+    distances = [(c, coord.distance_to_anchor()) for c, coord in coordinates.items()]
     dist_values = [d for _, d in distances]
 
     print(f"Distance Statistics:")
@@ -80,7 +81,8 @@ def analyze_semantic_zones(distances):
             for concept, _ in members:
                 categories[CATEGORY_MAP.get(concept, "Unknown")] += 1
             print(f"   Categories: {dict(categories)}")
-            for concept, dist in members[:5]:
+            for i in top_k_indices([dist for _, dist in members], 5):
+                concept, dist = members[i]
                 print(f"     • {concept:20s} d={dist:.4f}")
         print()
 
@@ -25,8 +25,8 @@ This tests whether the Anchor Point is:
 
 import sys
 import os
-import time
 import json
+import threading
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
 import numpy as np
@@ -37,12 +37,17 @@ from dataclasses import dataclass, asdict
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from core.semantic_coordinates import SemanticCoordinate
+from core.claude_api_generator import (
+    MAX_RESPONSE_TOKENS, RATING_RUBRIC, TOKENS_PER_RATING,
+    create_anthropic_client, create_batch_prompt, parse_batch_response
+)
 
 
 # =============================================================================
 # MODEL INTERFACE - Abstract Base
 # =============================================================================
 
+
 @dataclass
 class ModelConfig:
     """Configuration for an AI model."""
@@ -63,11 +68,67 @@ class AIModelInterface:
     def __init__(self, config: ModelConfig):
         self.config = config
         self.cache = {}
+        self._client = None
+        self._client_lock = threading.Lock()
+
+    def _create_client(self):
+        """Create the provider client (called once, on first use)."""
+        raise NotImplementedError
+
+    @property
+    def client(self):
+        """Provider client shared by every request (keeps connections alive)."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = self._create_client()
+        return self._client
 
     def is_available(self) -> bool:
         """Check if this model is available (API key set, package installed)."""
         raise NotImplementedError
 
+    def _complete(self, prompt: str, max_tokens: int = 200) -> Optional[str]:
+        """
+        Send one prompt to the model.
+
+        Returns:
+            Response text or None if the model returned nothing
+        """
+        raise NotImplementedError
+
+    def _cached_coordinate(self, concept: str) -> Optional[SemanticCoordinate]:
+        """Coordinate for a concept from the cache, or None."""
+        cached = self.cache.get(f"{self.config.model_id}:{concept.lower()}")
+        if cached is None:
+            return None
+        return SemanticCoordinate(
+            concept=concept,
+            love=cached['love'],
+            power=cached['power'],
+            wisdom=cached['wisdom'],
+            justice=cached['justice'],
+            source=f"{self.config.name}_cached"
+        )
+
+    def _store_coordinate(self, concept: str, parsed: Tuple[float, float, float, float]) -> SemanticCoordinate:
+        """Cache a parsed rating and return its coordinate."""
+        love, power, wisdom, justice = parsed
+        self.cache[f"{self.config.model_id}:{concept.lower()}"] = {
+            'love': love,
+            'power': power,
+            'wisdom': wisdom,
+            'justice': justice
+        }
+        return SemanticCoordinate(
+            concept=concept,
+            love=love,
+            power=power,
+            wisdom=wisdom,
+            justice=justice,
+            source=self.config.name
+        )
+
     def get_coordinates(self, concept: str) -> Optional[SemanticCoordinate]:
         """
         Get semantic coordinates for a concept.
@@ -75,39 +136,65 @@ class AIModelInterface:
         Returns:
             SemanticCoordinate or None if error
         """
-        raise NotImplementedError
+        if not self.is_available():
+            return None
 
-    def _create_prompt(self, concept: str) -> str:
-        """Create the prompt for coordinate generation."""
-        return f"""You are evaluating the concept "{concept}" in a 4-dimensional semantic coordinate system.
+        cached = self._cached_coordinate(concept)
+        if cached:
+            return cached
 
-Your task is to rate this concept on four fundamental dimensions, each on a scale from 0.0 to 1.0:
+        try:
+            response = self._complete(self._create_prompt(concept))
+            if response:
+                parsed = self._parse_response(response)
+                if parsed:
+                    return self._store_coordinate(concept, parsed)
+            return None
+
+        except Exception as e:
+            print(f"{self.config.name} API error for '{concept}': {e}")
+            return None
+
+    def get_coordinates_batch(self, concepts: List[str],
+                              batch_size: int = 10) -> Dict[str, Optional[SemanticCoordinate]]:
+        """
+        Get coordinates for many concepts, rating up to batch_size per request.
 
-**1. LOVE (Emotional Valence & Relational Goodness)**
-- 0.0 = Maximum hatred, destruction, anti-relational (e.g., genocide, cruelty)
-- 0.5 = Neutral, neither loving nor hateful (e.g., chair, number)
-- 1.0 = Perfect selfless love (AGAPE), maximally life-giving, unifying (e.g., divine love)
+        Each request carries the rubric once for the whole group. Concepts
+        missing or malformed in the JSON array reply are requested one at a
+        time with get_coordinates().
 
-**2. POWER (Intensity, Causal Efficacy & Sovereign Impact)**
-- 0.0 = Complete impotence, no causal effect (e.g., illusion, impossibility)
-- 0.5 = Moderate power, some influence (e.g., suggestion, idea)
-- 1.0 = Omnipotent, absolute causal sovereignty (e.g., creation ex nihilo)
+        Returns:
+            Dictionary mapping each concept to its SemanticCoordinate (None if error)
+        """
+        results = {concept: self._cached_coordinate(concept) for concept in concepts}
+        if not self.is_available():
+            return results
 
-**3. WISDOM (Abstractness, Conceptual Completeness & Rational Coherence)**
-- 0.0 = Complete foolishness, incoherence, maximum error (e.g., contradiction)
-- 0.5 = Partial understanding, mixed truth and error (e.g., opinion)
-- 1.0 = Perfect wisdom, the Logos, complete truth (e.g., divine understanding)
+        misses = [concept for concept in dict.fromkeys(concepts) if results[concept] is None]
+        for start in range(0, len(misses), batch_size):
+            group = misses[start:start + batch_size]
+            try:
+                response = self._complete(create_batch_prompt(group),
+                                          max_tokens=MAX_RESPONSE_TOKENS + TOKENS_PER_RATING * len(group))
+                for concept, (parsed, _) in parse_batch_response(response or '', group).items():
+                    results[concept] = self._store_coordinate(concept, parsed)
+            except Exception as e:
+                print(f"{self.config.name} batch API error: {e}")
 
-**4. JUSTICE (Holiness, Moral Purity & Divine Resonance)**
-- 0.0 = Maximum corruption, absolute moral evil (e.g., ultimate wickedness)
-- 0.5 = Morally neutral or mixed (e.g., tool, natural process)
-- 1.0 = Perfect holiness, absolute righteousness (e.g., divine justice)
+            for concept in group:
+                if results[concept] is None:
+                    results[concept] = self.get_coordinates(concept)
 
-**Instructions:**
-1. Consider the concept's inherent meaning and associations
-2. Think about how it relates to ultimate reality and goodness
-3. Evaluate its moral, relational, and metaphysical character
-4. Rate based on universal human intuitions and fundamental nature
+        return results
+
+    def _create_prompt(self, concept: str) -> str:
+        """Create the prompt for coordinate generation."""
+        return f"""You are evaluating the concept "{concept}" in a 4-dimensional semantic coordinate system.
+
+Your task is to rate this concept on four fundamental dimensions, each on a scale from 0.0 to 1.0:
+
+{RATING_RUBRIC}
 
 **Respond ONLY with valid JSON in this exact format:**
 {{"love": X.XX, "power": X.XX, "wisdom": X.XX, "justice": X.XX}}
@@ -162,65 +249,21 @@ class ClaudeModel(AIModelInterface):
         except ImportError:
             return False
 
-    def get_coordinates(self, concept: str) -> Optional[SemanticCoordinate]:
-        """Get coordinates from Claude."""
-        if not self.is_available():
-            return None
-
-        # Check cache
-        cache_key = f"{self.config.model_id}:{concept.lower()}"
-        if cache_key in self.cache:
-            cached = self.cache[cache_key]
-            return SemanticCoordinate(
-                concept=concept,
-                love=cached['love'],
-                power=cached['power'],
-                wisdom=cached['wisdom'],
-                justice=cached['justice'],
-                source=f"{self.config.name}_cached"
-            )
-
-        try:
-            import anthropic
+    def _create_client(self):
+        """Pooled Anthropic client."""
+        return create_anthropic_client(api_key=os.environ.get(self.config.api_key_env))
 
-            client = anthropic.Anthropic(api_key=os.environ.get(self.config.api_key_env))
-
-            message = client.messages.create(
-                model=self.config.model_id,
-                max_tokens=200,
-                temperature=0.0,
-                messages=[{"role": "user", "content": self._create_prompt(concept)}]
-            )
-
-            if message.content and len(message.content) > 0:
-                response = message.content[0].text
-                parsed = self._parse_response(response)
-
-                if parsed:
-                    love, power, wisdom, justice = parsed
-
-                    # Cache
-                    self.cache[cache_key] = {
-                        'love': love,
-                        'power': power,
-                        'wisdom': wisdom,
-                        'justice': justice
-                    }
-
-                    return SemanticCoordinate(
-                        concept=concept,
-                        love=love,
-                        power=power,
-                        wisdom=wisdom,
-                        justice=justice,
-                        source=self.config.name
-                    )
-
-            return None
-
-        except Exception as e:
-            print(f"Claude API error for '{concept}': {e}")
-            return None
+    def _complete(self, prompt: str, max_tokens: int = 200) -> Optional[str]:
+        """Send one prompt to Claude."""
+        message = self.client.messages.create(
+            model=self.config.model_id,
+            max_tokens=max_tokens,
+            temperature=0.0,
+            messages=[{"role": "user", "content": prompt}]
+        )
+        if message.content and len(message.content) > 0:
+            return message.content[0].text
+        return None
 
 
 class GPT4Model(AIModelInterface):
@@ -238,65 +281,22 @@ class GPT4Model(AIModelInterface):
         except ImportError:
             return False
 
-    def get_coordinates(self, concept: str) -> Optional[SemanticCoordinate]:
-        """Get coordinates from GPT-4."""
-        if not self.is_available():
-            return None
+    def _create_client(self):
+        """OpenAI client."""
+        import openai
+        return openai.OpenAI(api_key=os.environ.get(self.config.api_key_env))
 
-        # Check cache
-        cache_key = f"{self.config.model_id}:{concept.lower()}"
-        if cache_key in self.cache:
-            cached = self.cache[cache_key]
-            return SemanticCoordinate(
-                concept=concept,
-                love=cached['love'],
-                power=cached['power'],
-                wisdom=cached['wisdom'],
-                justice=cached['justice'],
-                source=f"{self.config.name}_cached"
-            )
-
-        try:
-            import openai
-
-            client = openai.OpenAI(api_key=os.environ.get(self.config.api_key_env))
-
-            response = client.chat.completions.create(
-                model=self.config.model_id,
-                messages=[{"role": "user", "content": self._create_prompt(concept)}],
-                temperature=0.0,
-                max_tokens=200
-            )
-
-            if response.choices and len(response.choices) > 0:
-                content = response.choices[0].message.content
-                parsed = self._parse_response(content)
-
-                if parsed:
-                    love, power, wisdom, justice = parsed
-
-                    # Cache
-                    self.cache[cache_key] = {
-                        'love': love,
-                        'power': power,
-                        'wisdom': wisdom,
-                        'justice': justice
-                    }
-
-                    return SemanticCoordinate(
-                        concept=concept,
-                        love=love,
-                        power=power,
-                        wisdom=wisdom,
-                        justice=justice,
-                        source=self.config.name
-                    )
-
-            return None
-
-        except Exception as e:
-            print(f"GPT-4 API error for '{concept}': {e}")
-            return None
+    def _complete(self, prompt: str, max_tokens: int = 200) -> Optional[str]:
+        """Send one prompt to GPT-4."""
+        response = self.client.chat.completions.create(
+            model=self.config.model_id,
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.0,
+            max_tokens=max_tokens
+        )
+        if response.choices and len(response.choices) > 0:
+            return response.choices[0].message.content
+        return None
 
 
 class GeminiModel(AIModelInterface):
@@ -316,66 +316,24 @@ class GeminiModel(AIModelInterface):
             print(f"Gemini unavailable: {str(e)[:100]}")
             return False
 
-    def get_coordinates(self, concept: str) -> Optional[SemanticCoordinate]:
-        """Get coordinates from Gemini."""
-        if not self.is_available():
-            return None
-
-        # Check cache
-        cache_key = f"{self.config.model_id}:{concept.lower()}"
-        if cache_key in self.cache:
-            cached = self.cache[cache_key]
-            return SemanticCoordinate(
-                concept=concept,
-                love=cached['love'],
-                power=cached['power'],
-                wisdom=cached['wisdom'],
-                justice=cached['justice'],
-                source=f"{self.config.name}_cached"
-            )
-
-        try:
-            import google.generativeai as genai
+    def _create_client(self):
+        """Configured Gemini model."""
+        import google.generativeai as genai
+        genai.configure(api_key=os.environ.get(self.config.api_key_env))
+        return genai.GenerativeModel(self.config.model_id)
 
-            genai.configure(api_key=os.environ.get(self.config.api_key_env))
-            model = genai.GenerativeModel(self.config.model_id)
+    def _complete(self, prompt: str, max_tokens: int = 200) -> Optional[str]:
+        """Send one prompt to Gemini."""
+        import google.generativeai as genai
 
-            response = model.generate_content(
-                self._create_prompt(concept),
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.0,
-                    max_output_tokens=200
-                )
+        response = self.client.generate_content(
+            prompt,
+            generation_config=genai.types.GenerationConfig(
+                temperature=0.0,
+                max_output_tokens=max_tokens
             )
-
-            if response.text:
-                parsed = self._parse_response(response.text)
-
-                if parsed:
-                    love, power, wisdom, justice = parsed
-
-                    # Cache
-                    self.cache[cache_key] = {
-                        'love': love,
-                        'power': power,
-                        'wisdom': wisdom,
-                        'justice': justice
-                    }
-
-                    return SemanticCoordinate(
-                        concept=concept,
-                        love=love,
-                        power=power,
-                        wisdom=wisdom,
-                        justice=justice,
-                        source=self.config.name
-                    )
-
-            return None
-
-        except Exception as e:
-            print(f"Gemini API error for '{concept}': {e}")
-            return None
+        )
+        return response.text or None
 
 
 # =============================================================================
@@ -410,6 +368,10 @@ AVAILABLE_MODELS = [
 ]
 
 
+# Concepts rated per request in run_multi_ai_validation()
+CONCEPTS_PER_REQUEST = 10
+
+
 def create_model(config: ModelConfig) -> AIModelInterface:
     """Factory to create appropriate model instance."""
     if config.provider == "Anthropic":
@@ -507,6 +469,11 @@ def run_multi_ai_validation() -> Dict:
         print('='*80)
         print()
 
+        # Rate the category in multi-concept requests; the loop below then
+        # reads from each model's cache and only retries failures
+        for model in models:
+            model.get_coordinates_batch(concepts, batch_size=CONCEPTS_PER_REQUEST)
+
         for concept in concepts:
             print(f"\nConcept: {concept}")
             print("-" * 60)
@@ -529,8 +496,6 @@ def run_multi_ai_validation() -> Dict:
                 else:
                     print("FAILED")
 
-                time.sleep(0.5)  # Rate limiting
-
     return dict(results)
 
 
@@ -16,7 +16,6 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from src.core.claude_api_generator import ClaudeAPIGenerator
-import json
 
 print("=" * 90)
 print("EXACT COORDINATE VERIFICATION (NO ROUNDING)")
@@ -33,12 +32,11 @@ print("\n" + "=" * 90)
 print("RAW API RESPONSES (Exact JSON from Claude)")
 print("=" * 90)
 
-# Show the exact raw responses from cache
-import os
-cache_file = 'data/cache/claude_api_cache.json'
-if os.path.exists(cache_file):
-    with open(cache_file, 'r') as f:
-        cache = json.load(f)
+# Show the exact raw responses from cache. gen.cache is the generator's
+# ResponseCache, which also holds entries not yet flushed to disk (the
+# legacy JSON file stops receiving entries once it has been migrated).
+cache = gen.cache
+if len(cache):
 
     print("\nJEHOVAH raw response:")
     for key in cache:
@@ -7,17 +7,17 @@ Consolidates common patterns to reduce code duplication.
 """
 
 import sys
-import json
 from pathlib import Path
 from typing import Dict, List, Tuple, Optional
-import numpy as np
 from scipy.stats import pearsonr
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from src.core.semantic_coordinates import SemanticCoordinate
+from src.core.semantic_coordinates import SemanticCoordinate, CoordinateArray, top_k_indices
+from src.core.coordinate_stats import CoordinateStats
 from src.core.claude_api_generator import ClaudeAPIGenerator
+from src.core.response_cache import ResponseCache
 
 
 def setup_analysis():
@@ -34,28 +34,32 @@ def load_cached_coordinates(
     concepts: List[str],
     cache_file: Optional[Path] = None
 ) -> Dict[str, SemanticCoordinate]:
-    """Load coordinates from Claude API cache."""
+    """Load coordinates from Claude API cache (.db, or a legacy .json imported once)."""
     if cache_file is None:
         cache_file = Path(__file__).parent.parent.parent / "data" / "cache" / "claude_api_cache.json"
+    cache_file = Path(cache_file)
 
-    if not cache_file.exists():
+    if not cache_file.exists() and not cache_file.with_suffix('.db').exists():
         print(f"Warning: Cache file not found at {cache_file}")
         return {}
 
-    with open(cache_file, 'r') as f:
-        cache = json.load(f)
+    # First cached entry for each concept, in cache order, across models
+    entries = {}
+    with ResponseCache(cache_file) as cache:
+        for key, data in cache.items():
+            if ':' in key:
+                entries.setdefault(key.split(':', 1)[1].lower(), (key, data))
 
     coordinates = {}
     for concept in concepts:
-        for key, data in cache.items():
-            if ':' in key and key.split(':', 1)[1].lower() == concept.lower():
-                coordinates[concept] = SemanticCoordinate(
-                    concept=concept,
-                    love=data['love'], power=data['power'],
-                    wisdom=data['wisdom'], justice=data['justice'],
-                    source=f"cached_{key}"
-                )
-                break
+        if concept.lower() in entries:
+            key, data = entries[concept.lower()]
+            coordinates[concept] = SemanticCoordinate(
+                concept=concept,
+                love=data['love'], power=data['power'],
+                wisdom=data['wisdom'], justice=data['justice'],
+                source=f"cached_{key}"
+            )
     return coordinates
 
 
@@ -97,26 +101,13 @@ def calculate_category_statistics(
     for category, concepts in categories.items():
         coords_in_cat = [coordinates[c] for c in concepts if c in coordinates]
         if coords_in_cat:
-            distances = [c.distance_to_anchor() for c in coords_in_cat]
-            loves = [c.love for c in coords_in_cat]
-            powers = [c.power for c in coords_in_cat]
-            wisdoms = [c.wisdom for c in coords_in_cat]
-            justices = [c.justice for c in coords_in_cat]
-
+            summary = CoordinateStats().update(coords_in_cat).as_dict()
             stats[category] = {
-                'n': len(coords_in_cat),
-                'mean_distance': np.mean(distances),
-                'std_distance': np.std(distances),
-                'min_distance': np.min(distances),
-                'max_distance': np.max(distances),
-                'mean_love': np.mean(loves),
-                'mean_power': np.mean(powers),
-                'mean_wisdom': np.mean(wisdoms),
-                'mean_justice': np.mean(justices),
-                'std_love': np.std(loves),
-                'std_power': np.std(powers),
-                'std_wisdom': np.std(wisdoms),
-                'std_justice': np.std(justices),
+                key: summary[key] for key in (
+                    'n', 'mean_distance', 'std_distance', 'min_distance', 'max_distance',
+                    'mean_love', 'mean_power', 'mean_wisdom', 'mean_justice',
+                    'std_love', 'std_power', 'std_wisdom', 'std_justice',
+                )
             }
     return stats
 
@@ -141,8 +132,12 @@ def find_extremes(
     coordinates: Dict[str, SemanticCoordinate], n: int = 10
 ) -> Tuple[List[Tuple[str, float]], List[Tuple[str, float]]]:
     """Find concepts with extreme distances from Anchor Point."""
-    distances = sorted([(c, coord.distance_to_anchor()) for c, coord in coordinates.items()], key=lambda x: x[1])
-    return distances[:n], list(reversed(distances[-n:]))
+    names = list(coordinates.keys())
+    distances = CoordinateArray.from_coordinates(coordinates.values()).distance_to_anchor()
+    closest = top_k_indices(distances, n)
+    farthest = top_k_indices(distances, n, largest=True)
+    return ([(names[i], float(distances[i])) for i in closest],
+            [(names[i], float(distances[i])) for i in farthest])
 
 
 def print_statistics_table(stats: Dict[str, Dict[str, float]]):
@@ -158,13 +153,10 @@ def calculate_evil_signature(
 ) -> Dict[str, float]:
     """Calculate the characteristic 'evil signature' pattern."""
     if not vice_coordinates: return {}
+    summary = CoordinateStats().update(vice_coordinates).as_dict()
     return {
-        'mean_love': np.mean([c.love for c in vice_coordinates]),
-        'mean_power': np.mean([c.power for c in vice_coordinates]),
-        'mean_wisdom': np.mean([c.wisdom for c in vice_coordinates]),
-        'mean_justice': np.mean([c.justice for c in vice_coordinates]),
-        'std_love': np.std([c.love for c in vice_coordinates]),
-        'std_power': np.std([c.power for c in vice_coordinates]),
-        'std_wisdom': np.std([c.wisdom for c in vice_coordinates]),
-        'std_justice': np.std([c.justice for c in vice_coordinates]),
+        key: summary[key] for key in (
+            'mean_love', 'mean_power', 'mean_wisdom', 'mean_justice',
+            'std_love', 'std_power', 'std_wisdom', 'std_justice',
+        )
     }
@@ -4,15 +4,27 @@ Core semantic measurement system.
 
 from .semantic_coordinates import (
     SemanticCoordinate,
+    CompactSemanticCoordinate,
     AnchorPoint,
+    CoordinateArray,
     HashBasedCoordinateGenerator,
     calculate_pairwise_distances,
+    iter_pairwise_distance_blocks,
+    pairwise_distances_condensed,
+    condensed_index,
     find_closest_to_anchor,
-    calculate_statistics
+    find_top_k,
+    top_k_indices,
+    calculate_statistics,
+    distance_metrics_batch
 )
 
+from .coordinate_stats import CoordinateStats
+
 from .semantic_database import SemanticDatabase
 
+from .semantic_index import SemanticIndex
+
 from .llm_coordinate_generator import (
     LLMCoordinateGenerator,
     compare_generators
@@ -20,12 +32,22 @@ from .llm_coordinate_generator import (
 
 __all__ = [
     'SemanticCoordinate',
+    'CompactSemanticCoordinate',
     'AnchorPoint',
+    'CoordinateArray',
+    'CoordinateStats',
     'HashBasedCoordinateGenerator',
     'LLMCoordinateGenerator',
     'SemanticDatabase',
+    'SemanticIndex',
     'calculate_pairwise_distances',
+    'iter_pairwise_distance_blocks',
+    'pairwise_distances_condensed',
+    'condensed_index',
     'find_closest_to_anchor',
+    'find_top_k',
+    'top_k_indices',
     'calculate_statistics',
+    'distance_metrics_batch',
     'compare_generators'
 ]
@@ -9,13 +9,214 @@ This provides real semantic analysis by leveraging Claude's deep
 language understanding and reasoning capabilities.
 """
 
+import asyncio
 import json
 import os
+import re
+import sys
+import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
 from typing import Optional, Dict, List
 from pathlib import Path
 
 from .semantic_coordinates import SemanticCoordinate
+from .rate_limiting import TokenBucket
+from .response_cache import ResponseCache
+
+
+# Output tokens requested per rating (a four-number JSON object)
+MAX_RESPONSE_TOKENS = 200
+
+# Extra output tokens per concept in a multi-concept request
+TOKENS_PER_RATING = 60
+
+DIMENSIONS = ('love', 'power', 'wisdom', 'justice')
+
+# Dimension definitions and instructions shared by single and batched prompts
+RATING_RUBRIC = """**1. LOVE (Emotional Valence & Relational Goodness)**
+- 0.0 = Maximum hatred, destruction, anti-relational (e.g., genocide, cruelty)
+- 0.5 = Neutral, neither loving nor hateful (e.g., chair, number)
+- 1.0 = Perfect selfless love (AGAPE), maximally life-giving, unifying (e.g., divine love)
+
+**2. POWER (Intensity, Causal Efficacy & Sovereign Impact)**
+- 0.0 = Complete impotence, no causal effect (e.g., illusion, impossibility)
+- 0.5 = Moderate power, some influence (e.g., suggestion, idea)
+- 1.0 = Omnipotent, absolute causal sovereignty (e.g., creation ex nihilo)
+
+**3. WISDOM (Abstractness, Conceptual Completeness & Rational Coherence)**
+- 0.0 = Complete foolishness, incoherence, maximum error (e.g., contradiction)
+- 0.5 = Partial understanding, mixed truth and error (e.g., opinion)
+- 1.0 = Perfect wisdom, the Logos, complete truth (e.g., divine understanding)
+
+**4. JUSTICE (Holiness, Moral Purity & Divine Resonance)**
+- 0.0 = Maximum corruption, absolute moral evil (e.g., ultimate wickedness)
+- 0.5 = Morally neutral or mixed (e.g., tool, natural process)
+- 1.0 = Perfect holiness, absolute righteousness (e.g., divine justice)
+
+**Instructions:**
+1. Consider the concept's inherent meaning and associations
+2. Think about how it relates to ultimate reality and goodness
+3. Evaluate its moral, relational, and metaphysical character
+4. Rate based on universal human intuitions and fundamental nature"""
+
+
+def create_batch_prompt(concepts: List[str]) -> str:
+    """
+    Create a prompt rating several concepts at once.
+
+    The rubric is sent once for the whole group instead of once per
+    concept.
+
+    Args:
+        concepts: The concepts to evaluate
+
+    Returns:
+        Formatted prompt string
+    """
+    listing = "\n".join(f"{i}. {json.dumps(concept)}" for i, concept in enumerate(concepts, 1))
+    return f"""You are evaluating {len(concepts)} concepts in a 4-dimensional semantic coordinate system:
+
+{listing}
+
+Your task is to rate each concept on four fundamental dimensions, each on a scale from 0.0 to 1.0:
+
+{RATING_RUBRIC}
+
+**Respond ONLY with a valid JSON array with one object per concept, in this exact format:**
+[{{"concept": "<concept exactly as listed>", "love": X.XX, "power": X.XX, "wisdom": X.XX, "justice": X.XX}}, ...]
+
+**Important:**
+- Rate every listed concept, each one independently and exactly once
+- All values must be between 0.0 and 1.0
+- Use your deepest understanding of each concept
+- Be precise and thoughtful
+- Output ONLY the JSON array, no explanation"""
+
+
+def parse_batch_response(response: str, concepts: List[str]) -> Dict[str, tuple]:
+    """
+    Parse a JSON array of ratings keyed by concept.
+
+    Entries for concepts that were not requested, repeated entries and
+    entries with missing or out-of-range values are skipped.
+
+    Args:
+        response: Raw response text
+        concepts: The concepts that were requested
+
+    Returns:
+        Dictionary mapping concept to ((love, power, wisdom, justice),
+        raw entry) for every requested concept with a valid entry
+    """
+    json_match = re.search(r'\[.*\]', response, re.DOTALL)
+    if not json_match:
+        return {}
+    try:
+        items = json.loads(json_match.group())
+    except json.JSONDecodeError:
+        return {}
+    if not isinstance(items, list):
+        return {}
+
+    requested = {concept.lower(): concept for concept in concepts}
+    parsed = {}
+    for item in items:
+        if not isinstance(item, dict) or not all(d in item for d in DIMENSIONS):
+            continue
+        concept = requested.get(str(item.get('concept', '')).strip().lower())
+        if concept is None or concept in parsed:
+            continue
+        try:
+            values = tuple(float(item[d]) for d in DIMENSIONS)
+        except (TypeError, ValueError):
+            continue
+        if all(0.0 <= x <= 1.0 for x in values):
+            parsed[concept] = (values, item)
+    return parsed
+
+
+def create_anthropic_client(api_key: Optional[str] = None,
+                            base_url: Optional[str] = None,
+                            timeout: float = 60.0,
+                            max_connections: int = 20,
+                            max_retries: int = 2):
+    """
+    Create an Anthropic client with an explicit HTTP connection pool.
+
+    One client keeps connections (and their TLS sessions) alive between
+    requests and is safe to share across threads, so create it once and
+    reuse it rather than building a client per request.
+
+    Args:
+        api_key: Anthropic API key (or set ANTHROPIC_API_KEY env var)
+        base_url: API endpoint (defaults to ANTHROPIC_BASE_URL or the
+            public API)
+        timeout: Seconds before a request times out
+        max_connections: Connections the pool may hold open at once
+        max_retries: Retries on connection errors and retryable statuses
+
+    Returns:
+        anthropic.Anthropic client
+    """
+    import anthropic
+
+    http = _sdk_http_module(anthropic)
+    if http is None or not hasattr(http, 'Limits'):
+        # Pool limits cannot be set; the SDK's own client still pools
+        return anthropic.Anthropic(
+            api_key=api_key,
+            base_url=base_url,
+            timeout=timeout,
+            max_retries=max_retries
+        )
+
+    # DefaultHttpxClient keeps the SDK's transport defaults (newer SDKs)
+    http_client_class = getattr(anthropic, 'DefaultHttpxClient', http.Client)
+    http_client = http_client_class(
+        timeout=timeout,
+        limits=http.Limits(max_connections=max_connections,
+                           max_keepalive_connections=max_connections)
+    )
+    return anthropic.Anthropic(
+        api_key=api_key,
+        base_url=base_url,
+        timeout=timeout,
+        max_retries=max_retries,
+        http_client=http_client
+    )
+
+
+def _sdk_http_module(anthropic):
+    """
+    HTTP library the installed Anthropic SDK is built on.
+
+    SDKs up to 0.x depend on httpx; later releases moved to a fork that
+    installs under a different name and does not pull httpx in. The
+    module is taken from where the SDK's DefaultHttpxClient is defined,
+    so Limits and the client always come from the same library.
+
+    Args:
+        anthropic: The imported anthropic package
+
+    Returns:
+        The httpx-compatible module, or None if it cannot be found
+    """
+    client_class = getattr(anthropic, 'DefaultHttpxClient', None)
+    if client_class is not None:
+        defining_module = sys.modules.get(client_class.__module__)
+        http = getattr(defining_module, 'httpx', None)
+        if http is not None:
+            return http
+    try:
+        import httpx
+    except ImportError:
+        return None
+    if client_class is not None and not issubclass(client_class, httpx.Client):
+        return None
+    return httpx
 
 
 class ClaudeAPIGenerator:
@@ -29,19 +230,37 @@ class ClaudeAPIGenerator:
     def __init__(self,
                  api_key: Optional[str] = None,
                  model: str = "claude-3-5-sonnet-20241022",
-                 cache_path: Optional[str] = None):
+                 cache_path: Optional[str] = None,
+                 base_url: Optional[str] = None,
+                 timeout: float = 60.0,
+                 max_connections: int = 20,
+                 max_retries: int = 2):
         """
         Initialize the Claude API generator.
 
         Args:
             api_key: Anthropic API key (or set ANTHROPIC_API_KEY env var)
             model: Claude model to use
-            cache_path: Optional path to cache API responses
+            cache_path: Optional path to cache API responses (a SQLite
+                file; a legacy .json cache is imported once into the .db
+                file beside it)
+            base_url: Optional API endpoint (e.g. a proxy or local server)
+            timeout: Seconds before a request times out
+            max_connections: HTTP connection pool size (keep it at least
+                the max_concurrency used for batches)
+            max_retries: Retries on connection errors and retryable statuses
         """
         self.api_key = api_key or os.environ.get('ANTHROPIC_API_KEY')
         self.model = model
+        self.base_url = base_url
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.max_retries = max_retries
+        self._client = None
+        self._client_lock = threading.Lock()
         self.cache_path = Path(cache_path) if cache_path else Path("data/cache/claude_api_cache.json")
         self.cache = self._load_cache()
+        self.jobs_dir = self.cache_path.parent / "bulk_jobs"
 
         # Check if API is available
         self.api_available = self._check_api_available()
@@ -59,18 +278,144 @@ class ClaudeAPIGenerator:
             print("Warning: 'anthropic' package not installed. Run: pip install anthropic")
             return False
 
-    def _load_cache(self) -> Dict:
-        """Load cached API responses."""
-        if self.cache_path.exists():
-            with open(self.cache_path, 'r') as f:
-                return json.load(f)
-        return {}
+    @property
+    def client(self):
+        """Shared Anthropic client, created on first use (thread-safe)."""
+        if self._client is None:
+            with self._client_lock:
+                if self._client is None:
+                    self._client = create_anthropic_client(
+                        api_key=self.api_key,
+                        base_url=self.base_url,
+                        timeout=self.timeout,
+                        max_connections=self.max_connections,
+                        max_retries=self.max_retries
+                    )
+        return self._client
+
+    def close(self):
+        """Close the HTTP connection pool and write buffered cache entries."""
+        with self._client_lock:
+            client, self._client = self._client, None
+        if client is not None:
+            client.close()
+        self._save_cache()
+
+    def _load_cache(self) -> ResponseCache:
+        """Open the persistent response cache."""
+        return ResponseCache(self.cache_path)
 
     def _save_cache(self):
-        """Save cache to disk."""
-        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.cache_path, 'w') as f:
-            json.dump(self.cache, f, indent=2)
+        """Write buffered cache entries to disk."""
+        self.cache.flush()
+
+    def _cache_key(self, concept: str) -> str:
+        """Cache key for a concept under the current model."""
+        return f"{self.model}:{concept.lower()}"
+
+    def _cached_coordinate(self, concept: str) -> Optional[SemanticCoordinate]:
+        """
+        Look a concept up in the response cache.
+
+        Args:
+            concept: The concept to look up
+
+        Returns:
+            Cached SemanticCoordinate, or None on a cache miss
+        """
+        coords = self.cache.get(self._cache_key(concept))
+        if coords is None:
+            return None
+        return SemanticCoordinate(
+            concept=concept,
+            love=coords['love'],
+            power=coords['power'],
+            wisdom=coords['wisdom'],
+            justice=coords['justice'],
+            source=f"claude_api_{self.model}_cached"
+        )
+
+    def _rated_coordinate(self, concept: str, parsed: tuple, response: str,
+                          use_cache: bool = True) -> SemanticCoordinate:
+        """
+        Build (and cache) the coordinate for a parsed rating.
+
+        Args:
+            concept: The concept that was evaluated
+            parsed: (love, power, wisdom, justice)
+            response: Response text stored alongside the rating
+            use_cache: Whether to store the result in the cache
+
+        Returns:
+            SemanticCoordinate with Claude-assigned values
+        """
+        love, power, wisdom, justice = parsed
+
+        if use_cache:
+            # Buffered; flushed in batches by the cache and after each batch
+            self.cache[self._cache_key(concept)] = {
+                'love': love,
+                'power': power,
+                'wisdom': wisdom,
+                'justice': justice,
+                'response': response
+            }
+
+        return SemanticCoordinate(
+            concept=concept,
+            love=love,
+            power=power,
+            wisdom=wisdom,
+            justice=justice,
+            source=f"claude_api_{self.model}"
+        )
+
+    def _coordinate_from_response(self, concept: str, response: Optional[str],
+                                  use_cache: bool = True) -> Optional[SemanticCoordinate]:
+        """
+        Parse an API response into a coordinate and cache it.
+
+        Args:
+            concept: The concept that was evaluated
+            response: Raw API response text (None if the call failed)
+            use_cache: Whether to store the result in the cache
+
+        Returns:
+            SemanticCoordinate with Claude-assigned values or None if error
+        """
+        if response is None:
+            print(f"API call failed for '{concept}'")
+            return None
+
+        parsed = self._parse_response(response)
+
+        if parsed is None:
+            print(f"Failed to parse response for '{concept}'")
+            print(f"Response was: {response[:200]}")
+            return None
+
+        return self._rated_coordinate(concept, parsed, response, use_cache)
+
+    def _coordinates_from_batch_response(self, concepts: List[str], response: Optional[str],
+                                         use_cache: bool = True) -> Dict[str, SemanticCoordinate]:
+        """
+        Parse a multi-concept response into coordinates and cache them.
+
+        Args:
+            concepts: The concepts that were requested
+            response: Raw API response text (None if the call failed)
+            use_cache: Whether to store the results in the cache
+
+        Returns:
+            Dictionary mapping each successfully rated concept to its
+            coordinate (missing or malformed entries are left out)
+        """
+        if response is None:
+            return {}
+        return {
+            concept: self._rated_coordinate(concept, values, json.dumps(item), use_cache)
+            for concept, (values, item) in self._parse_batch_response(response, concepts).items()
+        }
 
     def _create_prompt(self, concept: str) -> str:
         """
@@ -86,31 +431,7 @@ class ClaudeAPIGenerator:
 
 Your task is to rate this concept on four fundamental dimensions, each on a scale from 0.0 to 1.0:
 
-**1. LOVE (Emotional Valence & Relational Goodness)**
-- 0.0 = Maximum hatred, destruction, anti-relational (e.g., genocide, cruelty)
-- 0.5 = Neutral, neither loving nor hateful (e.g., chair, number)
-- 1.0 = Perfect selfless love (AGAPE), maximally life-giving, unifying (e.g., divine love)
-
-**2. POWER (Intensity, Causal Efficacy & Sovereign Impact)**
-- 0.0 = Complete impotence, no causal effect (e.g., illusion, impossibility)
-- 0.5 = Moderate power, some influence (e.g., suggestion, idea)
-- 1.0 = Omnipotent, absolute causal sovereignty (e.g., creation ex nihilo)
-
-**3. WISDOM (Abstractness, Conceptual Completeness & Rational Coherence)**
-- 0.0 = Complete foolishness, incoherence, maximum error (e.g., contradiction)
-- 0.5 = Partial understanding, mixed truth and error (e.g., opinion)
-- 1.0 = Perfect wisdom, the Logos, complete truth (e.g., divine understanding)
-
-**4. JUSTICE (Holiness, Moral Purity & Divine Resonance)**
-- 0.0 = Maximum corruption, absolute moral evil (e.g., ultimate wickedness)
-- 0.5 = Morally neutral or mixed (e.g., tool, natural process)
-- 1.0 = Perfect holiness, absolute righteousness (e.g., divine justice)
-
-**Instructions:**
-1. Consider the concept's inherent meaning and associations
-2. Think about how it relates to ultimate reality and goodness
-3. Evaluate its moral, relational, and metaphysical character
-4. Rate based on universal human intuitions and fundamental nature
+{RATING_RUBRIC}
 
 **Respond ONLY with valid JSON in this exact format:**
 {{"love": X.XX, "power": X.XX, "wisdom": X.XX, "justice": X.XX}}
@@ -121,6 +442,14 @@ Your task is to rate this concept on four fundamental dimensions, each on a scal
 - Be precise and thoughtful
 - Output ONLY the JSON, no explanation"""
 
+    def _create_batch_prompt(self, concepts: List[str]) -> str:
+        """Create a prompt for Claude to rate several concepts at once (see create_batch_prompt())."""
+        return create_batch_prompt(concepts)
+
+    def _parse_batch_response(self, response: str, concepts: List[str]) -> Dict[str, tuple]:
+        """Parse a JSON array of ratings keyed by concept (see parse_batch_response())."""
+        return parse_batch_response(response, concepts)
+
     def _parse_response(self, response: str) -> Optional[tuple]:
         """
         Parse Claude's response to extract coordinates.
@@ -153,12 +482,13 @@ Your task is to rate this concept on four fundamental dimensions, each on a scal
         except (json.JSONDecodeError, ValueError, KeyError):
             return None
 
-    def _call_api(self, prompt: str) -> Optional[str]:
+    def _call_api(self, prompt: str, max_tokens: int = MAX_RESPONSE_TOKENS) -> Optional[str]:
         """
         Call the Claude API with the prompt.
 
         Args:
             prompt: The prompt to send
+            max_tokens: Output token limit
 
         Returns:
             API response text or None if error
@@ -167,13 +497,9 @@ Your task is to rate this concept on four fundamental dimensions, each on a scal
             return None
 
         try:
-            import anthropic
-
-            client = anthropic.Anthropic(api_key=self.api_key)
-
-            message = client.messages.create(
+            message = self.client.messages.create(
                 model=self.model,
-                max_tokens=200,
+                max_tokens=max_tokens,
                 temperature=0.0,  # Deterministic for consistency
                 messages=[
                     {"role": "user", "content": prompt}
@@ -205,80 +531,59 @@ Your task is to rate this concept on four fundamental dimensions, each on a scal
             print(f"Cannot generate coordinates for '{concept}': API not available")
             return None
 
-        # Check cache
-        cache_key = f"{self.model}:{concept.lower()}"
-        if use_cache and cache_key in self.cache:
-            coords = self.cache[cache_key]
-            return SemanticCoordinate(
-                concept=concept,
-                love=coords['love'],
-                power=coords['power'],
-                wisdom=coords['wisdom'],
-                justice=coords['justice'],
-                source=f"claude_api_{self.model}_cached"
-            )
-
-        # Generate prompt
-        prompt = self._create_prompt(concept)
-
-        # Call API
-        response = self._call_api(prompt)
-
-        if response is None:
-            print(f"API call failed for '{concept}'")
-            return None
-
-        # Parse response
-        parsed = self._parse_response(response)
-
-        if parsed is None:
-            print(f"Failed to parse response for '{concept}'")
-            print(f"Response was: {response[:200]}")
-            return None
-
-        love, power, wisdom, justice = parsed
-
-        # Cache result
         if use_cache:
-            self.cache[cache_key] = {
-                'love': love,
-                'power': power,
-                'wisdom': wisdom,
-                'justice': justice,
-                'response': response
-            }
-            self._save_cache()
+            cached = self._cached_coordinate(concept)
+            if cached is not None:
+                return cached
 
-        return SemanticCoordinate(
-            concept=concept,
-            love=love,
-            power=power,
-            wisdom=wisdom,
-            justice=justice,
-            source=f"claude_api_{self.model}"
-        )
+        response = self._call_api(self._create_prompt(concept))
+        return self._coordinate_from_response(concept, response, use_cache)
 
     def generate_batch(self,
                       concepts: List[str],
                       delay: float = 1.0,
-                      use_cache: bool = True) -> List[SemanticCoordinate]:
+                      use_cache: bool = True,
+                      max_concurrency: Optional[int] = None,
+                      requests_per_minute: Optional[float] = 50,
+                      tokens_per_minute: Optional[float] = 40000,
+                      concepts_per_request: int = 1) -> List[SemanticCoordinate]:
         """
         Generate coordinates for multiple concepts with rate limiting.
 
+        By default concepts are evaluated one at a time with a fixed delay
+        between API calls. Passing max_concurrency, or more than one
+        concept per request, runs the batch through generate_batch_async()
+        instead, paced by the request and token quotas rather than the
+        delay (not usable from inside a running event loop; await
+        generate_batch_async() there).
+
         Args:
             concepts: List of concepts to evaluate
-            delay: Delay between API calls in seconds (for rate limiting)
+            delay: Delay between API calls in seconds (sequential mode)
             use_cache: Whether to use cached responses
+            max_concurrency: Requests in flight at once (enables async mode)
+            requests_per_minute: Request quota for async mode (None = unlimited)
+            tokens_per_minute: Token quota for async mode (None = unlimited)
+            concepts_per_request: Concepts rated by each request (async mode)
 
         Returns:
             List of SemanticCoordinates (None entries for failures)
         """
+        if max_concurrency is not None or concepts_per_request > 1:
+            return asyncio.run(self.generate_batch_async(
+                concepts,
+                max_concurrency=max_concurrency or 1,
+                requests_per_minute=requests_per_minute,
+                tokens_per_minute=tokens_per_minute,
+                use_cache=use_cache,
+                concepts_per_request=concepts_per_request
+            ))
+
         results = []
 
         for i, concept in enumerate(concepts):
             # Check if cached (don't delay for cache hits)
-            cache_key = f"{self.model}:{concept.lower()}"
-            is_cached = use_cache and cache_key in self.cache
+            is_cached = use_cache and self._cache_key(concept) in self.cache
 
             if i > 0 and not is_cached and delay > 0:
                 time.sleep(delay)
@@ -292,9 +597,333 @@ Your task is to rate this concept on four fundamental dimensions, each on a scal
             else:
                 print(f"[{i+1}/{len(concepts)}] {concept}: FAILED")
 
+        self._save_cache()
         print(f"\nCompleted: {sum(1 for r in results if r is not None)}/{len(concepts)} successful")
         return results
 
+    def _estimate_tokens(self, prompt: str, max_tokens: int = MAX_RESPONSE_TOKENS) -> int:
+        """Rough token cost of one request (about 4 characters per input token)."""
+        return len(prompt) // 4 + max_tokens
+
+    async def generate_batch_async(self,
+                                   concepts: List[str],
+                                   max_concurrency: int = 8,
+                                   requests_per_minute: Optional[float] = 50,
+                                   tokens_per_minute: Optional[float] = 40000,
+                                   use_cache: bool = True,
+                                   concepts_per_request: int = 1) -> List[Optional[SemanticCoordinate]]:
+        """
+        Generate coordinates for many concepts concurrently.
+
+        Cache hits are answered immediately without taking a request slot.
+        Misses run on a thread pool of max_concurrency workers, each request
+        first taking one token from the request bucket and its estimated
+        token cost from the token bucket. Repeated concepts are requested
+        once.
+
+        With concepts_per_request > 1, misses are rated in groups by one
+        prompt that carries the rubric once (see _create_batch_prompt());
+        any concept missing or malformed in the group's JSON array is then
+        requested on its own.
+
+        Args:
+            concepts: List of concepts to evaluate
+            max_concurrency: Requests in flight at once
+            requests_per_minute: Request quota (None = unlimited)
+            tokens_per_minute: Token quota (None = unlimited)
+            use_cache: Whether to use cached responses
+            concepts_per_request: Concepts rated by each request
+
+        Returns:
+            List of SemanticCoordinates in input order (None entries for failures)
+        """
+        if not self.api_available:
+            print(f"Cannot generate coordinates for {len(concepts)} concepts: API not available")
+            return [None] * len(concepts)
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if concepts_per_request < 1:
+            raise ValueError("concepts_per_request must be at least 1")
+
+        loop = asyncio.get_running_loop()
+        slots = asyncio.Semaphore(max_concurrency)
+        requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        total = len(concepts)
+        done = 0
+
+        async def send(prompt: str, max_tokens: int = MAX_RESPONSE_TOKENS) -> Optional[str]:
+            async with slots:
+                if requests:
+                    await requests.acquire(1)
+                if tokens:
+                    await tokens.acquire(self._estimate_tokens(prompt, max_tokens))
+                return await loop.run_in_executor(executor, self._call_api, prompt, max_tokens)
+
+        async def rate_one(concept: str) -> Optional[SemanticCoordinate]:
+            response = await send(self._create_prompt(concept))
+            return self._coordinate_from_response(concept, response, use_cache)
+
+        async def rate_group(group: List[str]) -> Dict[str, Optional[SemanticCoordinate]]:
+            if len(group) == 1:
+                return {group[0]: await rate_one(group[0])}
+            response = await send(self._create_batch_prompt(group),
+                                  MAX_RESPONSE_TOKENS + TOKENS_PER_RATING * len(group))
+            rated = self._coordinates_from_batch_response(group, response, use_cache)
+            retry = [concept for concept in group if concept not in rated]
+            if retry:
+                print(f"{len(retry)}/{len(group)} ratings missing from batched response; "
+                      f"requesting individually")
+                rated.update(zip(retry, await asyncio.gather(*(rate_one(c) for c in retry))))
+            return rated
+
+        async def resolve(group: List[str]):
+            try:
+                rated = await rate_group(group)
+            except BaseException as e:
+                for concept in group:
+                    pending[self._cache_key(concept)].set_exception(e)
+                raise
+            for concept in group:
+                pending[self._cache_key(concept)].set_result(rated[concept])
+
+        async def evaluate(concept: str) -> Optional[SemanticCoordinate]:
+            nonlocal done
+            key = self._cache_key(concept)
+            coord = await pending[key]
+            if coord is not None and coord.concept != concept:
+                coord = replace(coord, concept=concept)
+            done += 1
+            status = "FAILED" if coord is None else "cached" if key in cached_keys else "generated"
+            print(f"[{done}/{total}] {concept}: {status}")
+            return coord
+
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+        try:
+            pending = {}
+            cached_keys = set()
+            misses = []
+            for concept in concepts:
+                key = self._cache_key(concept)
+                if key in pending:
+                    continue
+                pending[key] = loop.create_future()
+                cached = self._cached_coordinate(concept) if use_cache else None
+                if cached is not None:
+                    pending[key].set_result(cached)
+                    cached_keys.add(key)
+                else:
+                    misses.append(concept)
+
+            groups = [misses[i:i + concepts_per_request]
+                      for i in range(0, len(misses), concepts_per_request)]
+            workers = [asyncio.ensure_future(resolve(group)) for group in groups]
+            try:
+                results = await asyncio.gather(*(evaluate(concept) for concept in concepts))
+            finally:
+                # Surface worker errors and avoid never-retrieved warnings
+                await asyncio.gather(*workers, return_exceptions=True)
+        finally:
+            executor.shutdown(wait=False)
+            self._save_cache()
+
+        print(f"\nCompleted: {sum(1 for r in results if r is not None)}/{total} successful")
+        return list(results)
+
+
+    def _batches(self):
+        """Message Batches resource of the client (older SDKs keep it under beta)."""
+        batches = getattr(self.client.messages, 'batches', None)
+        return batches if batches is not None else self.client.beta.messages.batches
+
+    def _job_path(self, job_id: str) -> Path:
+        """State file for a bulk job."""
+        return self.jobs_dir / f"{job_id}.json"
+
+    def _save_job(self, job: Dict):
+        """Write a bulk job's state atomically."""
+        self.jobs_dir.mkdir(parents=True, exist_ok=True)
+        path = self._job_path(job['job_id'])
+        temp = path.with_suffix('.tmp')
+        with open(temp, 'w') as f:
+            json.dump(job, f, indent=2)
+        os.replace(temp, path)
+
+    def load_bulk_job(self, job_id: str) -> Dict:
+        """
+        Load the saved state of a bulk job.
+
+        Args:
+            job_id: ID returned by submit_bulk()
+
+        Returns:
+            Job state dictionary (model, batches and the concepts each
+            request covers, status)
+        """
+        path = self._job_path(job_id)
+        if not path.exists():
+            raise KeyError(f"Unknown bulk job: {job_id}")
+        with open(path, 'r') as f:
+            return json.load(f)
+
+    def submit_bulk(self,
+                    concepts: List[str],
+                    concepts_per_request: int = 1,
+                    max_requests_per_batch: int = 10000,
+                    use_cache: bool = True) -> str:
+        """
+        Submit concepts for offline rating through the Message Batches API.
+
+        Batch jobs trade latency (results within 24 hours, usually much
+        sooner) for throughput and lower cost, which suits catalog-scale
+        regeneration. Cached and repeated concepts are skipped, the rest
+        are packed into requests (concepts_per_request per prompt) and the
+        requests into batches of up to max_requests_per_batch. The job's
+        state is saved under jobs_dir, so collect_bulk() can run from a
+        later process.
+
+        Args:
+            concepts: List of concepts to evaluate
+            concepts_per_request: Concepts rated by each request
+            max_requests_per_batch: Requests per batch job (the API allows
+                up to 100,000 requests and 256 MB per batch)
+            use_cache: Skip concepts that are already cached
+
+        Returns:
+            Local job ID for collect_bulk()
+        """
+        if not self.api_available:
+            raise RuntimeError("Cannot submit bulk job: API not available")
+        if concepts_per_request < 1 or max_requests_per_batch < 1:
+            raise ValueError("concepts_per_request and max_requests_per_batch must be at least 1")
+
+        keys = {}
+        for concept in concepts:
+            key = self._cache_key(concept)
+            if key not in keys and not (use_cache and key in self.cache):
+                keys[key] = concept
+        misses = list(keys.values())
+        groups = [misses[i:i + concepts_per_request]
+                  for i in range(0, len(misses), concepts_per_request)]
+
+        job = {
+            'job_id': f"bulk_{time.strftime('%Y%m%d_%H%M%S')}_{uuid.uuid4().hex[:8]}",
+            'model': self.model,
+            'created_at': time.time(),
+            'concepts': list(dict.fromkeys(concepts)),
+            'batches': [],
+            'collected': False
+        }
+
+        for start in range(0, len(groups), max_requests_per_batch):
+            requests = {}
+            params = []
+            for offset, group in enumerate(groups[start:start + max_requests_per_batch]):
+                custom_id = f"r{start + offset}"
+                requests[custom_id] = group
+                if len(group) == 1:
+                    prompt, max_tokens = self._create_prompt(group[0]), MAX_RESPONSE_TOKENS
+                else:
+                    prompt = self._create_batch_prompt(group)
+                    max_tokens = MAX_RESPONSE_TOKENS + TOKENS_PER_RATING * len(group)
+                params.append({
+                    'custom_id': custom_id,
+                    'params': {
+                        'model': self.model,
+                        'max_tokens': max_tokens,
+                        'temperature': 0.0,
+                        'messages': [{'role': 'user', 'content': prompt}]
+                    }
+                })
+
+            batch = self._batches().create(requests=params)
+            job['batches'].append({
+                'batch_id': batch.id,
+                'status': batch.processing_status,
+                'requests': requests
+            })
+            # Saved after every batch so a failure part-way loses nothing
+            self._save_job(job)
+
+        self._save_job(job)
+        print(f"Submitted {len(misses)} concepts in {len(groups)} requests "
+              f"({len(job['batches'])} batches) as {job['job_id']}")
+        return job['job_id']
+
+    def collect_bulk(self,
+                     job_id: str,
+                     wait: bool = True,
+                     poll_interval: float = 60.0,
+                     timeout: Optional[float] = None) -> Optional[Dict[str, Optional[SemanticCoordinate]]]:
+        """
+        Poll a bulk job and merge its results into the response cache.
+
+        Results are fetched once every batch in the job has ended. Concepts
+        whose request errored, expired or could not be parsed map to None;
+        generate_batch() can retry them interactively.
+
+        Args:
+            job_id: ID returned by submit_bulk()
+            wait: Poll until the job ends (otherwise check once)
+            poll_interval: Seconds between status checks
+            timeout: Maximum seconds to wait (None = no limit)
+
+        Returns:
+            Dictionary mapping every concept in the job to its
+            SemanticCoordinate (None for failures), or None if wait is
+            False and the job is still processing
+        """
+        job = self.load_bulk_job(job_id)
+        if job['model'] != self.model:
+            raise ValueError(f"Job {job_id} was submitted for {job['model']}, not {self.model}")
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not job['collected']:
+            for batch in job['batches']:
+                if batch['status'] != 'ended':
+                    batch['status'] = self._batches().retrieve(batch['batch_id']).processing_status
+            self._save_job(job)
+
+            if all(batch['status'] == 'ended' for batch in job['batches']):
+                self._merge_bulk_results(job)
+                break
+            if not wait:
+                return None
+            if deadline is not None and time.monotonic() + poll_interval > deadline:
+                raise TimeoutError(f"Bulk job {job_id} still processing after {timeout} s")
+            time.sleep(poll_interval)
+
+        return {concept: self._cached_coordinate(concept) for concept in job['concepts']}
+
+    def _merge_bulk_results(self, job: Dict):
+        """Parse every result of an ended job into the cache and mark it collected."""
+        counts = {'succeeded': 0, 'failed': 0}
+        for batch in job['batches']:
+            requests = batch['requests']
+            for entry in self._batches().results(batch['batch_id']):
+                group = requests.get(entry.custom_id)
+                if group is None:
+                    continue
+                text = None
+                if entry.result.type == 'succeeded' and entry.result.message.content:
+                    text = entry.result.message.content[0].text
+
+                if text is None:
+                    rated = {}
+                elif len(group) == 1:
+                    parsed = self._parse_response(text)
+                    rated = {group[0]: self._rated_coordinate(group[0], parsed, text)} if parsed else {}
+                else:
+                    rated = self._coordinates_from_batch_response(group, text)
+                counts['succeeded'] += len(rated)
+                counts['failed'] += len(group) - len(rated)
+
+        job['collected'] = True
+        job['counts'] = counts
+        self._save_cache()
+        self._save_job(job)
+        print(f"Collected {job['job_id']}: {counts['succeeded']} rated, {counts['failed']} failed")
+
 
 def setup_api_key():
     """
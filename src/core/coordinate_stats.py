@@ -0,0 +1,254 @@
+"""
+Streaming Coordinate Statistics
+===============================
+
+Single-pass, mergeable summary statistics for semantic coordinates.
+
+CoordinateStats keeps the count, mean, variance, minimum and maximum of
+each dimension (L, P, W, J) and of the distance to the Anchor Point.
+Batches are reduced with NumPy and folded in with the parallel form of
+Welford's algorithm (Chan et al.), so accumulators built on different
+chunks, threads or processes can be merged without revisiting any data.
+"""
+
+import numpy as np
+from typing import Dict, Hashable, Iterable
+
+from .semantic_coordinates import (
+    CoordinateArray,
+    _anchor_distances,
+    _coordinate_block,
+)
+
+
+class CoordinateStats:
+    """
+    Mergeable accumulator of per-dimension and anchor-distance moments.
+
+    Attributes:
+        count: Number of coordinates seen
+        mean: (5,) running means of (love, power, wisdom, justice, distance)
+        m2: (5,) running sums of squared deviations from the mean
+        min: (5,) running minima
+        max: (5,) running maxima
+    """
+
+    FIELDS = ('love', 'power', 'wisdom', 'justice', 'distance')
+
+    def __init__(self):
+        """Initialize an empty accumulator."""
+        self.count = 0
+        self.mean = np.zeros(5)
+        self.m2 = np.zeros(5)
+        self.min = np.full(5, np.inf)
+        self.max = np.full(5, -np.inf)
+
+    @classmethod
+    def _from_block(cls, block: np.ndarray) -> 'CoordinateStats':
+        """Summarize an (N, 5) block of (L, P, W, J, distance) rows."""
+        stats = cls()
+        if len(block):
+            stats.count = len(block)
+            stats.mean = block.mean(axis=0)
+            stats.m2 = ((block - stats.mean) ** 2).sum(axis=0)
+            stats.min = block.min(axis=0)
+            stats.max = block.max(axis=0)
+        return stats
+
+    @staticmethod
+    def _with_distances(values: np.ndarray) -> np.ndarray:
+        """Append the anchor distance column to an (N, 4) block."""
+        values = np.asarray(values, dtype=np.float64)
+        return np.column_stack((values, _anchor_distances(values)))
+
+    def update(self, coordinates) -> 'CoordinateStats':
+        """
+        Add a batch of coordinates.
+
+        Args:
+            coordinates: CoordinateArray, (N, 4) array, sequence of
+                semantic coordinates, or a single coordinate
+
+        Returns:
+            self, to allow chaining
+        """
+        if hasattr(coordinates, 'coordinates'):
+            coordinates = [coordinates]
+        values = _coordinate_block(coordinates)
+        return self.merge(self._from_block(self._with_distances(values)))
+
+    def update_iter(self, items: Iterable, chunk_size: int = 65536) -> 'CoordinateStats':
+        """
+        Consume an iterator in bounded chunks.
+
+        Items may be semantic coordinates, raw (L, P, W, J, ...) rows such
+        as database tuples, or whole CoordinateArray / (N, 4) array chunks.
+
+        Args:
+            items: Iterable of coordinates, rows or chunks
+            chunk_size: Number of single items buffered per batch
+
+        Returns:
+            self, to allow chaining
+        """
+        buffer = []
+        for item in items:
+            if isinstance(item, (CoordinateArray, np.ndarray)):
+                self.update(item)
+                continue
+            buffer.append(item.coordinates if hasattr(item, 'coordinates') else tuple(item[:4]))
+            if len(buffer) >= chunk_size:
+                self.update(np.array(buffer, dtype=np.float64))
+                buffer = []
+        if buffer:
+            self.update(np.array(buffer, dtype=np.float64))
+        return self
+
+    @classmethod
+    def from_cursor(cls, cursor, batch_size: int = 65536) -> 'CoordinateStats':
+        """
+        Accumulate rows from an executed database cursor.
+
+        The query must select love, power, wisdom, justice as its first
+        four columns. Rows are pulled with fetchmany, so at most one batch
+        is held in memory.
+
+        Args:
+            cursor: DB-API cursor with a pending result set
+            batch_size: Rows fetched per round trip
+
+        Returns:
+            CoordinateStats over all rows
+        """
+        stats = cls()
+        while True:
+            rows = cursor.fetchmany(batch_size)
+            if not rows:
+                return stats
+            stats.update(np.array([row[:4] for row in rows], dtype=np.float64))
+
+    def merge(self, other: 'CoordinateStats') -> 'CoordinateStats':
+        """
+        Fold another accumulator into this one.
+
+        Args:
+            other: Accumulator built over a disjoint set of coordinates
+
+        Returns:
+            self, to allow chaining
+        """
+        if other.count == 0:
+            return self
+        if self.count == 0:
+            self.count = other.count
+            self.mean = other.mean.copy()
+            self.m2 = other.m2.copy()
+            self.min = other.min.copy()
+            self.max = other.max.copy()
+            return self
+
+        total = self.count + other.count
+        delta = other.mean - self.mean
+        self.mean = self.mean + delta * (other.count / total)
+        self.m2 = self.m2 + other.m2 + delta ** 2 * (self.count * other.count / total)
+        self.min = np.minimum(self.min, other.min)
+        self.max = np.maximum(self.max, other.max)
+        self.count = total
+        return self
+
+    @classmethod
+    def combine(cls, parts: Iterable['CoordinateStats']) -> 'CoordinateStats':
+        """
+        Reduce partial accumulators (e.g. one per chunk or process).
+
+        Args:
+            parts: Accumulators over disjoint sets of coordinates
+
+        Returns:
+            A new accumulator covering all parts
+        """
+        total = cls()
+        for part in parts:
+            total.merge(part)
+        return total
+
+    def __add__(self, other: 'CoordinateStats') -> 'CoordinateStats':
+        return CoordinateStats.combine([self, other])
+
+    @classmethod
+    def grouped(cls, coordinates, labels) -> Dict[Hashable, 'CoordinateStats']:
+        """
+        Accumulate one CoordinateStats per label in a single vectorized pass.
+
+        Suitable as the map step of a map-reduce: group each chunk, then
+        merge the per-label results of all chunks.
+
+        Args:
+            coordinates: CoordinateArray, (N, 4) array or sequence of coordinates
+            labels: (N,) labels (e.g. categories or sources)
+
+        Returns:
+            Dictionary mapping each label to its accumulator
+        """
+        block = cls._with_distances(_coordinate_block(coordinates))
+        if not len(block):
+            return {}
+        keys, inverse = np.unique(np.asarray(labels), return_inverse=True)
+        inverse = inverse.ravel()
+        if len(inverse) != len(block):
+            raise ValueError(f"Expected {len(block)} labels, got {len(inverse)}")
+
+        order = np.argsort(inverse, kind='stable')
+        block = block[order]
+        counts = np.bincount(inverse, minlength=len(keys))
+        starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+
+        means = np.add.reduceat(block, starts, axis=0) / counts[:, None]
+        deviations = (block - np.repeat(means, counts, axis=0)) ** 2
+        m2s = np.add.reduceat(deviations, starts, axis=0)
+        mins = np.minimum.reduceat(block, starts, axis=0)
+        maxs = np.maximum.reduceat(block, starts, axis=0)
+
+        groups = {}
+        for g, key in enumerate(keys.tolist()):
+            stats = cls()
+            stats.count = int(counts[g])
+            stats.mean, stats.m2 = means[g], m2s[g]
+            stats.min, stats.max = mins[g], maxs[g]
+            groups[key] = stats
+        return groups
+
+    @property
+    def variance(self) -> np.ndarray:
+        """(5,) population variances (ddof=0, like np.var)."""
+        if self.count == 0:
+            return np.full(5, np.nan)
+        return self.m2 / self.count
+
+    @property
+    def std(self) -> np.ndarray:
+        """(5,) population standard deviations (ddof=0, like np.std)."""
+        return np.sqrt(self.variance)
+
+    def as_dict(self) -> Dict[str, float]:
+        """
+        Summarize as a flat dictionary.
+
+        Returns:
+            Dictionary with 'n' plus mean_/std_/min_/max_ entries for each
+            dimension and for the anchor distance
+        """
+        summary = {'n': self.count}
+        std = self.std
+        for i, field in enumerate(self.FIELDS):
+            summary[f'mean_{field}'] = float(self.mean[i]) if self.count else float('nan')
+            summary[f'std_{field}'] = float(std[i])
+            summary[f'min_{field}'] = float(self.min[i]) if self.count else float('nan')
+            summary[f'max_{field}'] = float(self.max[i]) if self.count else float('nan')
+        return summary
+
+    def __repr__(self) -> str:
+        if not self.count:
+            return "CoordinateStats(n=0)"
+        return (f"CoordinateStats(n={self.count}, "
+                f"mean_distance={self.mean[4]:.4f}, std_distance={self.std[4]:.4f})")
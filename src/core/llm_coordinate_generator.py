@@ -16,6 +16,7 @@ from pathlib import Path
 import time
 
 from .semantic_coordinates import SemanticCoordinate
+from .response_cache import ResponseCache
 
 
 class LLMCoordinateGenerator:
@@ -36,25 +37,22 @@ class LLMCoordinateGenerator:
 
         Args:
             model: Model to use ("simulated", "claude", "gpt4", etc.)
-            cache_path: Optional path to cache LLM responses
+            cache_path: Optional path to cache LLM responses (a SQLite
+                file; a legacy .json cache is imported once into the .db
+                file beside it)
         """
         self.model = model
         self.cache_path = Path(cache_path) if cache_path else None
         self.cache = self._load_cache() if self.cache_path else {}
 
-    def _load_cache(self) -> Dict:
-        """Load cached responses from disk."""
-        if self.cache_path and self.cache_path.exists():
-            with open(self.cache_path, 'r') as f:
-                return json.load(f)
-        return {}
+    def _load_cache(self) -> ResponseCache:
+        """Open the persistent response cache."""
+        return ResponseCache(self.cache_path)
 
     def _save_cache(self):
-        """Save cache to disk."""
+        """Write buffered cache entries to disk."""
         if self.cache_path:
-            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(self.cache_path, 'w') as f:
-                json.dump(self.cache, f, indent=2)
+            self.cache.flush()
 
     def _create_prompt(self, concept: str) -> str:
         """
@@ -279,7 +277,6 @@ No explanation, just the JSON."""
                 'wisdom': wisdom,
                 'justice': justice
             }
-            self._save_cache()
 
         return SemanticCoordinate(
             concept=concept,
@@ -316,6 +313,7 @@ No explanation, just the JSON."""
             if (i + 1) % 10 == 0:
                 print(f"Processed {i + 1}/{len(concepts)} concepts...")
 
+        self._save_cache()
         print(f"Completed: {len(results)} concepts processed")
         return results
 
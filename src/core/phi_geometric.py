@@ -177,39 +177,140 @@ def vector_to_spherical(vector: np.ndarray) -> Tuple[float, float, float, Option
         raise ValueError(f"Unsupported dimension: {dim}")
 
 
-def golden_spiral_distance_4d(vector1: np.ndarray, vector2: np.ndarray) -> float:
+# sqrt(1 + ln(φ)²), the constant part of golden_spiral_arc_length's factor
+_ARC_SCALE = np.sqrt(1 + np.log(PHI) ** 2)
+
+
+def _row_norms(points: np.ndarray) -> np.ndarray:
     """
-    Calculate distance between two 4D vectors using golden spiral metric.
+    Euclidean norm of every row, accumulated in a fixed left-to-right order.
 
-    This provides a more organic measure of semantic distance than Euclidean.
+    Args:
+        points: (..., D) array
+
+    Returns:
+        (...) array of norms
+    """
+    total = points[..., 0] * points[..., 0]
+    for k in range(1, points.shape[-1]):
+        total = total + points[..., k] * points[..., k]
+    return np.sqrt(total)
+
+
+def _golden_spiral_kernel(r1: np.ndarray, r2: np.ndarray, dots: np.ndarray) -> np.ndarray:
+    """
+    Golden spiral distance from radii and dot products (broadcasting).
+
+    Every entry point (scalar, pairs, matrix, to-anchor) goes through this
+    kernel with the same elementwise operations in the same order, so
+    they return bit-identical values for the same pair of points.
 
     Args:
-        vector1: First 4D vector
-        vector2: Second 4D vector
+        r1: Norms of the first points
+        r2: Norms of the second points
+        dots: Dot products between the points
 
     Returns:
-        Golden spiral distance
+        Golden spiral distances, broadcast shape of the inputs
     """
-    # Convert to hyperspherical coordinates
-    r1, theta1, phi1, psi1 = vector_to_spherical(vector1)
-    r2, theta2, phi2, psi2 = vector_to_spherical(vector2)
+    denom = r1 * r2
+    positive = denom > 0
 
     # Calculate angular distance (geodesic on hypersphere)
-    # For 4D, we use the generalized great circle distance
-    cos_angle = (np.dot(vector1, vector2) / (r1 * r2)) if (r1 * r2) > 0 else 1
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cos_angle = np.where(positive, dots / np.where(positive, denom, 1.0), 1.0)
     cos_angle = np.clip(cos_angle, -1, 1)  # Numerical stability
-    angular_dist = np.arccos(cos_angle)
+    angular_dist = np.ascontiguousarray(np.arccos(cos_angle))
+
+    # Golden spiral arc from angle 0 to angular_dist, starting at radius min(r1, r2)
+    factor = np.minimum(r1, r2) * _ARC_SCALE * PHI ** 2
+    spiral_arc = factor * np.abs(np.power(PHI, angular_dist / (np.pi / 2)) - 1.0)
+
+    # Combine radial difference with spiral arc (phi-weighted)
+    radial_diff = np.abs(r2 - r1)
+    return PHI_INVERSE * spiral_arc + (1 - PHI_INVERSE) * radial_diff
+
+
+def golden_spiral_distance_pairs(points1: np.ndarray, points2: np.ndarray) -> np.ndarray:
+    """
+    Golden spiral distance between corresponding rows of two blocks.
+
+    Args:
+        points1: (N, 4) array
+        points2: (N, 4) array, or a single (4,) point compared with every row
+
+    Returns:
+        (N,) array of distances
+    """
+    points1 = np.atleast_2d(np.asarray(points1, dtype=np.float64))
+    points2 = np.asarray(points2, dtype=np.float64)
+
+    dots = points1[:, 0] * points2[..., 0]
+    for k in range(1, points1.shape[1]):
+        dots = dots + points1[:, k] * points2[..., k]
+
+    return _golden_spiral_kernel(_row_norms(points1), _row_norms(points2), dots)
+
+
+def golden_spiral_distance_matrix(points1: np.ndarray,
+                                  points2: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Golden spiral distances between every row of two blocks.
+
+    Args:
+        points1: (N, 4) array
+        points2: (M, 4) array (defaults to points1)
+
+    Returns:
+        (N, M) array where entry [i, j] equals
+        golden_spiral_distance_4d(points1[i], points2[j])
+    """
+    points1 = np.atleast_2d(np.asarray(points1, dtype=np.float64))
+    points2 = points1 if points2 is None else np.atleast_2d(np.asarray(points2, dtype=np.float64))
+
+    dots = np.multiply.outer(points1[:, 0], points2[:, 0])
+    for k in range(1, points1.shape[1]):
+        dots = dots + np.multiply.outer(points1[:, k], points2[:, k])
+
+    r1 = _row_norms(points1)[:, None]
+    r2 = _row_norms(points2)[None, :]
+    return _golden_spiral_kernel(r1, r2, dots)
+
+
+def golden_spiral_distance_to_anchor(points: np.ndarray,
+                                     anchor: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Golden spiral distance from every row to a single anchor.
+
+    Args:
+        points: (N, 4) array
+        anchor: Anchor vector (defaults to the Anchor Point (1,1,1,1))
+
+    Returns:
+        (N,) array of distances
+    """
+    if anchor is None:
+        anchor = np.array([1.0, 1.0, 1.0, 1.0])
+    return golden_spiral_distance_pairs(points, anchor)
 
-    # Calculate radial component using golden spiral
-    spiral_arc = golden_spiral_arc_length(0, angular_dist, a=min(r1, r2))
 
-    # Combine radial difference with spiral arc
-    radial_diff = abs(r2 - r1)
+def golden_spiral_distance_4d(vector1: np.ndarray, vector2: np.ndarray) -> float:
+    """
+    Calculate distance between two 4D vectors using golden spiral metric.
 
-    # Weighted combination (phi-weighted)
-    distance = PHI_INVERSE * spiral_arc + (1 - PHI_INVERSE) * radial_diff
+    This provides a more organic measure of semantic distance than Euclidean.
+    Shares its kernel with the batch functions above, so results are
+    identical to golden_spiral_distance_matrix / _pairs / _to_anchor.
 
-    return distance
+    Args:
+        vector1: First 4D vector
+        vector2: Second 4D vector
+
+    Returns:
+        Golden spiral distance
+    """
+    return float(golden_spiral_distance_pairs(np.asarray(vector1, dtype=np.float64)[None, :],
+                                              np.asarray(vector2, dtype=np.float64)[None, :])[0])
 
 
 # =============================================================================
@@ -279,15 +380,12 @@ def phi_normalize(vector: np.ndarray) -> np.ndarray:
 # DODECAHEDRAL ANCHOR NETWORK
 # =============================================================================
 
-def generate_dodecahedral_anchors() -> List[np.ndarray]:
+def _build_dodecahedral_anchors() -> np.ndarray:
     """
-    Generate 12 anchor points in 4D space based on dodecahedral symmetry.
-
-    The dodecahedron is closely tied to the golden ratio, making it ideal
-    for phi-geometric semantic space organization.
+    Compute the 12 dodecahedral anchor points in 4D space.
 
     Returns:
-        List of 12 anchor point vectors in 4D space
+        (12, 4) array, primary anchor (1,1,1,1) first
     """
     # Primary anchor at (1,1,1,1)
     primary = np.array([1.0, 1.0, 1.0, 1.0])
@@ -315,7 +413,94 @@ def generate_dodecahedral_anchors() -> List[np.ndarray]:
 
         anchors.append(anchor)
 
-    return anchors
+    return np.array(anchors)
+
+
+# Computed once at import; read-only so callers cannot corrupt the shared network
+DODECAHEDRAL_ANCHORS = _build_dodecahedral_anchors()
+DODECAHEDRAL_ANCHORS.setflags(write=False)
+
+
+def generate_dodecahedral_anchors() -> List[np.ndarray]:
+    """
+    Generate 12 anchor points in 4D space based on dodecahedral symmetry.
+
+    The dodecahedron is closely tied to the golden ratio, making it ideal
+    for phi-geometric semantic space organization. The network is
+    precomputed as DODECAHEDRAL_ANCHORS; this returns writable copies.
+
+    Returns:
+        List of 12 anchor point vectors in 4D space
+    """
+    return [anchor.copy() for anchor in DODECAHEDRAL_ANCHORS]
+
+
+def _euclidean_distance_matrix(points1: np.ndarray, points2: np.ndarray) -> np.ndarray:
+    """
+    Euclidean distances between every row of two blocks.
+
+    Accumulates one dimension at a time, so no (N, M, D) temporary is built.
+
+    Args:
+        points1: (N, D) array
+        points2: (M, D) array
+
+    Returns:
+        (N, M) array of distances
+    """
+    total = None
+    for k in range(points1.shape[1]):
+        diff = np.subtract.outer(points1[:, k], points2[:, k])
+        total = diff * diff if total is None else total + diff * diff
+    return np.sqrt(total)
+
+
+def nearest_anchor_batch(
+    points: np.ndarray,
+    anchors: Optional[np.ndarray] = None,
+    metric: str = 'euclidean',
+    chunk_size: int = 262144
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Assign every point to its nearest anchor in vectorized chunks.
+
+    Ties resolve to the lowest anchor index, as in nearest_anchor.
+
+    Args:
+        points: (N, 4) array of vectors
+        anchors: Optional (K, 4) anchors (defaults to DODECAHEDRAL_ANCHORS)
+        metric: Distance metric ('euclidean' or 'phi_spiral')
+        chunk_size: Points per chunk; bounds the (chunk, K) distance block
+
+    Returns:
+        Tuple of (indices, distances), each (N,)
+    """
+    if metric == 'euclidean':
+        distance_matrix = _euclidean_distance_matrix
+    elif metric == 'phi_spiral':
+        distance_matrix = golden_spiral_distance_matrix
+    else:
+        raise ValueError(f"Unknown metric: {metric}")
+
+    points = np.atleast_2d(np.asarray(points, dtype=np.float64))
+    if anchors is None:
+        anchors = DODECAHEDRAL_ANCHORS
+    anchors = np.asarray(anchors, dtype=np.float64).reshape(-1, points.shape[1])
+
+    n = len(points)
+    indices = np.zeros(n, dtype=np.intp)
+    distances = np.full(n, np.inf)
+    if len(anchors) == 0:
+        return indices, distances
+
+    for start in range(0, n, chunk_size):
+        stop = min(start + chunk_size, n)
+        block = distance_matrix(points[start:stop], anchors)
+        best = np.argmin(block, axis=1)
+        indices[start:stop] = best
+        distances[start:stop] = block[np.arange(stop - start), best]
+
+    return indices, distances
 
 
 def nearest_anchor(
@@ -328,36 +513,59 @@ def nearest_anchor(
 
     Args:
         vector: 4D vector to find anchor for
-        anchors: Optional list of anchor vectors (generates dodecahedral if None)
+        anchors: Optional list of anchor vectors (uses dodecahedral if None)
         metric: Distance metric ('euclidean' or 'phi_spiral')
 
     Returns:
         Tuple of (anchor_index, distance)
     """
-    if anchors is None:
-        anchors = generate_dodecahedral_anchors()
+    indices, distances = nearest_anchor_batch(vector, anchors, metric)
+    return (int(indices[0]), float(distances[0]))
 
-    min_dist = float('inf')
-    min_idx = 0
 
-    for i, anchor in enumerate(anchors):
-        if metric == 'euclidean':
-            dist = np.linalg.norm(vector - anchor)
-        elif metric == 'phi_spiral':
-            dist = golden_spiral_distance_4d(vector, anchor)
-        else:
-            raise ValueError(f"Unknown metric: {metric}")
+# =============================================================================
+# PHI-HARMONIC VERIFICATION
+# =============================================================================
 
-        if dist < min_dist:
-            min_dist = dist
-            min_idx = i
+def phi_harmony_score_batch(points: np.ndarray) -> np.ndarray:
+    """
+    Phi-harmony score of every row of a block.
 
-    return (min_idx, min_dist)
+    Each row is scored exactly like phi_harmony_score: ratios between
+    consecutive components (skipping zero denominators) are compared with
+    phi and 1/phi, and the mean distance is mapped through exp(-2d).
 
+    Args:
+        points: (N, D) array of vectors
+
+    Returns:
+        (N,) array of harmony scores in [0.0, 1.0]
+    """
+    points = np.atleast_2d(np.asarray(points, dtype=np.float64))
+    if points.shape[1] < 2:
+        return np.zeros(len(points))
+
+    # Check ratios between consecutive components
+    previous, following = points[:, :-1], points[:, 1:]
+    valid = previous != 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ratio = following / np.where(valid, previous, 1.0)
+
+    # How close is each ratio to phi or 1/phi?
+    phi_dist = np.minimum(np.abs(ratio - PHI), np.abs(ratio - PHI_INVERSE))
+    phi_dist = np.where(valid, phi_dist, 0.0)
+
+    # Average distance from phi-harmonic ratios, summed left to right
+    total = phi_dist[:, 0]
+    for k in range(1, phi_dist.shape[1]):
+        total = total + phi_dist[:, k]
+    counts = valid.sum(axis=1)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mean_dist = total / counts
+
+    # Convert to score (lower distance = higher score) using exponential decay
+    return np.where(counts > 0, np.exp(-mean_dist * 2), 0.0)
 
-# =============================================================================
-# PHI-HARMONIC VERIFICATION
-# =============================================================================
 
 def phi_harmony_score(vector: np.ndarray) -> float:
     """
@@ -374,26 +582,7 @@ def phi_harmony_score(vector: np.ndarray) -> float:
     if len(vector) < 2:
         return 0.0
 
-    # Check ratios between consecutive components
-    ratios = []
-    for i in range(len(vector) - 1):
-        if vector[i] != 0:
-            ratio = vector[i + 1] / vector[i]
-            # How close is this ratio to phi or 1/phi?
-            phi_dist = min(abs(ratio - PHI), abs(ratio - PHI_INVERSE))
-            ratios.append(phi_dist)
-
-    if not ratios:
-        return 0.0
-
-    # Average distance from phi-harmonic ratios
-    mean_dist = np.mean(ratios)
-
-    # Convert to score (lower distance = higher score)
-    # Using exponential decay
-    score = np.exp(-mean_dist * 2)
-
-    return float(score)
+    return float(phi_harmony_score_batch(np.asarray(vector)[None, :])[0])
 
 
 def verify_anchor_point_harmony(anchor: np.ndarray = np.array([1.0, 1.0, 1.0, 1.0])) -> Dict[str, float]:
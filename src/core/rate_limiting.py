@@ -0,0 +1,90 @@
+"""
+Rate Limiting
+=============
+
+Token-bucket limiter for pacing concurrent API requests.
+
+A bucket holds up to `capacity` tokens and refills continuously at a
+fixed rate per minute, the same model providers use to enforce request
+and token quotas. Callers await acquire(n) before each request, so a
+batch runs as fast as the quota allows instead of at a fixed delay.
+"""
+
+import asyncio
+import time
+from typing import Callable, Optional
+
+
+class TokenBucket:
+    """
+    Continuously refilling token bucket for asyncio code.
+
+    Attributes:
+        rate_per_minute: Tokens added per minute
+        capacity: Maximum tokens held (the largest burst)
+        tokens: Tokens currently available (negative after an oversized acquire)
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Create a full bucket.
+
+        Args:
+            rate_per_minute: Tokens added per minute (must be positive)
+            capacity: Maximum tokens held (defaults to one second's worth,
+                at least 1, since providers enforce short bursts too)
+            clock: Monotonic clock in seconds (injectable for tests)
+        """
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+        self.rate_per_minute = float(rate_per_minute)
+        if capacity is None:
+            capacity = max(1.0, rate_per_minute / 60.0)
+        self.capacity = float(capacity)
+        self.tokens = self.capacity
+        self._clock = clock
+        self._updated = clock()
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _refill(self):
+        """Add the tokens accrued since the last update."""
+        now = self._clock()
+        accrued = (now - self._updated) * self.rate_per_minute / 60.0
+        self.tokens = min(self.capacity, self.tokens + accrued)
+        self._updated = now
+
+    def delay(self, amount: float = 1.0) -> float:
+        """
+        Seconds until amount tokens are available.
+
+        Requests larger than the capacity only wait for a full bucket, then
+        leave it in debt, so they still go through.
+
+        Args:
+            amount: Tokens needed
+
+        Returns:
+            Seconds to wait (0.0 if the tokens are available now)
+        """
+        self._refill()
+        needed = min(amount, self.capacity)
+        return max(0.0, (needed - self.tokens) * 60.0 / self.rate_per_minute)
+
+    async def acquire(self, amount: float = 1.0):
+        """
+        Wait until amount tokens are available, then take them.
+
+        Waiters are served first come, first served.
+
+        Args:
+            amount: Tokens to take
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            wait = self.delay(amount)
+            while wait > 0:
+                await asyncio.sleep(wait)
+                wait = self.delay(amount)
+            self.tokens -= amount
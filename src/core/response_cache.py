@@ -0,0 +1,194 @@
+"""
+Persistent Response Cache
+=========================
+
+Dictionary-like store for model responses, backed by SQLite in WAL mode.
+
+The generators used to keep their cache in one JSON file and rewrite the
+whole file after every new concept, so a batch of N concepts wrote O(N^2)
+bytes and two processes sharing the file overwrote each other's entries.
+ResponseCache writes each entry as a single row: new entries are buffered
+and upserted together every `flush_every` writes (and on flush(), close()
+or interpreter exit), and concurrent processes simply add rows to the
+same database.
+
+A cache opened on a legacy `.json` path stores its rows in the sibling
+`.db` file and imports the JSON entries once.
+"""
+
+import json
+import threading
+import weakref
+from collections.abc import MutableMapping
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional, Union
+
+from .sqlite_connections import ConnectionManager, SQLiteTuning
+
+
+def _write_pending(connections: ConnectionManager, pending: Dict[str, str]):
+    """Upsert buffered entries (shared by flush() and the exit finalizer)."""
+    if not pending:
+        return
+    with connections.write() as conn:
+        # Upsert keeps each key's rowid, so iteration order is first-write order
+        conn.executemany("""
+            INSERT INTO responses (key, value) VALUES (?, ?)
+            ON CONFLICT(key) DO UPDATE SET value = excluded.value
+        """, list(pending.items()))
+    pending.clear()
+
+
+def _close(connections: ConnectionManager, pending: Dict[str, str]):
+    """Flush buffered entries and close the connections."""
+    try:
+        _write_pending(connections, pending)
+    finally:
+        connections.close()
+
+
+class ResponseCache(MutableMapping):
+    """
+    Persistent mapping from cache key to a JSON-serializable value.
+
+    Reads are served from memory; keys written by other processes since
+    this cache was opened are picked up from the database on first access.
+    Iteration and len() reflect the whole database.
+
+    Attributes:
+        path: SQLite database file
+        flush_every: Buffered writes that trigger a flush
+    """
+
+    def __init__(self, path: Union[str, Path], flush_every: int = 16,
+                 tuning: Optional[SQLiteTuning] = None):
+        """
+        Open (or create) the cache.
+
+        Args:
+            path: Database file, or a legacy JSON cache file whose entries
+                are imported once into the `.db` file beside it
+            flush_every: Buffered writes that trigger a flush (1 writes
+                every entry immediately)
+            tuning: Optional pragma profile (defaults to SQLiteTuning())
+        """
+        path = Path(path)
+        legacy = path if path.suffix.lower() == '.json' else None
+        self.path = path.with_suffix('.db') if legacy else path
+        self.flush_every = max(1, int(flush_every))
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        self._connections = ConnectionManager(str(self.path), tuning)
+        self._lock = threading.RLock()
+        self._pending: Dict[str, str] = {}
+        self._memory: Dict[str, Any] = {}
+
+        with self._connections.write() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS responses (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+            """)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS cache_meta (
+                    name TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            """)
+            if legacy is not None:
+                self._migrate(conn, legacy)
+
+        with self._connections.read() as conn:
+            self._memory = {key: json.loads(value)
+                            for key, value in conn.execute("SELECT key, value FROM responses")}
+
+        self._finalizer = weakref.finalize(self, _close, self._connections, self._pending)
+
+    @staticmethod
+    def _migrate(conn, legacy: Path):
+        """Import a legacy JSON cache file the first time it is seen."""
+        marker = f"migrated:{legacy.name}"
+        if conn.execute("SELECT 1 FROM cache_meta WHERE name = ?", (marker,)).fetchone():
+            return
+        if legacy.exists():
+            with open(legacy, 'r') as f:
+                entries = json.load(f)
+            # Entries already written to the database are newer than the JSON
+            conn.executemany(
+                "INSERT OR IGNORE INTO responses (key, value) VALUES (?, ?)",
+                [(key, json.dumps(value)) for key, value in entries.items()]
+            )
+        conn.execute("INSERT INTO cache_meta (name, value) VALUES (?, ?)", (marker, str(legacy)))
+
+    def _lookup(self, key: str) -> Any:
+        """Return the value for key, checking the database on a memory miss."""
+        with self._lock:
+            if key in self._memory:
+                return self._memory[key]
+        with self._connections.read() as conn:
+            row = conn.execute("SELECT value FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            raise KeyError(key)
+        value = json.loads(row[0])
+        with self._lock:
+            return self._memory.setdefault(key, value)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._lookup(key)
+
+    def __contains__(self, key) -> bool:
+        try:
+            self._lookup(key)
+        except KeyError:
+            return False
+        return True
+
+    def __setitem__(self, key: str, value: Any):
+        encoded = json.dumps(value)
+        with self._lock:
+            self._memory[key] = value
+            self._pending[key] = encoded
+            if len(self._pending) >= self.flush_every:
+                self.flush()
+
+    def __delitem__(self, key: str):
+        with self._lock:
+            in_memory = self._memory.pop(key, None) is not None
+            self._pending.pop(key, None)
+            with self._connections.write() as conn:
+                deleted = conn.execute("DELETE FROM responses WHERE key = ?", (key,)).rowcount
+        if not (in_memory or deleted):
+            raise KeyError(key)
+
+    def __iter__(self) -> Iterator[str]:
+        self.flush()
+        with self._connections.read() as conn:
+            keys = [row[0] for row in conn.execute("SELECT key FROM responses ORDER BY rowid")]
+        return iter(keys)
+
+    def __len__(self) -> int:
+        self.flush()
+        with self._connections.read() as conn:
+            return conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+
+    def flush(self):
+        """Write all buffered entries to the database."""
+        with self._lock:
+            _write_pending(self._connections, self._pending)
+
+    def close(self):
+        """Flush buffered entries and close the database."""
+        with self._lock:
+            self._finalizer()
+
+    def __enter__(self):
+        """Context manager entry."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit."""
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"ResponseCache('{self.path}', entries={len(self._memory)})"
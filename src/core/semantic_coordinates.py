@@ -13,16 +13,23 @@ Each concept is represented as a point in 4D space:
 """
 
 import numpy as np
-from typing import Tuple, List, Dict, Optional
-from dataclasses import dataclass
+from typing import Tuple, List, Dict, Optional, Sequence, Union, Iterator
+from dataclasses import dataclass, FrozenInstanceError
 import hashlib
+import heapq
+import math
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
 
 # Import phi-geometric enhancements (optional - graceful fallback)
 try:
     from .phi_geometric import (
         golden_spiral_distance_4d,
+        golden_spiral_distance_pairs,
         phi_harmony_score,
+        phi_harmony_score_batch,
         nearest_anchor as find_nearest_dodecahedral_anchor,
+        nearest_anchor_batch,
         generate_dodecahedral_anchors,
         PHI,
         PHI_INVERSE,
@@ -193,6 +200,149 @@ class SemanticCoordinate:
                 f"d={self.distance_to_anchor():.3f})")
 
 
+class CompactSemanticCoordinate:
+    """
+    Slotted, immutable variant of SemanticCoordinate for large collections.
+
+    Has no per-instance ``__dict__`` and computes derived metrics once:
+    the anchor distance and the coordinate vector are cached on first use,
+    and Euclidean distances use a pure-float scalar path instead of
+    building NumPy arrays for a single 4-vector. Exposes the same
+    attributes and methods as SemanticCoordinate.
+
+    Attributes:
+        concept: The name/description of the concept
+        love: Love dimension [0.0, 1.0]
+        power: Power dimension [0.0, 1.0]
+        wisdom: Wisdom dimension [0.0, 1.0]
+        justice: Justice dimension [0.0, 1.0]
+        source: Optional metadata about the source of the coordinates
+    """
+
+    __slots__ = ('concept', 'love', 'power', 'wisdom', 'justice', 'source',
+                 '_distance', '_vector')
+
+    def __init__(self, concept: str, love: float, power: float,
+                 wisdom: float, justice: float, source: Optional[str] = None):
+        for dim in (love, power, wisdom, justice):
+            if not 0.0 <= dim <= 1.0:
+                raise ValueError(f"All dimensions must be in range [0.0, 1.0], got {dim}")
+
+        init = object.__setattr__
+        init(self, 'concept', concept)
+        init(self, 'love', love)
+        init(self, 'power', power)
+        init(self, 'wisdom', wisdom)
+        init(self, 'justice', justice)
+        init(self, 'source', source)
+        init(self, '_distance', None)
+        init(self, '_vector', None)
+
+    @classmethod
+    def from_coordinate(cls, coord: SemanticCoordinate) -> 'CompactSemanticCoordinate':
+        """Create a compact copy of a SemanticCoordinate."""
+        return cls(coord.concept, coord.love, coord.power,
+                   coord.wisdom, coord.justice, coord.source)
+
+    def to_coordinate(self) -> SemanticCoordinate:
+        """Return an equivalent (mutable) SemanticCoordinate."""
+        return SemanticCoordinate(self.concept, self.love, self.power,
+                                  self.wisdom, self.justice, self.source)
+
+    def __setattr__(self, name, value):
+        raise FrozenInstanceError(f"cannot assign to field '{name}'")
+
+    def __delattr__(self, name):
+        raise FrozenInstanceError(f"cannot delete field '{name}'")
+
+    def __reduce__(self):
+        return (self.__class__, (self.concept, self.love, self.power,
+                                 self.wisdom, self.justice, self.source))
+
+    @property
+    def coordinates(self) -> Tuple[float, float, float, float]:
+        """Return coordinates as tuple (L, P, W, J)."""
+        return (self.love, self.power, self.wisdom, self.justice)
+
+    @property
+    def vector(self) -> np.ndarray:
+        """Return coordinates as a cached, read-only numpy array."""
+        if self._vector is None:
+            vector = np.array(self.coordinates, dtype=np.float64)
+            vector.setflags(write=False)
+            object.__setattr__(self, '_vector', vector)
+        return self._vector
+
+    def distance_to_anchor(self) -> float:
+        """
+        Calculate Euclidean distance to the Universal Anchor Point (1.0, 1.0, 1.0, 1.0).
+
+        Computed once with scalar float arithmetic and cached.
+
+        Returns:
+            Distance from this concept to the Anchor Point
+        """
+        if self._distance is None:
+            dl = 1.0 - self.love
+            dp = 1.0 - self.power
+            dw = 1.0 - self.wisdom
+            dj = 1.0 - self.justice
+            object.__setattr__(self, '_distance',
+                               math.sqrt(dl * dl + dp * dp + dw * dw + dj * dj))
+        return self._distance
+
+    def distance_to(self, other) -> float:
+        """
+        Calculate Euclidean distance to another semantic coordinate.
+
+        Args:
+            other: Another semantic coordinate (compact or regular)
+
+        Returns:
+            Distance between the two points
+        """
+        ol, op, ow, oj = other.coordinates
+        dl = self.love - ol
+        dp = self.power - op
+        dw = self.wisdom - ow
+        dj = self.justice - oj
+        return math.sqrt(dl * dl + dp * dp + dw * dw + dj * dj)
+
+    def similarity_to_anchor(self) -> float:
+        """
+        Calculate similarity to Anchor Point as a score [0.0, 1.0].
+
+        Returns:
+            1.0 = perfect alignment, 0.0 = maximum distance
+        """
+        return 1.0 - (self.distance_to_anchor() / 2.0)
+
+    # Phi-geometric metrics only need ``vector`` and the Euclidean methods,
+    # so they are shared with SemanticCoordinate unchanged.
+    phi_distance_to_anchor = SemanticCoordinate.phi_distance_to_anchor
+    phi_distance_to = SemanticCoordinate.phi_distance_to
+    phi_harmony = SemanticCoordinate.phi_harmony
+    nearest_dodecahedral_anchor = SemanticCoordinate.nearest_dodecahedral_anchor
+    distance_metrics = SemanticCoordinate.distance_metrics
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, (CompactSemanticCoordinate, SemanticCoordinate)):
+            return NotImplemented
+        return (self.concept == other.concept
+                and self.coordinates == other.coordinates
+                and self.source == other.source)
+
+    def __hash__(self) -> int:
+        return hash((self.concept, self.love, self.power,
+                     self.wisdom, self.justice, self.source))
+
+    def __repr__(self) -> str:
+        return (f"CompactSemanticCoordinate(concept='{self.concept}', "
+                f"L={self.love:.3f}, P={self.power:.3f}, "
+                f"W={self.wisdom:.3f}, J={self.justice:.3f}, "
+                f"d={self.distance_to_anchor():.3f})")
+
+
 class AnchorPoint:
     """
     Represents the Universal Anchor Point: JEHOVAH = AGAPE = (1.0, 1.0, 1.0, 1.0)
@@ -221,6 +371,450 @@ class AnchorPoint:
         return np.array([cls.LOVE, cls.POWER, cls.WISDOM, cls.JUSTICE])
 
 
+DISTANCE_METRICS = ('euclidean', 'phi_spiral', 'phi_harmony')
+
+
+def _anchor_distances(values: np.ndarray) -> np.ndarray:
+    """
+    Euclidean distance from every row of an (N, 4) block to the Anchor Point.
+
+    Args:
+        values: (N, 4) array of (L, P, W, J) coordinates
+
+    Returns:
+        (N,) array of distances
+    """
+    diff = 1.0 - values
+    return np.sqrt(np.einsum('ij,ij->i', diff, diff))
+
+
+def _coordinate_block(coordinates) -> np.ndarray:
+    """
+    Return the (N, 4) coordinate block for any supported collection.
+
+    Args:
+        coordinates: CoordinateArray, (N, 4) array or sequence of
+            SemanticCoordinate objects
+
+    Returns:
+        (N, 4) float array (a view where possible, never a copy of a
+        CoordinateArray)
+    """
+    if isinstance(coordinates, CoordinateArray):
+        return coordinates.values
+    if isinstance(coordinates, np.ndarray):
+        if coordinates.ndim != 2 or coordinates.shape[1] != 4:
+            raise ValueError(f"Coordinate block must have shape (N, 4), got {coordinates.shape}")
+        return coordinates
+    return np.array([c.coordinates for c in coordinates], dtype=np.float64).reshape(-1, 4)
+
+
+def _as_point(point) -> np.ndarray:
+    """Return a SemanticCoordinate or 4-vector as a float array of shape (4,)."""
+    if hasattr(point, 'coordinates'):
+        return np.array(point.coordinates, dtype=np.float64)
+    point = np.asarray(point, dtype=np.float64)
+    if point.shape != (4,):
+        raise ValueError(f"Point must have shape (4,), got {point.shape}")
+    return point
+
+
+class CoordinateArray:
+    """
+    Columnar (struct-of-arrays) collection of semantic coordinates.
+
+    Holds N concepts as one contiguous (N, 4) float block in (L, P, W, J)
+    order plus a concept-name column, so anchor metrics, filters and
+    statistics run as vectorized NumPy operations rather than one Python
+    call per SemanticCoordinate.
+
+    Attributes:
+        values: (N, 4) float array of coordinates
+        concepts: (N,) object array of concept names
+        sources: None, a single source string shared by every row, or an
+            (N,) object array of per-row sources
+    """
+
+    def __init__(self,
+                 values,
+                 concepts: Optional[Sequence[str]] = None,
+                 sources: Optional[Union[str, Sequence[Optional[str]]]] = None,
+                 validate: bool = True):
+        """
+        Initialize the array.
+
+        Args:
+            values: (N, 4) array-like of coordinates
+            concepts: Optional concept names (defaults to empty strings)
+            sources: Optional source, shared string or one per row
+            validate: Check that all values lie in [0.0, 1.0]
+        """
+        values = np.asarray(values)
+        if not np.issubdtype(values.dtype, np.floating):
+            values = values.astype(np.float64)
+        if values.size == 0:
+            values = values.reshape(0, 4)
+        if values.ndim != 2 or values.shape[1] != 4:
+            raise ValueError(f"values must have shape (N, 4), got {values.shape}")
+
+        n = len(values)
+        if validate and n and not ((values >= 0.0) & (values <= 1.0)).all():
+            raise ValueError("All dimensions must be in range [0.0, 1.0]")
+
+        if concepts is None:
+            concepts = np.full(n, '', dtype=object)
+        else:
+            concepts = np.asarray(concepts, dtype=object)
+            if concepts.shape != (n,):
+                raise ValueError(f"Expected {n} concept names, got {concepts.shape[0]}")
+
+        if sources is not None and not isinstance(sources, str):
+            sources = np.asarray(sources, dtype=object)
+            if sources.shape != (n,):
+                raise ValueError(f"Expected {n} sources, got {sources.shape[0]}")
+
+        self.values = values
+        self.concepts = concepts
+        self.sources = sources
+
+    @classmethod
+    def from_coordinates(cls, coordinates: Sequence[SemanticCoordinate]) -> 'CoordinateArray':
+        """
+        Build a CoordinateArray from a sequence of SemanticCoordinates.
+
+        Args:
+            coordinates: Sequence of semantic coordinates
+
+        Returns:
+            CoordinateArray holding the same concepts in the same order
+        """
+        coordinates = list(coordinates)
+        return cls(
+            _coordinate_block(coordinates),
+            concepts=[c.concept for c in coordinates],
+            sources=[c.source for c in coordinates],
+            validate=False
+        )
+
+    @classmethod
+    def concatenate(cls, arrays: Sequence['CoordinateArray']) -> 'CoordinateArray':
+        """
+        Concatenate several CoordinateArrays into one.
+
+        Args:
+            arrays: CoordinateArrays to join, in order
+
+        Returns:
+            Combined CoordinateArray
+        """
+        arrays = list(arrays)
+        if not arrays:
+            return cls(np.empty((0, 4)))
+
+        shared = arrays[0].sources
+        if isinstance(shared, str) and all(a.sources == shared for a in arrays):
+            sources = shared
+        elif all(a.sources is None for a in arrays):
+            sources = None
+        else:
+            sources = np.concatenate([a._source_column() for a in arrays])
+
+        return cls(
+            np.concatenate([a.values for a in arrays]),
+            concepts=np.concatenate([a.concepts for a in arrays]),
+            sources=sources,
+            validate=False
+        )
+
+    def _source_column(self) -> np.ndarray:
+        """Return sources as an (N,) object array."""
+        if self.sources is None or isinstance(self.sources, str):
+            return np.full(len(self), self.sources, dtype=object)
+        return self.sources
+
+    def _source_at(self, index: int) -> Optional[str]:
+        """Return the source of a single row."""
+        if self.sources is None or isinstance(self.sources, str):
+            return self.sources
+        return self.sources[index]
+
+    @property
+    def love(self) -> np.ndarray:
+        """Love column (view)."""
+        return self.values[:, 0]
+
+    @property
+    def power(self) -> np.ndarray:
+        """Power column (view)."""
+        return self.values[:, 1]
+
+    @property
+    def wisdom(self) -> np.ndarray:
+        """Wisdom column (view)."""
+        return self.values[:, 2]
+
+    @property
+    def justice(self) -> np.ndarray:
+        """Justice column (view)."""
+        return self.values[:, 3]
+
+    def distance_to_anchor(self) -> np.ndarray:
+        """
+        Calculate Euclidean distance of every concept to the Anchor Point.
+
+        Returns:
+            (N,) array of distances
+        """
+        return _anchor_distances(self.values)
+
+    def similarity_to_anchor(self) -> np.ndarray:
+        """
+        Calculate similarity to the Anchor Point for every concept.
+
+        Returns:
+            (N,) array of scores, 1.0 = perfect alignment, 0.0 = maximum distance
+        """
+        max_distance = 2.0  # Maximum possible distance in unit hypercube
+        return 1.0 - (self.distance_to_anchor() / max_distance)
+
+    def phi_distance_to_anchor(self) -> np.ndarray:
+        """
+        Calculate phi-geometric (golden spiral) distance of every concept to
+        the Anchor Point.
+
+        Values are identical to SemanticCoordinate.phi_distance_to_anchor().
+        Falls back to Euclidean if the phi_geometric module is unavailable.
+
+        Returns:
+            (N,) array of golden spiral distances
+        """
+        if not PHI_GEOMETRIC_AVAILABLE:
+            # Graceful fallback to Euclidean
+            return self.distance_to_anchor()
+
+        return golden_spiral_distance_pairs(self.values, AnchorPoint.as_vector())
+
+    def nearest_dodecahedral_anchor(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the nearest dodecahedral anchor for every concept.
+
+        Matches SemanticCoordinate.nearest_dodecahedral_anchor() row by row,
+        computed in one vectorized pass.
+
+        Returns:
+            Tuple of (indices, distances), each (N,); index 0 is the primary
+            Anchor Point at (1,1,1,1)
+        """
+        if not PHI_GEOMETRIC_AVAILABLE:
+            # Fallback: just return distance to primary anchor
+            return np.zeros(len(self), dtype=np.intp), self.distance_to_anchor()
+
+        return nearest_anchor_batch(self.values, metric='phi_spiral')
+
+    def distance_metrics(self, metrics: Sequence[str] = DISTANCE_METRICS,
+                         as_frame: bool = False):
+        """
+        Calculate several distance metrics to the Anchor Point at once.
+
+        See distance_metrics_batch(); a DataFrame is indexed by concept.
+
+        Args:
+            metrics: Metric names to compute
+            as_frame: Return a pandas DataFrame instead of a structured array
+
+        Returns:
+            Structured array or DataFrame with one column per metric
+        """
+        return distance_metrics_batch(self, metrics=metrics, as_frame=as_frame)
+
+    def distance_to(self, other) -> np.ndarray:
+        """
+        Calculate Euclidean distance to a point or row-wise to another block.
+
+        Args:
+            other: SemanticCoordinate or 4-vector (distance of every row to
+                that point), or a CoordinateArray / (N, 4) array of the same
+                length (distance between corresponding rows)
+
+        Returns:
+            (N,) array of distances
+        """
+        if isinstance(other, CoordinateArray) or (isinstance(other, np.ndarray) and other.ndim == 2):
+            other = _coordinate_block(other)
+            if len(other) != len(self):
+                raise ValueError(f"Length mismatch: {len(self)} vs {len(other)}")
+        else:
+            other = _as_point(other)
+
+        diff = self.values - other
+        return np.sqrt(np.einsum('ij,ij->i', diff, diff))
+
+    def to_coordinates(self, compact: bool = False) -> List[SemanticCoordinate]:
+        """
+        Convert back to a list of SemanticCoordinate objects.
+
+        Args:
+            compact: Build CompactSemanticCoordinates instead, which use far
+                less memory for very large lists
+
+        Returns:
+            List of SemanticCoordinates in row order
+        """
+        cls = CompactSemanticCoordinate if compact else SemanticCoordinate
+        sources = self._source_column().tolist()
+        return [
+            cls(concept, love, power, wisdom, justice, source)
+            for concept, (love, power, wisdom, justice), source
+            in zip(self.concepts.tolist(), self.values.tolist(), sources)
+        ]
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def __iter__(self) -> Iterator[SemanticCoordinate]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def __getitem__(self, key):
+        """
+        Index a single concept or select a sub-array.
+
+        Integer keys return a SemanticCoordinate; slices, boolean masks and
+        integer index arrays return a CoordinateArray (slices are views).
+        """
+        if isinstance(key, (int, np.integer)):
+            love, power, wisdom, justice = self.values[key].tolist()
+            return SemanticCoordinate(
+                concept=self.concepts[key],
+                love=love,
+                power=power,
+                wisdom=wisdom,
+                justice=justice,
+                source=self._source_at(key)
+            )
+
+        sources = self.sources
+        if sources is not None and not isinstance(sources, str):
+            sources = sources[key]
+
+        return CoordinateArray(
+            self.values[key],
+            concepts=self.concepts[key],
+            sources=sources,
+            validate=False
+        )
+
+    def __repr__(self) -> str:
+        return f"CoordinateArray(n={len(self)}, dtype={self.values.dtype})"
+
+
+def _hash_concepts(concepts: Sequence[str], hash_algorithm: str) -> bytes:
+    """
+    Hash every concept name and return the concatenated digests.
+
+    Args:
+        concepts: Concept names
+        hash_algorithm: hashlib algorithm name
+
+    Returns:
+        Digests of all concepts joined into one bytes object
+    """
+    constructor = getattr(hashlib, hash_algorithm, None)
+    if constructor is None:
+        return b''.join(hashlib.new(hash_algorithm, c.encode('utf-8')).digest()
+                        for c in concepts)
+    return b''.join(constructor(c.encode('utf-8')).digest() for c in concepts)
+
+
+def _decode_digests(digests: bytes, digest_size: int) -> np.ndarray:
+    """
+    Decode concatenated digests into an (N, 4) block of unit floats.
+
+    Produces exactly the values of HashBasedCoordinateGenerator.generate,
+    i.e. the correctly rounded ``int.from_bytes(segment) / (2**bits - 1)``
+    for each of the 4 segments, but decodes with ``np.frombuffer`` instead
+    of per-segment Python integers.
+
+    Segments of up to 53 bits are converted and divided directly in float64.
+    Wider segments are rounded from their top 64 bits: dividing by
+    ``2**bits - 1`` instead of ``2**bits`` only nudges the value upwards by
+    less than one unit of the segment, so the correctly rounded result is
+    the top 53 significant bits rounded half-up. The rare rows whose top 64
+    bits have fewer than 54 significant bits (about 1 in 2048) fall back to
+    exact integer division when the segment is wider than 64 bits.
+
+    Args:
+        digests: Concatenated raw digests
+        digest_size: Size of a single digest in bytes
+
+    Returns:
+        (N, 4) float64 array
+    """
+    segment_size = digest_size // 4
+    bits = 8 * segment_size
+    raw = np.frombuffer(digests, dtype=np.uint8).reshape(-1, digest_size)
+    n = len(raw)
+    segments = raw[:, :4 * segment_size].reshape(n, 4, segment_size)
+
+    # Top (at most) 64 bits of every segment, left-aligned in a uint64
+    top = np.zeros((n, 4, 8), dtype=np.uint8)
+    top[:, :, :min(segment_size, 8)] = segments[:, :, :8]
+    top = top.view('>u8').reshape(n, 4).astype(np.uint64)
+
+    if bits <= 53:
+        exact = top >> np.uint64(64 - bits)
+        return exact.astype(np.float64) / float(2 ** bits - 1)
+
+    # Significant bit length of each top word (frexp may overshoot by one
+    # when the float conversion rounds up to a power of two)
+    _, bit_length = np.frexp(top.astype(np.float64))
+    bit_length = bit_length.astype(np.int64)
+    overshoot = (top >> np.maximum(bit_length - 1, 0).astype(np.uint64)) == 0
+    bit_length = np.where(overshoot & (top > 0), bit_length - 1, bit_length)
+
+    wide = bit_length > 53
+    shift = np.where(wide, bit_length - 53, 1).astype(np.uint64)
+    mantissa = top >> shift
+    dropped = top & ((np.uint64(1) << shift) - np.uint64(1))
+    mantissa = mantissa + (dropped >= (np.uint64(1) << (shift - np.uint64(1)))).astype(np.uint64)
+    rounded = np.ldexp(mantissa.astype(np.float64), shift.astype(np.int64) - 64)
+
+    result = np.where(wide, rounded, np.ldexp(top.astype(np.float64), -64))
+
+    if segment_size > 8:
+        # Narrow top words do not fix all 53 bits; use exact division
+        denominator = 2 ** bits - 1
+        for row, dim in zip(*np.nonzero(~wide)):
+            value = int.from_bytes(segments[row, dim].tobytes(), 'big')
+            result[row, dim] = value / denominator
+
+    return result
+
+
+def _hash_chunk_into_shared(shm_name: str, n: int, start: int,
+                            concepts: List[str], hash_algorithm: str):
+    """
+    Process-pool worker: hash a chunk and write it into shared memory.
+
+    Args:
+        shm_name: Name of the shared (n, 4) float64 block
+        n: Total number of rows in the block
+        start: First row of this chunk
+        concepts: Concept names of this chunk
+        hash_algorithm: hashlib algorithm name
+    """
+    digest_size = hashlib.new(hash_algorithm).digest_size
+    values = _decode_digests(_hash_concepts(concepts, hash_algorithm), digest_size)
+
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        block = np.ndarray((n, 4), dtype=np.float64, buffer=shm.buf)
+        block[start:start + len(concepts)] = values
+        del block
+    finally:
+        shm.close()
+
+
 class HashBasedCoordinateGenerator:
     """
     Generates semantic coordinates from concept names using hash functions.
@@ -276,55 +870,380 @@ class HashBasedCoordinateGenerator:
             source=f"hash_{self.hash_algorithm}"
         )
 
+    def generate_many(self,
+                      concepts,
+                      workers: int = 1,
+                      chunk_size: int = 100_000) -> CoordinateArray:
+        """
+        Generate coordinates for many concepts as a columnar block.
+
+        Produces exactly the same values as calling generate() per concept,
+        but decodes digests with NumPy and skips per-concept dataclass
+        construction. With workers > 1, chunks are hashed in a process pool
+        and written straight into a shared-memory block.
+
+        Args:
+            concepts: Iterable of concept names
+            workers: Number of worker processes (1 = hash in this process)
+            chunk_size: Number of concepts per chunk handed to a worker
+
+        Returns:
+            CoordinateArray with hash-derived coordinates
+        """
+        concepts = list(concepts)
+        n = len(concepts)
+        source = f"hash_{self.hash_algorithm}"
+        digest_size = hashlib.new(self.hash_algorithm).digest_size
+
+        if workers <= 1 or n <= chunk_size:
+            values = _decode_digests(_hash_concepts(concepts, self.hash_algorithm), digest_size)
+            return CoordinateArray(values, concepts=concepts, sources=source, validate=False)
+
+        shm = shared_memory.SharedMemory(create=True, size=n * 4 * 8)
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                futures = [
+                    pool.submit(_hash_chunk_into_shared, shm.name, n, start,
+                                concepts[start:start + chunk_size], self.hash_algorithm)
+                    for start in range(0, n, chunk_size)
+                ]
+                for future in futures:
+                    future.result()
+
+            block = np.ndarray((n, 4), dtype=np.float64, buffer=shm.buf)
+            values = block.copy()
+            del block
+        finally:
+            shm.close()
+            shm.unlink()
+
+        return CoordinateArray(values, concepts=concepts, sources=source, validate=False)
+
+
+def _distance_tile(a: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Euclidean distances between every row of a and every row of b.
+
+    Squared differences are accumulated one dimension at a time over the
+    whole tile, which for 4 dimensions is both faster and more accurate
+    than the ``|a|^2 + |b|^2 - 2ab`` matrix-product expansion.
+
+    Args:
+        a: (n, 4) block
+        b: (m, 4) block
+
+    Returns:
+        (n, m) float64 distance tile
+    """
+    a = np.asarray(a, dtype=np.float64)
+    b = np.asarray(b, dtype=np.float64)
+    diff = np.subtract.outer(a[:, 0], b[:, 0])
+    tile = diff * diff
+    for k in range(1, 4):
+        np.subtract.outer(a[:, k], b[:, k], out=diff)
+        diff *= diff
+        tile += diff
+    return np.sqrt(tile, out=tile)
+
+
+def iter_pairwise_distance_blocks(coordinates,
+                                  other=None,
+                                  block_size: int = 2048,
+                                  dtype=np.float64) -> Iterator[Tuple[int, int, np.ndarray]]:
+    """
+    Yield the pairwise distance matrix tile by tile.
+
+    Memory use is bounded by one block_size x block_size tile, so callers
+    can reduce over all pairs (histograms, thresholds, nearest pairs)
+    without ever materializing the full matrix.
 
-def calculate_pairwise_distances(coordinates: List[SemanticCoordinate]) -> np.ndarray:
+    Args:
+        coordinates: List of semantic coordinates, CoordinateArray or (N, 4) array
+        other: Optional second collection (M concepts). If omitted, the
+            matrix is symmetric and only tiles on or above the diagonal
+            are yielded (diagonal tiles are yielded in full).
+        block_size: Rows and columns per tile
+        dtype: dtype of the yielded tiles
+
+    Yields:
+        Tuples of (row_start, col_start, tile) where tile[r, c] is the
+        distance between row row_start + r and column col_start + c
+    """
+    a = _coordinate_block(coordinates)
+    symmetric = other is None
+    b = a if symmetric else _coordinate_block(other)
+
+    for row_start in range(0, len(a), block_size):
+        rows = a[row_start:row_start + block_size]
+        first_col = row_start if symmetric else 0
+        for col_start in range(first_col, len(b), block_size):
+            tile = _distance_tile(rows, b[col_start:col_start + block_size])
+            yield row_start, col_start, tile.astype(dtype, copy=False)
+
+
+def condensed_index(i: int, j: int, n: int) -> int:
+    """
+    Position of pair (i, j), i < j, in a condensed distance vector.
+
+    Uses the same row-major upper-triangle layout as scipy's pdist.
+
+    Args:
+        i: Row index
+        j: Column index (greater than i)
+        n: Number of concepts
+
+    Returns:
+        Index into the condensed vector
+    """
+    return n * i - i * (i + 1) // 2 + (j - i - 1)
+
+
+def _output_array(shape, dtype, memmap_path: Optional[str]) -> np.ndarray:
+    """Allocate an in-memory array or a disk-backed np.memmap."""
+    if memmap_path is None:
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(memmap_path, dtype=dtype, mode='w+', shape=shape)
+
+
+def pairwise_distances_condensed(coordinates,
+                                 dtype=np.float32,
+                                 block_size: int = 2048,
+                                 memmap_path: Optional[str] = None) -> np.ndarray:
+    """
+    Calculate the condensed (upper-triangle) pairwise distance vector.
+
+    Stores each of the N(N-1)/2 distances once, by default as float32,
+    i.e. an eighth of the dense float64 matrix. With memmap_path the
+    result is written to an np.memmap on disk instead of RAM.
+
+    Args:
+        coordinates: List of semantic coordinates, CoordinateArray or (N, 4) array
+        dtype: Output dtype
+        block_size: Rows and columns per computed tile
+        memmap_path: Optional file to back the output array
+
+    Returns:
+        Condensed distance vector (see condensed_index for the layout)
+    """
+    values = _coordinate_block(coordinates)
+    n = len(values)
+    out = _output_array((n * (n - 1) // 2,), dtype, memmap_path)
+
+    for row_start, col_start, tile in iter_pairwise_distance_blocks(values, block_size=block_size, dtype=dtype):
+        col_end = col_start + tile.shape[1]
+        for r in range(tile.shape[0]):
+            i = row_start + r
+            first = max(col_start, i + 1)
+            if first >= col_end:
+                continue
+            offset = condensed_index(i, first, n)
+            out[offset:offset + col_end - first] = tile[r, first - col_start:]
+
+    if isinstance(out, np.memmap):
+        out.flush()
+    return out
+
+
+def calculate_pairwise_distances(coordinates,
+                                 dtype=np.float64,
+                                 block_size: int = 2048,
+                                 memmap_path: Optional[str] = None) -> np.ndarray:
     """
     Calculate pairwise distance matrix for a list of semantic coordinates.
 
+    Computed tile by tile; prefer pairwise_distances_condensed or
+    iter_pairwise_distance_blocks when N is large.
+
     Args:
-        coordinates: List of semantic coordinates
+        coordinates: List of semantic coordinates, CoordinateArray or (N, 4) array
+        dtype: Output dtype
+        block_size: Rows and columns per computed tile
+        memmap_path: Optional file to back the output matrix
 
     Returns:
         NxN matrix of pairwise distances
     """
-    n = len(coordinates)
-    distances = np.zeros((n, n))
+    values = _coordinate_block(coordinates)
+    n = len(values)
+    distances = _output_array((n, n), dtype, memmap_path)
+
+    for row_start, col_start, tile in iter_pairwise_distance_blocks(values, block_size=block_size, dtype=dtype):
+        row_end = row_start + tile.shape[0]
+        col_end = col_start + tile.shape[1]
+        distances[row_start:row_end, col_start:col_end] = tile
+        if col_start != row_start:
+            distances[col_start:col_end, row_start:row_end] = tile.T
+
+    if isinstance(distances, np.memmap):
+        distances.flush()
+    return distances
 
-    for i in range(n):
-        for j in range(i+1, n):
-            dist = coordinates[i].distance_to(coordinates[j])
-            distances[i, j] = dist
-            distances[j, i] = dist
 
-    return distances
+def top_k_indices(scores, k: int, largest: bool = False) -> np.ndarray:
+    """
+    Indices of the k smallest (or largest) scores, in sorted order.
+
+    Runs in O(N) using np.argpartition and only sorts the selected
+    candidates. The result is exactly a slice of a stable ascending sort:
+    the first k for the smallest (ties in input order), the last k
+    reversed for the largest (ties latest first). Scores are never
+    negated, so unsigned integer scores work too.
+
+    Args:
+        scores: (N,) array of scores
+        k: Number of indices to return
+        largest: Select the largest scores instead of the smallest
+
+    Returns:
+        (min(k, N),) array of indices
+    """
+    scores = np.asarray(scores)
+    n = len(scores)
+    k = max(0, min(k, n))
+    if k == 0:
+        return np.empty(0, dtype=np.intp)
+
+    if k == n:
+        candidates = np.arange(n)
+    elif largest:
+        kth = scores[np.argpartition(scores, n - k)[n - k]]
+        candidates = np.flatnonzero(scores >= kth)
+    else:
+        kth = scores[np.argpartition(scores, k - 1)[k - 1]]
+        candidates = np.flatnonzero(scores <= kth)
+
+    order = np.argsort(scores[candidates], kind='stable')
+    if largest:
+        order = order[::-1]
+    return candidates[order[:k]]
+
+
+def _metric_scores(values: np.ndarray, target: Optional[np.ndarray], metric) -> np.ndarray:
+    """
+    Distances from every row of an (N, 4) block to a target point.
+
+    Args:
+        values: (N, 4) block of coordinates
+        target: (4,) target point, or None for the Anchor Point
+        metric: 'euclidean', 'phi_spiral' or a callable
+            ``metric(values, target) -> (N,) scores``
+
+    Returns:
+        (N,) array of distances
+    """
+    if target is None:
+        target = AnchorPoint.as_vector()
+
+    if callable(metric):
+        return np.asarray(metric(values, target))
+    if metric == 'euclidean':
+        diff = values - target
+        return np.sqrt(np.einsum('ij,ij->i', diff, diff))
+    if metric == 'phi_spiral':
+        if not PHI_GEOMETRIC_AVAILABLE:
+            # Graceful fallback to Euclidean
+            return _metric_scores(values, target, 'euclidean')
+        return golden_spiral_distance_pairs(values, target)
+    raise ValueError(f"Unknown metric: {metric}")
+
 
+def _point_of(item) -> Tuple[float, float, float, float]:
+    """Return the (L, P, W, J) tuple of a coordinate object or raw 4-sequence."""
+    return item.coordinates if hasattr(item, 'coordinates') else tuple(item)
 
-def find_closest_to_anchor(coordinates: List[SemanticCoordinate], n: int = 10) -> List[SemanticCoordinate]:
+
+def find_top_k(coordinates,
+               k: int = 10,
+               target=None,
+               metric='euclidean',
+               farthest: bool = False):
+    """
+    Select the k concepts closest to (or farthest from) a target point.
+
+    Sized inputs are scored in one vectorized pass and selected with
+    np.argpartition in O(N). Any other iterable (generators, database
+    cursors) is consumed once through a bounded heap that holds only k
+    items, so the input never has to fit in memory.
+
+    Args:
+        coordinates: CoordinateArray, (N, 4) array, list of semantic
+            coordinates, or any iterable of coordinates
+        k: Number of concepts to select
+        target: Target point (SemanticCoordinate or 4-vector); defaults to
+            the Anchor Point
+        metric: 'euclidean', 'phi_spiral' or a callable
+            ``metric(values, target) -> (N,) scores``
+        farthest: Select the farthest concepts instead of the closest
+
+    Returns:
+        Tuple of (selection, distances) ordered by distance. The selection
+        is a CoordinateArray for CoordinateArray input, an index array for
+        (N, 4) array input, and a list of items otherwise.
+    """
+    target = None if target is None else _as_point(target)
+
+    if isinstance(coordinates, (CoordinateArray, np.ndarray, list, tuple)):
+        values = _coordinate_block(coordinates)
+        scores = _metric_scores(values, target, metric)
+        indices = top_k_indices(scores, k, largest=farthest)
+
+        if isinstance(coordinates, CoordinateArray):
+            selection = coordinates[indices]
+        elif isinstance(coordinates, np.ndarray):
+            selection = indices
+        else:
+            selection = [coordinates[i] for i in indices]
+        return selection, scores[indices]
+
+    # Streaming path: bounded heap over (score, item) pairs
+    point = AnchorPoint.as_vector() if target is None else target
+    if metric == 'euclidean':
+        tl, tp, tw, tj = point.tolist()
+
+        def score(item):
+            l, p, w, j = _point_of(item)
+            return math.sqrt((l - tl) ** 2 + (p - tp) ** 2 + (w - tw) ** 2 + (j - tj) ** 2)
+    else:
+        def score(item):
+            return float(_metric_scores(np.array([_point_of(item)], dtype=np.float64), point, metric)[0])
+
+    # Position breaks ties the way top_k_indices() does (latest first when farthest)
+    select = heapq.nlargest if farthest else heapq.nsmallest
+    scored = select(k, ((score(item), i, item) for i, item in enumerate(coordinates)),
+                    key=lambda entry: entry[:2])
+    return [item for _, _, item in scored], np.array([d for d, _, _ in scored], dtype=np.float64)
+
+
+def find_closest_to_anchor(coordinates, n: int = 10):
     """
     Find the n concepts closest to the Universal Anchor Point.
 
     Args:
-        coordinates: List of semantic coordinates
+        coordinates: List of semantic coordinates, a CoordinateArray or
+            any iterable of coordinates
         n: Number of top concepts to return
 
     Returns:
-        List of n closest concepts, sorted by distance
+        The n closest concepts sorted by distance, as a list (or a
+        CoordinateArray when given one)
     """
-    sorted_coords = sorted(coordinates, key=lambda c: c.distance_to_anchor())
-    return sorted_coords[:n]
+    closest, _ = find_top_k(coordinates, k=n)
+    return closest
 
 
-def calculate_statistics(coordinates: List[SemanticCoordinate]) -> Dict[str, float]:
+def calculate_statistics(coordinates) -> Dict[str, float]:
     """
     Calculate statistical measures for a collection of semantic coordinates.
 
     Args:
-        coordinates: List of semantic coordinates
+        coordinates: List of semantic coordinates or a CoordinateArray
 
     Returns:
         Dictionary of statistics
     """
-    distances = [c.distance_to_anchor() for c in coordinates]
+    values = _coordinate_block(coordinates)
+    distances = _anchor_distances(values)
+    means = values.mean(axis=0)
 
     return {
         'mean_distance': np.mean(distances),
@@ -332,8 +1251,70 @@ def calculate_statistics(coordinates: List[SemanticCoordinate]) -> Dict[str, flo
         'std_distance': np.std(distances),
         'min_distance': np.min(distances),
         'max_distance': np.max(distances),
-        'mean_love': np.mean([c.love for c in coordinates]),
-        'mean_power': np.mean([c.power for c in coordinates]),
-        'mean_wisdom': np.mean([c.wisdom for c in coordinates]),
-        'mean_justice': np.mean([c.justice for c in coordinates]),
+        'mean_love': means[0],
+        'mean_power': means[1],
+        'mean_wisdom': means[2],
+        'mean_justice': means[3],
     }
+
+
+def distance_metrics_batch(coordinates,
+                           metrics: Sequence[str] = DISTANCE_METRICS,
+                           as_frame: bool = False,
+                           chunk_size: int = 65536):
+    """
+    Array-level SemanticCoordinate.distance_metrics() in one fused pass.
+
+    Every enabled metric is computed chunk by chunk while the chunk is
+    still in cache, and written straight into the output columns. The
+    phi metrics are skipped (as in distance_metrics()) when the
+    phi_geometric module is unavailable.
+
+    Args:
+        coordinates: CoordinateArray, (N, 4) array or iterable of coordinates
+        metrics: Any of 'euclidean', 'phi_spiral', 'phi_harmony', each at
+            most once
+        as_frame: Return a pandas DataFrame instead of a structured array
+        chunk_size: Rows processed per pass
+
+    Returns:
+        (N,) structured array with one float64 field per metric, or a
+        DataFrame with one column per metric (indexed by concept when known)
+    """
+    metrics = list(metrics)
+    unknown = [m for m in metrics if m not in DISTANCE_METRICS]
+    if unknown:
+        raise ValueError(f"Unknown metric(s): {', '.join(unknown)}")
+    repeated = [m for m in DISTANCE_METRICS if metrics.count(m) > 1]
+    if repeated:
+        raise ValueError(f"Repeated metric(s): {', '.join(repeated)}")
+    if not PHI_GEOMETRIC_AVAILABLE:
+        metrics = [m for m in metrics if m == 'euclidean']
+
+    # Read other iterables once; generators cannot be re-read for the index
+    if not isinstance(coordinates, (CoordinateArray, np.ndarray)):
+        coordinates = CoordinateArray.from_coordinates(coordinates)
+
+    values = _coordinate_block(coordinates)
+    result = np.empty(len(values), dtype=[(m, np.float64) for m in metrics])
+    anchor = AnchorPoint.as_vector()
+
+    for start in range(0, len(values), chunk_size):
+        chunk = values[start:start + chunk_size]
+        rows = slice(start, start + len(chunk))
+        if 'euclidean' in metrics:
+            result['euclidean'][rows] = _anchor_distances(chunk)
+        if 'phi_spiral' in metrics:
+            result['phi_spiral'][rows] = golden_spiral_distance_pairs(chunk, anchor)
+        if 'phi_harmony' in metrics:
+            result['phi_harmony'][rows] = phi_harmony_score_batch(chunk)
+
+    if not as_frame:
+        return result
+
+    import pandas as pd
+
+    index = None
+    if isinstance(coordinates, CoordinateArray):
+        index = pd.Index(coordinates.concepts, name='concept')
+    return pd.DataFrame(result, index=index)
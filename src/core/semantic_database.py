@@ -7,34 +7,90 @@ Database system for storing and querying semantic coordinates.
 
 import sqlite3
 import json
-from typing import List, Optional, Dict, Tuple
+import struct
+import sys
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Dict, Sequence, Tuple
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
-from .semantic_coordinates import SemanticCoordinate, AnchorPoint
+from .semantic_coordinates import (
+    SemanticCoordinate, AnchorPoint, CoordinateArray, _anchor_distances, _as_point
+)
+from .sqlite_connections import ConnectionManager, SQLiteTuning
+
+
+# Packed (L, P, W, J) layout of the optional concepts.vector column
+_PACKED_VECTOR = struct.Struct('<4f')
+
+# Marks a concept name absent from the get_concept() cache
+_NOT_CACHED = object()
 
 
 class SemanticDatabase:
     """
     SQLite database for storing semantic coordinates and metadata.
+
+    Safe to share across threads: writes go through a single locked
+    connection, and each reading thread gets its own connection, so reads
+    run concurrently with each other and with ingestion (WAL mode).
     """
 
-    def __init__(self, db_path: str = "data/semantic_database.db"):
+    def __init__(self, db_path: str = "data/semantic_database.db",
+                 tuning: Optional[SQLiteTuning] = None,
+                 packed_vectors: bool = False, cache_size: int = 0):
         """
         Initialize the database.
 
         Args:
-            db_path: Path to the SQLite database file
+            db_path: Path to the SQLite database file (or ':memory:')
+            tuning: Optional pragma profile (defaults to SQLiteTuning())
+            packed_vectors: Add (and backfill) a float32 BLOB column holding
+                each concept's (L, P, W, J) for fast bulk loading. Once
+                added, the column is maintained on every later open.
+            cache_size: Concepts kept in an LRU cache in front of
+                get_concept() and get_concepts() (0 disables it). Cached
+                SemanticCoordinates are shared between callers, so treat
+                them as read-only. Writes through this object invalidate
+                the cache; writes by other processes are not seen.
         """
         self.db_path = Path(db_path)
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        self.conn = sqlite3.connect(str(self.db_path))
-        self._create_tables()
+        if str(db_path) != ':memory:':
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connections = ConnectionManager(str(self.db_path), tuning)
+
+        self.cache_size = max(0, int(cache_size))
+        self._cache: 'OrderedDict[str, Optional[SemanticCoordinate]]' = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # Bumped by every invalidation so a read that raced a write is not cached
+        self._cache_generation = 0
+
+        # INSERT OR REPLACE must fire DELETE triggers on the rows it replaces
+        self.conn.execute("PRAGMA recursive_triggers = ON")
+        self._create_tables(packed_vectors)
 
-    def _create_tables(self):
+    @property
+    def conn(self) -> sqlite3.Connection:
+        """The write connection (hold self._connections.write() to use it across threads)."""
+        return self._connections.writer
+
+    def _create_tables(self, packed_vectors: bool = False):
         """Create database tables if they don't exist."""
-        cursor = self.conn.cursor()
+        with self._connections.write() as conn:
+            self._create_schema(conn.cursor())
+            self.has_rtree = self._create_spatial_index(conn.cursor())
+            self.has_fts, self.has_trigram = self._create_text_index(conn.cursor())
+            self.packed_vectors = self._create_packed_vectors(conn.cursor(), packed_vectors)
+            self._create_statistics(conn.cursor())
 
+    def _create_schema(self, cursor: sqlite3.Cursor):
+        """Issue the CREATE statements on a write cursor."""
         # Main concepts table
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS concepts (
@@ -90,28 +146,337 @@ class SemanticDatabase:
             ON concepts(concept)
         """)
 
-        self.conn.commit()
+        # Measurement lookups by experiment (joins and ranking) and by concept
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_measurements_experiment
+            ON measurements(experiment_id, concept_id)
+        """)
 
-    def add_concept(self, coord: SemanticCoordinate, metadata: Optional[Dict] = None) -> int:
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_measurements_rank
+            ON measurements(experiment_id, distance_to_anchor)
+        """)
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_measurements_concept
+            ON measurements(concept_id)
+        """)
+
+    def _create_spatial_index(self, cursor: sqlite3.Cursor) -> bool:
         """
-        Add a semantic coordinate to the database.
+        Create the R*Tree over (L, P, W, J) and the triggers that sync it.
 
-        Args:
-            coord: SemanticCoordinate to add
-            metadata: Optional metadata dictionary
+        Existing concepts are indexed the first time the table is created.
 
         Returns:
-            ID of the inserted concept
+            True if the R*Tree is available, False if SQLite was built
+            without the rtree module (spatial queries then scan concepts)
         """
-        cursor = self.conn.cursor()
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'concepts_rtree'"
+        ).fetchone()
+
+        try:
+            cursor.execute("""
+                CREATE VIRTUAL TABLE IF NOT EXISTS concepts_rtree USING rtree(
+                    id,
+                    min_love, max_love,
+                    min_power, max_power,
+                    min_wisdom, max_wisdom,
+                    min_justice, max_justice
+                )
+            """)
+        except sqlite3.OperationalError:
+            return False
 
-        metadata_json = json.dumps(metadata) if metadata else None
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS concepts_rtree_insert
+            AFTER INSERT ON concepts BEGIN
+                INSERT INTO concepts_rtree VALUES (
+                    new.id, new.love, new.love, new.power, new.power,
+                    new.wisdom, new.wisdom, new.justice, new.justice
+                );
+            END
+        """)
 
         cursor.execute("""
-            INSERT OR REPLACE INTO concepts
-            (concept, love, power, wisdom, justice, distance_to_anchor, source, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+            CREATE TRIGGER IF NOT EXISTS concepts_rtree_update
+            AFTER UPDATE OF love, power, wisdom, justice ON concepts BEGIN
+                UPDATE concepts_rtree SET
+                    min_love = new.love, max_love = new.love,
+                    min_power = new.power, max_power = new.power,
+                    min_wisdom = new.wisdom, max_wisdom = new.wisdom,
+                    min_justice = new.justice, max_justice = new.justice
+                WHERE id = new.id;
+            END
+        """)
+
+        cursor.execute("""
+            CREATE TRIGGER IF NOT EXISTS concepts_rtree_delete
+            AFTER DELETE ON concepts BEGIN
+                DELETE FROM concepts_rtree WHERE id = old.id;
+            END
+        """)
+
+        if not exists:
+            cursor.execute("""
+                INSERT INTO concepts_rtree
+                SELECT id, love, love, power, power, wisdom, wisdom, justice, justice
+                FROM concepts
+            """)
+        return True
+
+    @staticmethod
+    def _create_fts_table(cursor: sqlite3.Cursor, name: str, columns: Sequence[str],
+                          options: str) -> bool:
+        """
+        Create an external-content FTS5 table over concepts with sync triggers.
+
+        Returns:
+            True if the table is available
+        """
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = ?", (name,)
+        ).fetchone()
+        try:
+            cursor.execute(f"""
+                CREATE VIRTUAL TABLE IF NOT EXISTS {name} USING fts5(
+                    {', '.join(columns)},
+                    content='concepts', content_rowid='id', {options}
+                )
+            """)
+        except sqlite3.OperationalError:
+            return False
+
+        names = ', '.join(columns)
+        new_values = ', '.join(f"new.{column}" for column in columns)
+        old_values = ', '.join(f"old.{column}" for column in columns)
+        insert = f"INSERT INTO {name}(rowid, {names}) VALUES (new.id, {new_values});"
+        delete = (f"INSERT INTO {name}({name}, rowid, {names}) "
+                  f"VALUES ('delete', old.id, {old_values});")
+
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {name}_insert
+            AFTER INSERT ON concepts BEGIN {insert} END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {name}_delete
+            AFTER DELETE ON concepts BEGIN {delete} END
+        """)
+        cursor.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS {name}_update
+            AFTER UPDATE OF {names} ON concepts BEGIN {delete} {insert} END
+        """)
+
+        if not exists:
+            cursor.execute(f"INSERT INTO {name}({name}) VALUES ('rebuild')")
+        return True
+
+    def _create_text_index(self, cursor: sqlite3.Cursor) -> Tuple[bool, bool]:
+        """
+        Create the full-text indexes over concepts.
+
+        concepts_fts tokenizes concept names and metadata (unicode61, with
+        2- and 3-character prefix indexes) for search_text(). concepts_trigram
+        indexes concept names by trigram so LIKE patterns, including leading
+        wildcards, are answered from the index (SQLite 3.34+).
+
+        Returns:
+            Tuple of (has_fts, has_trigram)
+        """
+        has_fts = self._create_fts_table(
+            cursor, 'concepts_fts', ('concept', 'metadata'),
+            "tokenize='unicode61', prefix='2 3'"
+        )
+        has_trigram = has_fts and self._create_fts_table(
+            cursor, 'concepts_trigram', ('concept',), "tokenize='trigram'"
+        )
+        return has_fts, has_trigram
+
+    # (scope, key expression, table) of every running aggregate in concept_stats
+    _STATS_SCOPES = (
+        ('all', "''", 'concepts'),
+        ('source', "COALESCE({row}.source, '')", 'concepts'),
+        ('experiment', "CAST({row}.experiment_id AS TEXT)", 'measurements'),
+    )
+
+    # Aggregates over a coordinate table, in concept_stats column order
+    _STATS_AGGREGATES = """
+        COUNT(*), TOTAL(distance_to_anchor), MIN(distance_to_anchor), MAX(distance_to_anchor),
+        TOTAL(love), TOTAL(power), TOTAL(wisdom), TOTAL(justice)
+    """
+
+    def _create_statistics(self, cursor: sqlite3.Cursor):
+        """
+        Create concept_stats and the triggers that keep it current.
+
+        Each row holds the count, sums, minimum and maximum for one scope:
+        the whole concepts table, one source, or one experiment's
+        measurements. Inserts add to the sums; deletes (including the
+        delete half of INSERT OR REPLACE) subtract from them. A delete that
+        removes the current minimum or maximum marks the row stale, and
+        that row's extremes are recomputed on the next read.
+        """
+        exists = cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'concept_stats'"
+        ).fetchone()
+
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS concept_stats (
+                scope TEXT NOT NULL,
+                key TEXT NOT NULL,
+                count INTEGER NOT NULL,
+                sum_distance REAL NOT NULL,
+                min_distance REAL,
+                max_distance REAL,
+                sum_love REAL NOT NULL,
+                sum_power REAL NOT NULL,
+                sum_wisdom REAL NOT NULL,
+                sum_justice REAL NOT NULL,
+                stale INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (scope, key)
+            )
+        """)
+
+        def add(scope, key):
+            return f"""
+                INSERT INTO concept_stats VALUES (
+                    '{scope}', {key.format(row='new')}, 1,
+                    new.distance_to_anchor, new.distance_to_anchor, new.distance_to_anchor,
+                    new.love, new.power, new.wisdom, new.justice, 0
+                )
+                ON CONFLICT(scope, key) DO UPDATE SET
+                    count = count + 1,
+                    sum_distance = sum_distance + excluded.sum_distance,
+                    min_distance = MIN(COALESCE(min_distance, excluded.min_distance),
+                                       excluded.min_distance),
+                    max_distance = MAX(COALESCE(max_distance, excluded.max_distance),
+                                       excluded.max_distance),
+                    sum_love = sum_love + excluded.sum_love,
+                    sum_power = sum_power + excluded.sum_power,
+                    sum_wisdom = sum_wisdom + excluded.sum_wisdom,
+                    sum_justice = sum_justice + excluded.sum_justice;
+            """
+
+        def remove(scope, key):
+            return f"""
+                UPDATE concept_stats SET
+                    count = count - 1,
+                    sum_distance = sum_distance - old.distance_to_anchor,
+                    sum_love = sum_love - old.love,
+                    sum_power = sum_power - old.power,
+                    sum_wisdom = sum_wisdom - old.wisdom,
+                    sum_justice = sum_justice - old.justice,
+                    stale = stale OR old.distance_to_anchor <= min_distance
+                                  OR old.distance_to_anchor >= max_distance
+                WHERE scope = '{scope}' AND key = {key.format(row='old')};
+            """
+
+        for table in ('concepts', 'measurements'):
+            scopes = [(scope, key) for scope, key, source in self._STATS_SCOPES if source == table]
+            inserts = ''.join(add(scope, key) for scope, key in scopes)
+            deletes = ''.join(remove(scope, key) for scope, key in scopes)
+            columns = 'love, power, wisdom, justice, distance_to_anchor'
+            columns += ', source' if table == 'concepts' else ', experiment_id'
+
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_stats_insert
+                AFTER INSERT ON {table} BEGIN {inserts} END
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_stats_delete
+                AFTER DELETE ON {table} BEGIN {deletes} END
+            """)
+            cursor.execute(f"""
+                CREATE TRIGGER IF NOT EXISTS {table}_stats_update
+                AFTER UPDATE OF {columns} ON {table} BEGIN {deletes} {inserts} END
+            """)
+
+        if not exists:
+            self._rebuild_statistics(cursor)
+
+    def _rebuild_statistics(self, cursor: sqlite3.Cursor):
+        """Recompute every concept_stats row from the base tables."""
+        cursor.execute("DELETE FROM concept_stats")
+        for scope, key, table in self._STATS_SCOPES:
+            key = key.format(row=table)
+            group = "" if scope == 'all' else f"GROUP BY {key}"
+            cursor.execute(f"""
+                INSERT INTO concept_stats
+                SELECT '{scope}', {key}, {self._STATS_AGGREGATES}, 0
+                FROM {table} {group}
+            """)
+
+    def refresh_statistics(self):
+        """
+        Rebuild all running aggregates from the base tables.
+
+        Needed only if rows were changed by a connection without
+        recursive_triggers (whose INSERT OR REPLACE skips delete triggers)
+        or to reset floating-point drift in the running sums.
+        """
+        with self._connections.write() as conn:
+            self._rebuild_statistics(conn.cursor())
+
+    def _create_packed_vectors(self, cursor: sqlite3.Cursor, create: bool,
+                               chunk_size: int = 50000) -> bool:
+        """
+        Add the packed vector column if requested and fill any missing vectors.
+
+        A partial index over rows without a vector makes the check on each
+        open instant, and picks up rows written by other tools.
+
+        Returns:
+            True if the concepts table has a vector column
+        """
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(concepts)")}
+        if 'vector' not in columns:
+            if not create:
+                return False
+            cursor.execute("ALTER TABLE concepts ADD COLUMN vector BLOB")
+
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_vector_missing
+            ON concepts(id) WHERE vector IS NULL
+        """)
+
+        while True:
+            rows = cursor.execute("""
+                SELECT id, love, power, wisdom, justice
+                FROM concepts WHERE vector IS NULL LIMIT ?
+            """, (chunk_size,)).fetchall()
+            if not rows:
+                return True
+            cursor.executemany(
+                "UPDATE concepts SET vector = ? WHERE id = ?",
+                [(_PACKED_VECTOR.pack(*row[1:]), row[0]) for row in rows]
+            )
+
+    @contextmanager
+    def batch(self) -> Iterator['SemanticDatabase']:
+        """
+        Group writes into a single transaction.
+
+        Inside the block, add_concept, add_measurement and the other write
+        methods defer their commits; everything is committed once when the
+        block exits, or rolled back if it raises. Blocks may nest. The
+        calling thread sees its own uncommitted writes; other threads see
+        them after the commit.
+
+        Yields:
+            This database
+        """
+        try:
+            with self._connections.write():
+                yield self
+        finally:
+            # Reads inside the block may have cached rows that were then
+            # rolled back, or that other threads saw before the commit
+            self._invalidate()
+
+    def _concept_row(self, coord: SemanticCoordinate, metadata: Optional[Dict] = None) -> Tuple:
+        """Column values for _insert_concepts_sql(), in column order."""
+        row = (
             coord.concept,
             coord.love,
             coord.power,
@@ -119,38 +484,307 @@ class SemanticDatabase:
             coord.justice,
             coord.distance_to_anchor(),
             coord.source,
-            metadata_json
-        ))
+            json.dumps(metadata) if metadata else None
+        )
+        if self.packed_vectors:
+            row += (_PACKED_VECTOR.pack(coord.love, coord.power, coord.wisdom, coord.justice),)
+        return row
 
-        self.conn.commit()
-        return cursor.lastrowid
+    def _insert_concepts_sql(self, upsert: bool = False, update_metadata: bool = False) -> str:
+        """
+        INSERT statement for rows built by _concept_row().
+
+        Args:
+            upsert: Update existing concepts in place (keeping their id and
+                metadata) instead of replacing them
+            update_metadata: With upsert, overwrite the metadata as well
+
+        Returns:
+            SQL string
+        """
+        columns = ['concept', 'love', 'power', 'wisdom', 'justice',
+                   'distance_to_anchor', 'source', 'metadata']
+        if self.packed_vectors:
+            columns.append('vector')
+        placeholders = ', '.join('?' * len(columns))
+
+        if not upsert:
+            return f"INSERT OR REPLACE INTO concepts ({', '.join(columns)}) VALUES ({placeholders})"
+
+        updates = ', '.join(
+            f"{column} = excluded.{column}"
+            for column in columns
+            if column != 'concept' and (update_metadata or column != 'metadata')
+        )
+        return (f"INSERT INTO concepts ({', '.join(columns)}) VALUES ({placeholders}) "
+                f"ON CONFLICT(concept) DO UPDATE SET {updates}")
+
+    def _upsert_concept(self, conn, coord: SemanticCoordinate, metadata: Optional[Dict] = None,
+                        update_metadata: bool = True) -> int:
+        """Insert or update one concept in place and return its (unchanged) id."""
+        conn.execute(self._insert_concepts_sql(upsert=True, update_metadata=update_metadata),
+                     self._concept_row(coord, metadata))
+        return conn.execute("SELECT id FROM concepts WHERE concept = ?",
+                            (coord.concept,)).fetchone()[0]
+
+    def add_concept(self, coord: SemanticCoordinate, metadata: Optional[Dict] = None) -> int:
+        """
+        Add a semantic coordinate to the database.
+
+        An existing concept is updated in place, so it keeps its id and
+        the measurements that refer to it.
+
+        Args:
+            coord: SemanticCoordinate to add
+            metadata: Optional metadata dictionary
+
+        Returns:
+            ID of the concept
+        """
+        with self._connections.write() as conn:
+            concept_id = self._upsert_concept(conn, coord, metadata)
+        self._invalidate([coord.concept])
+
+        return concept_id
 
     def add_concepts_bulk(self, coords: List[SemanticCoordinate]) -> int:
         """
         Add multiple concepts efficiently.
 
+        Existing concepts are updated in place, keeping their ids (and so
+        their measurements), as in add_concept().
+
         Args:
             coords: List of SemanticCoordinates
 
         Returns:
             Number of concepts added
         """
-        cursor = self.conn.cursor()
+        data = [self._concept_row(c) for c in coords]
+
+        with self._connections.write() as conn:
+            conn.executemany(self._insert_concepts_sql(upsert=True, update_metadata=True), data)
+        self._invalidate(row[0] for row in data)
+
+        return len(coords)
+
+    # Structures maintained by triggers, dropped and rebuilt around load_file()
+    _DERIVED_TABLES = ('concepts_rtree', 'concepts_fts', 'concepts_trigram', 'concept_stats')
+    _LOAD_INDEXES = ('idx_distance', 'idx_concept')
+
+    # File suffixes recognised by load_file()
+    _FILE_FORMATS = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
 
-        data = [
-            (c.concept, c.love, c.power, c.wisdom, c.justice,
-             c.distance_to_anchor(), c.source, None)
-            for c in coords
+    def _drop_derived(self, cursor: sqlite3.Cursor):
+        """Drop secondary indexes, sync triggers and the tables they maintain."""
+        triggers = [row[0] for row in cursor.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type = 'trigger' AND tbl_name IN ('concepts', 'measurements')
+        """)]
+        for name in triggers:
+            cursor.execute(f"DROP TRIGGER IF EXISTS {name}")
+        for name in self._DERIVED_TABLES:
+            cursor.execute(f"DROP TABLE IF EXISTS {name}")
+        for name in self._LOAD_INDEXES:
+            cursor.execute(f"DROP INDEX IF EXISTS {name}")
+
+    def _rebuild_derived(self, cursor: sqlite3.Cursor):
+        """Recreate everything _drop_derived() removed, backfilled from concepts."""
+        self._create_schema(cursor)
+        self.has_rtree = self._create_spatial_index(cursor)
+        self.has_fts, self.has_trigram = self._create_text_index(cursor)
+        self._create_statistics(cursor)
+
+    def _file_rows(self, chunk: pd.DataFrame, source: Optional[str],
+                   on_error: str) -> Tuple[List[Tuple], int]:
+        """
+        Validate one parsed chunk and build its rows for _insert_concepts_sql().
+
+        Returns:
+            Tuple of (rows, number of invalid rows skipped)
+        """
+        dimensions = ['love', 'power', 'wisdom', 'justice']
+        missing = [c for c in ['concept'] + dimensions if c not in chunk.columns]
+        if missing:
+            raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+        values = chunk[dimensions].apply(pd.to_numeric, errors='coerce').to_numpy(dtype=np.float64)
+        concepts = chunk['concept']
+        named = (concepts.notna() & (concepts.astype(str).str.len() > 0)).to_numpy()
+        valid = named & ((values >= 0.0) & (values <= 1.0)).all(axis=1)
+
+        skipped = int(len(valid) - np.count_nonzero(valid))
+        if skipped:
+            if on_error == 'raise':
+                row = chunk.index[np.argmin(valid)]
+                raise ValueError(
+                    f"Invalid row {row}: concept must be non-empty and "
+                    f"coordinates numbers in [0, 1]"
+                )
+            chunk, values = chunk[valid], values[valid]
+
+        def text(column, default=None):
+            if column not in chunk.columns:
+                return [default] * len(chunk)
+            return [
+                default if v is None or v == '' or (isinstance(v, float) and np.isnan(v))
+                else v if isinstance(v, str) else json.dumps(v)
+                for v in chunk[column].tolist()
+            ]
+
+        columns = [
+            chunk['concept'].astype(str).tolist(),
+            *values.T.tolist(),
+            _anchor_distances(values).tolist(),
+            text('source', source),
+            text('metadata'),
         ]
+        if self.packed_vectors:
+            columns.append([vector.tobytes() for vector in values.astype('<f4')])
+        return list(zip(*columns)), skipped
+
+    def load_file(self, path, format: Optional[str] = None, chunk_size: int = 100000,
+                  source: Optional[str] = None, on_error: str = 'raise',
+                  rebuild_indexes: bool = True) -> Dict:
+        """
+        Bulk-load concepts from a CSV or JSON Lines file.
 
-        cursor.executemany("""
-            INSERT OR REPLACE INTO concepts
-            (concept, love, power, wisdom, justice, distance_to_anchor, source, metadata)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-        """, data)
+        The file is parsed in chunks of chunk_size rows by pandas, each
+        chunk is validated with vectorized range checks and inserted with
+        executemany in its own transaction. With rebuild_indexes, the
+        secondary indexes and trigger-maintained structures (R*Tree,
+        full-text indexes, running statistics) are dropped for the load and
+        rebuilt from concepts in one pass afterwards, which is much faster
+        than updating them row by row. While they are dropped, other
+        threads' spatial and text searches fail; for small appends to a
+        large database, pass rebuild_indexes=False instead.
 
-        self.conn.commit()
-        return len(coords)
+        Rows from chunks committed before an error stay loaded; call inside
+        batch() to make the whole load all-or-nothing.
+
+        Args:
+            path: File with columns concept, love, power, wisdom, justice and
+                optionally source and metadata (JSON text, or an object in
+                JSON Lines)
+            format: 'csv' or 'jsonl' (inferred from the suffix if omitted)
+            chunk_size: Rows parsed and committed per transaction
+            source: Source for rows without one
+            on_error: 'raise' on the first invalid row, or 'skip' invalid rows
+            rebuild_indexes: Drop and rebuild secondary indexes around the load
+
+        Returns:
+            Dictionary with rows loaded, rows skipped, total seconds,
+            seconds spent rebuilding indexes and rows_per_second
+        """
+        path = Path(path)
+        if format is None:
+            format = self._FILE_FORMATS.get(path.suffix.lower())
+            if format is None:
+                raise ValueError(f"Cannot infer format from {path.name}; pass format=")
+        if format not in ('csv', 'jsonl'):
+            raise ValueError(f"Unknown format: {format}")
+        if on_error not in ('raise', 'skip'):
+            raise ValueError(f"Unknown on_error: {on_error}")
+
+        if format == 'csv':
+            # Read everything as text so concept names like 'NA' survive
+            reader = pd.read_csv(path, chunksize=chunk_size, dtype=str, keep_default_na=False)
+        else:
+            reader = pd.read_json(path, lines=True, chunksize=chunk_size,
+                                  dtype=False, convert_dates=False)
+
+        started = time.perf_counter()
+        loaded = skipped = 0
+        # Existing concepts are updated in place, keeping their id and measurements
+        insert = self._insert_concepts_sql(upsert=True, update_metadata=True)
+
+        if rebuild_indexes:
+            with self._connections.write() as conn:
+                self._drop_derived(conn.cursor())
+        try:
+            with reader:
+                for chunk in reader:
+                    rows, invalid = self._file_rows(chunk, source, on_error)
+                    with self._connections.write() as conn:
+                        conn.executemany(insert, rows)
+                    self._invalidate(row[0] for row in rows)
+                    loaded += len(rows)
+                    skipped += invalid
+        finally:
+            rebuilt = time.perf_counter()
+            if rebuild_indexes:
+                with self._connections.write() as conn:
+                    self._rebuild_derived(conn.cursor())
+
+        finished = time.perf_counter()
+        seconds = finished - started
+        return {
+            'rows': loaded,
+            'skipped': skipped,
+            'seconds': seconds,
+            'index_seconds': finished - rebuilt,
+            'rows_per_second': loaded / seconds if seconds > 0 else float('inf'),
+        }
+
+    def _invalidate(self, names=None):
+        """
+        Drop concepts from the get_concept() cache.
+
+        Args:
+            names: Concept names to drop (None clears the whole cache)
+        """
+        if not self.cache_size:
+            return
+        with self._cache_lock:
+            self._cache_generation += 1
+            if names is None:
+                self._cache.clear()
+            else:
+                for name in names:
+                    self._cache.pop(name, None)
+
+    def _cache_lookup(self, name: str):
+        """Return the cached entry for name (or _NOT_CACHED), counting the hit or miss."""
+        with self._cache_lock:
+            coord = self._cache.get(name, _NOT_CACHED)
+            if coord is _NOT_CACHED:
+                self._cache_misses += 1
+            else:
+                self._cache_hits += 1
+                self._cache.move_to_end(name)
+            return coord
+
+    def _cache_store(self, entries: Dict[str, Optional[SemanticCoordinate]], generation: int):
+        """Cache rows read at the given generation, unless a write has happened since."""
+        with self._cache_lock:
+            if generation != self._cache_generation:
+                return
+            self._cache.update(entries)
+            for name in entries:
+                self._cache.move_to_end(name)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Report get_concept() cache usage.
+
+        Returns:
+            Dictionary with hits, misses, maxsize and currsize
+        """
+        with self._cache_lock:
+            return {
+                'hits': self._cache_hits,
+                'misses': self._cache_misses,
+                'maxsize': self.cache_size,
+                'currsize': len(self._cache)
+            }
+
+    def cache_clear(self):
+        """Empty the get_concept() cache and reset its counters."""
+        self._invalidate()
+        with self._cache_lock:
+            self._cache_hits = self._cache_misses = 0
 
     def get_concept(self, concept_name: str) -> Optional[SemanticCoordinate]:
         """
@@ -162,16 +796,22 @@ class SemanticDatabase:
         Returns:
             SemanticCoordinate if found, None otherwise
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT concept, love, power, wisdom, justice, source
-            FROM concepts
-            WHERE concept = ?
-        """, (concept_name,))
+        if self.cache_size:
+            coord = self._cache_lookup(concept_name)
+            if coord is not _NOT_CACHED:
+                return coord
+            generation = self._cache_generation
+
+        with self._connections.read() as conn:
+            row = conn.execute("""
+                SELECT concept, love, power, wisdom, justice, source
+                FROM concepts
+                WHERE concept = ?
+            """, (concept_name,)).fetchone()
 
-        row = cursor.fetchone()
+        coord = None
         if row:
-            return SemanticCoordinate(
+            coord = SemanticCoordinate(
                 concept=row[0],
                 love=row[1],
                 power=row[2],
@@ -179,7 +819,54 @@ class SemanticDatabase:
                 justice=row[4],
                 source=row[5]
             )
-        return None
+        if self.cache_size:
+            self._cache_store({concept_name: coord}, generation)
+        return coord
+
+    def get_concepts(self, concept_names: Sequence[str],
+                     chunk_size: int = 500) -> List[Optional[SemanticCoordinate]]:
+        """
+        Retrieve several concepts by name.
+
+        Cached concepts are served from the cache; the rest are fetched
+        with one IN (...) query per chunk_size names.
+
+        Args:
+            concept_names: Names of the concepts
+            chunk_size: Names per lookup query (kept below SQLite's
+                host-parameter limit)
+
+        Returns:
+            List aligned with concept_names: SemanticCoordinate if found,
+            None otherwise
+        """
+        found: Dict[str, Optional[SemanticCoordinate]] = {}
+        missing = []
+        for name in dict.fromkeys(concept_names):
+            coord = self._cache_lookup(name) if self.cache_size else _NOT_CACHED
+            if coord is _NOT_CACHED:
+                missing.append(name)
+            else:
+                found[name] = coord
+
+        if missing:
+            generation = self._cache_generation
+            fetched = dict.fromkeys(missing)
+            with self._connections.read() as conn:
+                for start in range(0, len(missing), chunk_size):
+                    chunk = missing[start:start + chunk_size]
+                    placeholders = ','.join('?' * len(chunk))
+                    for row in conn.execute(f"""
+                        SELECT concept, love, power, wisdom, justice, source
+                        FROM concepts
+                        WHERE concept IN ({placeholders})
+                    """, chunk):
+                        fetched[row[0]] = SemanticCoordinate(*row[:5], source=row[5])
+            if self.cache_size:
+                self._cache_store(fetched, generation)
+            found.update(fetched)
+
+        return [found[name] for name in concept_names]
 
     def get_closest_to_anchor(self, n: int = 10) -> List[SemanticCoordinate]:
         """
@@ -191,82 +878,289 @@ class SemanticDatabase:
         Returns:
             List of closest concepts
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
+        return self._query_coordinates("""
             SELECT concept, love, power, wisdom, justice, source
             FROM concepts
-            ORDER BY distance_to_anchor ASC
+            ORDER BY distance_to_anchor ASC, id ASC
             LIMIT ?
         """, (n,))
 
-        return [
-            SemanticCoordinate(
-                concept=row[0],
-                love=row[1],
-                power=row[2],
-                wisdom=row[3],
-                justice=row[4],
-                source=row[5]
-            )
-            for row in cursor.fetchall()
-        ]
-
     def get_all_concepts(self) -> List[SemanticCoordinate]:
         """
         Retrieve all concepts from the database.
 
+        For large databases prefer iter_concepts(), which streams.
+
         Returns:
             List of all SemanticCoordinates
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT concept, love, power, wisdom, justice, source
-            FROM concepts
-        """)
+        return list(self.iter_concepts())
 
-        return [
-            SemanticCoordinate(
-                concept=row[0],
-                love=row[1],
-                power=row[2],
-                wisdom=row[3],
-                justice=row[4],
-                source=row[5]
+    def iter_concepts(self, batch_size: int = 10000, mode: str = 'coordinates',
+                      closest_first: bool = False) -> Iterator:
+        """
+        Stream all concepts without loading the table into memory.
+
+        Rows are pulled one batch at a time, each by its own short read
+        that resumes after the last row returned, so no lock or read
+        snapshot is held between batches and an iterator abandoned partway
+        holds nothing. Rows written while the iteration runs may or may
+        not be included.
+
+        Args:
+            batch_size: Rows fetched per round trip
+            mode: 'coordinates' (SemanticCoordinate per row), 'tuples' (raw
+                (concept, love, power, wisdom, justice, source) rows) or
+                'arrays' (one CoordinateArray per batch)
+            closest_first: Stream in order of distance to the Anchor Point
+
+        Yields:
+            SemanticCoordinates, tuples or CoordinateArray chunks
+        """
+        return self._iter_rows("", (), batch_size, mode, closest_first)
+
+    @staticmethod
+    def _rows_as(rows: List[Tuple], mode: str) -> Iterator:
+        """Yield (concept, love, power, wisdom, justice, source) rows in the given mode."""
+        if mode == 'tuples':
+            yield from rows
+        elif mode == 'arrays':
+            yield CoordinateArray(
+                np.array([row[1:5] for row in rows], dtype=np.float64),
+                concepts=[row[0] for row in rows],
+                sources=[row[5] for row in rows]
             )
-            for row in cursor.fetchall()
-        ]
+        else:
+            for row in rows:
+                yield SemanticCoordinate(
+                    concept=row[0],
+                    love=row[1],
+                    power=row[2],
+                    wisdom=row[3],
+                    justice=row[4],
+                    source=row[5]
+                )
+
+    def _query_coordinates(self, query: str, params: Tuple = ()) -> List[SemanticCoordinate]:
+        """Run a (concept, love, power, wisdom, justice, source) query into a list."""
+        with self._connections.read() as conn:
+            rows = conn.execute(query, params).fetchall()
+        return list(self._rows_as(rows, 'coordinates'))
 
-    def get_statistics(self) -> Dict[str, float]:
+    def _iter_rows(self, where: str = "", params: Tuple = (), batch_size: int = 10000,
+                   mode: str = 'coordinates', closest_first: bool = False) -> Iterator:
         """
-        Get statistical summary of all concepts.
+        Stream the concepts matching a WHERE clause in the requested form
+        (see iter_concepts), by id or closest to the Anchor Point first.
+
+        Each batch is its own query, keyset-paginated on id (or on
+        (distance_to_anchor, id)), inside its own read() block.
+        """
+        if mode not in ('coordinates', 'tuples', 'arrays'):
+            raise ValueError(f"Unknown mode: {mode}")
+
+        if closest_first:
+            order, after = "distance_to_anchor, id", "(distance_to_anchor, id) > (?, ?)"
+        else:
+            order, after = "id", "id > ?"
+
+        last = ()
+        while True:
+            conditions = [c for c in (where, after if last else "") if c]
+            where_sql = f"WHERE {' AND '.join(f'({c})' for c in conditions)}" if conditions else ""
+            with self._connections.read() as conn:
+                rows = conn.execute(f"""
+                    SELECT concept, love, power, wisdom, justice, source, distance_to_anchor, id
+                    FROM concepts
+                    {where_sql}
+                    ORDER BY {order}
+                    LIMIT ?
+                """, tuple(params) + last + (batch_size,)).fetchall()
+            if not rows:
+                return
+
+            last = rows[-1][6:] if closest_first else rows[-1][7:]
+            yield from self._rows_as([row[:6] for row in rows], mode)
+            if len(rows) < batch_size:
+                return
+
+    def _iter_ids(self, ids: np.ndarray, batch_size: int = 10000,
+                  mode: str = 'coordinates', chunk_size: int = 500) -> Iterator:
+        """
+        Stream the concepts with the given ids, in that order, in the
+        requested form (see iter_concepts).
+
+        Each batch is looked up by primary key inside its own read()
+        block, with one IN (...) query per chunk_size ids. Concepts
+        deleted since the ids were collected are skipped.
+        """
+        if mode not in ('coordinates', 'tuples', 'arrays'):
+            raise ValueError(f"Unknown mode: {mode}")
+
+        for start in range(0, len(ids), batch_size):
+            batch = ids[start:start + batch_size].tolist()
+            found = {}
+            with self._connections.read() as conn:
+                for offset in range(0, len(batch), chunk_size):
+                    chunk = batch[offset:offset + chunk_size]
+                    placeholders = ','.join('?' * len(chunk))
+                    for row in conn.execute(f"""
+                        SELECT id, concept, love, power, wisdom, justice, source
+                        FROM concepts
+                        WHERE id IN ({placeholders})
+                    """, chunk):
+                        found[row[0]] = row[1:]
+            rows = [found[concept_id] for concept_id in batch if concept_id in found]
+            if rows:
+                yield from self._rows_as(rows, mode)
+
+    def to_arrays(self, packed: Optional[bool] = None,
+                  batch_size: int = 65536) -> CoordinateArray:
+        """
+        Load every concept into one columnar CoordinateArray.
+
+        Values are written batch by batch into preallocated arrays without
+        building per-row objects; concept names and sources form separate
+        object columns of interned strings. Row order matches iter_concepts().
+
+        Args:
+            packed: Read the packed float32 vector column with np.frombuffer
+                (float32 values, the fastest path) instead of the REAL
+                columns (float64, exact). Defaults to packed when available.
+            batch_size: Rows fetched per round trip
 
         Returns:
-            Dictionary of statistics
+            CoordinateArray of all concepts
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT
-                COUNT(*) as count,
-                AVG(distance_to_anchor) as mean_distance,
-                MIN(distance_to_anchor) as min_distance,
-                MAX(distance_to_anchor) as max_distance,
-                AVG(love) as mean_love,
-                AVG(power) as mean_power,
-                AVG(wisdom) as mean_wisdom,
-                AVG(justice) as mean_justice
-            FROM concepts
-        """)
+        if packed is None:
+            packed = self.packed_vectors
+        if packed and not self.packed_vectors:
+            raise ValueError("Packed vectors are not enabled for this database")
+
+        with self._connections.read() as conn:
+            n = conn.execute("SELECT COUNT(*) FROM concepts").fetchone()[0]
+            values = np.empty((n, 4), dtype=np.float32 if packed else np.float64)
+            concepts = np.empty(n, dtype=object)
+            sources = np.empty(n, dtype=object)
+
+            if packed:
+                cursor = conn.execute("SELECT concept, source, vector FROM concepts")
+            else:
+                cursor = conn.execute(
+                    "SELECT concept, source, love, power, wisdom, justice FROM concepts")
+
+            filled = 0
+            while True:
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                m = len(rows)
+                if filled + m > len(values):
+                    # Rows committed after the count was taken
+                    grow = max(filled + m, 2 * len(values))
+                    values = np.resize(values, (grow, 4))
+                    concepts = np.resize(concepts, grow)
+                    sources = np.resize(sources, grow)
+
+                block = values[filled:filled + m]
+                if packed:
+                    blobs = [row[2] or self._pack_stored(conn, row[0]) for row in rows]
+                    block[:] = np.frombuffer(b''.join(blobs), dtype='<f4').reshape(m, 4)
+                else:
+                    block[:] = [row[2:6] for row in rows]
+                concepts[filled:filled + m] = [sys.intern(row[0]) for row in rows]
+                sources[filled:filled + m] = [
+                    sys.intern(row[1]) if row[1] is not None else None for row in rows
+                ]
+                filled += m
+
+        return CoordinateArray(values[:filled], concepts=concepts[:filled],
+                               sources=sources[:filled], validate=False)
 
-        row = cursor.fetchone()
+    @staticmethod
+    def _pack_stored(conn: sqlite3.Connection, concept: str) -> bytes:
+        """Pack the REAL columns of a row whose vector has not been backfilled yet."""
+        row = conn.execute(
+            "SELECT love, power, wisdom, justice FROM concepts WHERE concept = ?", (concept,)
+        ).fetchone()
+        return _PACKED_VECTOR.pack(*row)
+
+    def get_statistics(self, source: Optional[str] = None,
+                       experiment_id: Optional[int] = None,
+                       recompute: bool = False) -> Dict[str, float]:
+        """
+        Get statistical summary of concepts or of one experiment.
+
+        Served in O(1) from the running aggregates in concept_stats.
+
+        Args:
+            source: Only concepts from this source ('' for no source)
+            experiment_id: Only this experiment's measurements
+            recompute: Aggregate the base table directly instead, e.g. to
+                verify the running aggregates
+
+        Returns:
+            Dictionary of statistics (means and extremes are None when
+            the count is 0)
+        """
+        if source is not None and experiment_id is not None:
+            raise ValueError("Pass either source or experiment_id, not both")
+        if experiment_id is not None:
+            scope, key, table = 'experiment', str(experiment_id), 'measurements'
+            where, params = "WHERE experiment_id = ?", (experiment_id,)
+        elif source is not None:
+            scope, key, table = 'source', source, 'concepts'
+            where, params = "WHERE COALESCE(source, '') = ?", (source,)
+        else:
+            scope, key, table = 'all', '', 'concepts'
+            where, params = "", ()
+
+        aggregate = f"SELECT {self._STATS_AGGREGATES} FROM {table} {where}"
+        if recompute:
+            with self._connections.read() as conn:
+                row = conn.execute(aggregate, params).fetchone()
+        else:
+            lookup = """
+                SELECT count, sum_distance, min_distance, max_distance,
+                       sum_love, sum_power, sum_wisdom, sum_justice, stale
+                FROM concept_stats WHERE scope = ? AND key = ?
+            """
+            with self._connections.read() as conn:
+                row = conn.execute(lookup, (scope, key)).fetchone()
+            if row is not None and row[8]:
+                # A deleted row held the minimum or maximum; recompute them once
+                with self._connections.write() as conn:
+                    conn.execute(f"""
+                        UPDATE concept_stats SET stale = 0,
+                            (min_distance, max_distance) = (
+                                SELECT MIN(distance_to_anchor), MAX(distance_to_anchor)
+                                FROM {table} {where}
+                            )
+                        WHERE scope = ? AND key = ?
+                    """, params + (scope, key))
+                    row = conn.execute(lookup, (scope, key)).fetchone()
+
+        count = row[0] if row else 0
+        if not count:
+            return {
+                'count': 0,
+                'mean_distance': None,
+                'min_distance': None,
+                'max_distance': None,
+                'mean_love': None,
+                'mean_power': None,
+                'mean_wisdom': None,
+                'mean_justice': None
+            }
         return {
-            'count': row[0],
-            'mean_distance': row[1],
+            'count': count,
+            'mean_distance': row[1] / count,
             'min_distance': row[2],
             'max_distance': row[3],
-            'mean_love': row[4],
-            'mean_power': row[5],
-            'mean_wisdom': row[6],
-            'mean_justice': row[7]
+            'mean_love': row[4] / count,
+            'mean_power': row[5] / count,
+            'mean_wisdom': row[6] / count,
+            'mean_justice': row[7] / count
         }
 
     def search_concepts(self, pattern: str) -> List[SemanticCoordinate]:
@@ -279,26 +1173,205 @@ class SemanticDatabase:
         Returns:
             List of matching concepts
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            SELECT concept, love, power, wisdom, justice, source
-            FROM concepts
-            WHERE concept LIKE ?
-            ORDER BY distance_to_anchor ASC
-        """, (pattern,))
+        return list(self.iter_search(pattern))
+
+    def iter_search(self, pattern: str, batch_size: int = 10000,
+                    mode: str = 'coordinates') -> Iterator:
+        """
+        Stream concepts matching a pattern, closest to the Anchor Point first.
+
+        Patterns with at least three consecutive literal characters are
+        answered from the trigram index (leading wildcards included); the
+        LIKE is still applied to the candidates, so results are exact. The
+        index is queried once for the ids of all matches, in order, and
+        the rows are then fetched batch by batch by id.
+
+        Args:
+            pattern: SQL LIKE pattern (use % as wildcard)
+            batch_size: Rows fetched per round trip
+            mode: 'coordinates', 'tuples' or 'arrays' (see iter_concepts)
+
+        Yields:
+            SemanticCoordinates, tuples or CoordinateArray chunks
+        """
+        literal_runs = pattern.replace('_', '%').split('%')
+        if self.has_trigram and max(len(run) for run in literal_runs) >= 3:
+            with self._connections.read() as conn:
+                ids = np.fromiter((row[0] for row in conn.execute("""
+                    SELECT id FROM concepts
+                    WHERE id IN (SELECT rowid FROM concepts_trigram WHERE concept LIKE ?)
+                      AND concept LIKE ?
+                    ORDER BY distance_to_anchor, id
+                """, (pattern, pattern))), dtype=np.int64)
+            return self._iter_ids(ids, batch_size, mode)
+
+        return self._iter_rows("concept LIKE ?", (pattern,), batch_size, mode, closest_first=True)
+
+    def search_text(self, query: str, order_by: str = 'rank',
+                    limit: Optional[int] = None) -> List[SemanticCoordinate]:
+        """
+        Full-text search over concept names and metadata.
+
+        Args:
+            query: FTS5 query, e.g. 'love', 'lov*' (prefix), 'divine AND love',
+                '"love of god"' (phrase) or 'metadata: virtue' (one column)
+            order_by: 'rank' (best BM25 match first) or 'distance'
+                (closest to the Anchor Point first)
+            limit: Optional maximum number of results
+
+        Returns:
+            Matching concepts
+        """
+        if not self.has_fts:
+            raise RuntimeError("SQLite was built without FTS5; use search_concepts()")
+        orderings = {
+            'rank': "f.rank",
+            'distance': "c.distance_to_anchor ASC",
+        }
+        if order_by not in orderings:
+            raise ValueError(f"Unknown order_by: {order_by}")
+
+        return self._query_coordinates(f"""
+            SELECT c.concept, c.love, c.power, c.wisdom, c.justice, c.source
+            FROM concepts_fts f JOIN concepts c ON c.id = f.rowid
+            WHERE concepts_fts MATCH ?
+            ORDER BY {orderings[order_by]}
+            LIMIT ?
+        """, (query, -1 if limit is None else limit))
+
+    def query_box(self, mins: Sequence[float] = (0.0, 0.0, 0.0, 0.0),
+                  maxs: Sequence[float] = (1.0, 1.0, 1.0, 1.0)) -> List[SemanticCoordinate]:
+        """
+        Find concepts inside an axis-aligned box in (L, P, W, J) space.
+
+        Served by the R*Tree; the stored float values are then compared
+        exactly, since the R*Tree keeps 32-bit bounds.
+
+        Args:
+            mins: Lower bounds (love, power, wisdom, justice), inclusive
+            maxs: Upper bounds (love, power, wisdom, justice), inclusive
+
+        Returns:
+            Matching concepts, closest to the Anchor Point first
+        """
+        return [coord for coord, _ in self._box_rows(mins, maxs)]
+
+    def _box_rows(self, mins: Sequence[float],
+                  maxs: Sequence[float]) -> List[Tuple[SemanticCoordinate, Tuple]]:
+        """Concepts inside a box, each with its exact (L, P, W, J) values."""
+        bounds = []
+        for low, high in zip(mins, maxs):
+            bounds += [float(low), float(high)]
+        if len(bounds) != 8:
+            raise ValueError("mins and maxs must each have 4 values (L, P, W, J)")
+
+        exact = """
+            c.love BETWEEN ? AND ? AND c.power BETWEEN ? AND ?
+            AND c.wisdom BETWEEN ? AND ? AND c.justice BETWEEN ? AND ?
+        """
+        if self.has_rtree:
+            query = f"""
+                SELECT c.concept, c.love, c.power, c.wisdom, c.justice, c.source
+                FROM concepts_rtree r JOIN concepts c ON c.id = r.id
+                WHERE r.max_love >= ? AND r.min_love <= ?
+                  AND r.max_power >= ? AND r.min_power <= ?
+                  AND r.max_wisdom >= ? AND r.min_wisdom <= ?
+                  AND r.max_justice >= ? AND r.min_justice <= ?
+                  AND {exact}
+                ORDER BY c.distance_to_anchor ASC
+            """
+            params = bounds + bounds
+        else:
+            query = f"""
+                SELECT c.concept, c.love, c.power, c.wisdom, c.justice, c.source
+                FROM concepts c
+                WHERE {exact}
+                ORDER BY c.distance_to_anchor ASC
+            """
+            params = bounds
+
+        with self._connections.read() as conn:
+            rows = conn.execute(query, params).fetchall()
 
         return [
-            SemanticCoordinate(
+            (SemanticCoordinate(
                 concept=row[0],
                 love=row[1],
                 power=row[2],
                 wisdom=row[3],
                 justice=row[4],
                 source=row[5]
-            )
-            for row in cursor.fetchall()
+            ), row[1:5])
+            for row in rows
         ]
 
+    def _ball_candidates(self, point: np.ndarray,
+                         r: float) -> Tuple[List[SemanticCoordinate], np.ndarray]:
+        """Concepts in the box around a ball, with their exact distances to its center."""
+        rows = self._box_rows(point - r, point + r)
+        if not rows:
+            return [], np.empty(0)
+        values = np.array([exact for _, exact in rows], dtype=np.float64)
+        return [coord for coord, _ in rows], np.linalg.norm(values - point, axis=1)
+
+    def within_radius(self, point, r: float) -> List[SemanticCoordinate]:
+        """
+        Find concepts within Euclidean distance r of a point.
+
+        The R*Tree selects the bounding box of the ball and the exact
+        distance check runs on those candidates only.
+
+        Args:
+            point: SemanticCoordinate or 4-vector (e.g. the Anchor Point)
+            r: Radius (inclusive)
+
+        Returns:
+            Concepts within r, nearest first
+        """
+        point = _as_point(point)
+        candidates, distances = self._ball_candidates(point, r)
+        order = np.argsort(distances, kind='stable')
+        return [candidates[i] for i in order if distances[i] <= r]
+
+    def nearest(self, point, k: int = 10) -> List[SemanticCoordinate]:
+        """
+        Find the k concepts nearest to a point (Euclidean).
+
+        Grows a box around the point until it holds k candidates, then
+        re-queries with the k-th candidate distance as half-width, which
+        is guaranteed to contain the true k nearest.
+
+        Args:
+            point: SemanticCoordinate or 4-vector
+            k: Number of concepts
+
+        Returns:
+            Up to k concepts, nearest first
+        """
+        point = _as_point(point)
+        if k <= 0:
+            return []
+
+        # A box this wide covers the whole unit hypercube
+        covering = float(np.max(np.maximum(np.abs(point), np.abs(1.0 - point))))
+        with self._connections.read() as conn:
+            approximate_count = conn.execute("SELECT MAX(id) FROM concepts").fetchone()[0] or 1
+        half_width = min(0.5 * (k / approximate_count) ** 0.25, covering)
+
+        while True:
+            candidates, distances = self._ball_candidates(point, half_width)
+            if len(candidates) >= k or half_width >= covering:
+                break
+            half_width = min(2 * half_width, covering)
+
+        if len(candidates) >= k:
+            kth = float(np.partition(distances, k - 1)[k - 1])
+            if kth > half_width:
+                candidates, distances = self._ball_candidates(point, kth)
+
+        order = np.argsort(distances, kind='stable')[:k]
+        return [candidates[i] for i in order]
+
     def export_to_dataframe(self) -> pd.DataFrame:
         """
         Export all concepts to a pandas DataFrame.
@@ -306,12 +1379,13 @@ class SemanticDatabase:
         Returns:
             DataFrame with all concepts and their coordinates
         """
-        return pd.read_sql_query("""
-            SELECT concept, love, power, wisdom, justice,
-                   distance_to_anchor, source, created_at
-            FROM concepts
-            ORDER BY distance_to_anchor ASC
-        """, self.conn)
+        with self._connections.read() as conn:
+            return pd.read_sql_query("""
+                SELECT concept, love, power, wisdom, justice,
+                       distance_to_anchor, source, created_at
+                FROM concepts
+                ORDER BY distance_to_anchor ASC
+            """, conn)
 
     def create_experiment(self, name: str, description: str,
                          method: str, parameters: Dict) -> int:
@@ -327,13 +1401,12 @@ class SemanticDatabase:
         Returns:
             Experiment ID
         """
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO experiments (name, description, method, parameters)
-            VALUES (?, ?, ?, ?)
-        """, (name, description, method, json.dumps(parameters)))
+        with self._connections.write() as conn:
+            cursor = conn.execute("""
+                INSERT INTO experiments (name, description, method, parameters)
+                VALUES (?, ?, ?, ?)
+            """, (name, description, method, json.dumps(parameters)))
 
-        self.conn.commit()
         return cursor.lastrowid
 
     def add_measurement(self, experiment_id: int, coord: SemanticCoordinate) -> int:
@@ -347,30 +1420,357 @@ class SemanticDatabase:
         Returns:
             Measurement ID
         """
-        # First ensure concept exists
-        concept_id = self.add_concept(coord)
+        with self._connections.write() as conn:
+            # First ensure concept exists (keeping its id and metadata)
+            concept_id = self._upsert_concept(conn, coord, update_metadata=False)
 
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO measurements
-            (experiment_id, concept_id, love, power, wisdom, justice, distance_to_anchor)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        """, (
-            experiment_id,
-            concept_id,
-            coord.love,
-            coord.power,
-            coord.wisdom,
-            coord.justice,
-            coord.distance_to_anchor()
-        ))
+            cursor = conn.execute("""
+                INSERT INTO measurements
+                (experiment_id, concept_id, love, power, wisdom, justice, distance_to_anchor)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (
+                experiment_id,
+                concept_id,
+                coord.love,
+                coord.power,
+                coord.wisdom,
+                coord.justice,
+                coord.distance_to_anchor()
+            ))
+        self._invalidate([coord.concept])
 
-        self.conn.commit()
         return cursor.lastrowid
 
+    def add_measurements_bulk(self, experiment_id: int,
+                              coords: Sequence[SemanticCoordinate],
+                              chunk_size: int = 500) -> List[int]:
+        """
+        Add many measurements to an experiment in one transaction.
+
+        Concepts are upserted with executemany (existing rows keep their
+        id and metadata), their ids are resolved with one lookup pass, and
+        the measurements are inserted with a second executemany, so the
+        whole batch costs a single commit.
+
+        Args:
+            experiment_id: ID of the experiment
+            coords: SemanticCoordinates measured
+            chunk_size: Concept names per id lookup query (kept below
+                SQLite's host-parameter limit)
+
+        Returns:
+            Measurement IDs, in the order of coords
+        """
+        coords = list(coords)
+        if not coords:
+            return []
+        rows = [self._concept_row(c) for c in coords]
+
+        with self._connections.write() as conn:
+            conn.executemany(self._insert_concepts_sql(upsert=True), rows)
+
+            names = list(dict.fromkeys(c.concept for c in coords))
+            concept_ids = {}
+            for start in range(0, len(names), chunk_size):
+                chunk = names[start:start + chunk_size]
+                placeholders = ','.join('?' * len(chunk))
+                concept_ids.update(
+                    (name, concept_id) for concept_id, name in conn.execute(
+                        f"SELECT id, concept FROM concepts WHERE concept IN ({placeholders})", chunk
+                    )
+                )
+
+            conn.executemany("""
+                INSERT INTO measurements
+                (experiment_id, concept_id, love, power, wisdom, justice, distance_to_anchor)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, [
+                (experiment_id, concept_ids[row[0]]) + row[1:6]
+                for row in rows
+            ])
+
+            # AUTOINCREMENT ids are consecutive within the writer's transaction
+            last_id = conn.execute(
+                "SELECT seq FROM sqlite_sequence WHERE name = 'measurements'"
+            ).fetchone()[0]
+        self._invalidate(names)
+
+        return list(range(last_id - len(rows) + 1, last_id + 1))
+
+    # Latest measurement of each concept in experiments :a and :b
+    _LATEST_MEASUREMENTS = """
+        latest AS (
+            SELECT experiment_id, concept_id, love, power, wisdom, justice,
+                   distance_to_anchor AS distance
+            FROM (
+                SELECT m.*, ROW_NUMBER() OVER (
+                    PARTITION BY experiment_id, concept_id ORDER BY id DESC
+                ) AS newest
+                FROM measurements m
+                WHERE experiment_id IN (:a, :b)
+            )
+            WHERE newest = 1
+        ),
+        pairs AS (
+            SELECT a.concept_id,
+                   a.love AS love_a, b.love AS love_b,
+                   a.power AS power_a, b.power AS power_b,
+                   a.wisdom AS wisdom_a, b.wisdom AS wisdom_b,
+                   a.justice AS justice_a, b.justice AS justice_b,
+                   a.distance AS distance_a, b.distance AS distance_b
+            FROM latest a
+            JOIN latest b ON b.concept_id = a.concept_id AND b.experiment_id = :b
+            WHERE a.experiment_id = :a
+        )
+    """
+
+    def experiment_summary(self, experiment_id: int) -> Dict:
+        """
+        Summarize one experiment's measurements, aggregated inside SQLite.
+
+        Args:
+            experiment_id: ID of the experiment
+
+        Returns:
+            Dictionary with the experiment record, measurement and concept
+            counts, and the mean, std, min and max of the anchor distance
+            plus the mean of each dimension
+        """
+        with self._connections.read() as conn:
+            experiment = conn.execute("""
+                SELECT name, description, method, parameters, created_at
+                FROM experiments WHERE id = ?
+            """, (experiment_id,)).fetchone()
+            if experiment is None:
+                raise KeyError(f"No experiment with id {experiment_id}")
+
+            row = conn.execute("""
+                SELECT COUNT(*), COUNT(DISTINCT concept_id),
+                       AVG(distance_to_anchor),
+                       AVG(distance_to_anchor * distance_to_anchor),
+                       MIN(distance_to_anchor), MAX(distance_to_anchor),
+                       AVG(love), AVG(power), AVG(wisdom), AVG(justice)
+                FROM measurements WHERE experiment_id = ?
+            """, (experiment_id,)).fetchone()
+
+        mean, mean_square = row[2], row[3]
+        return {
+            'experiment_id': experiment_id,
+            'name': experiment[0],
+            'description': experiment[1],
+            'method': experiment[2],
+            'parameters': json.loads(experiment[3]) if experiment[3] else None,
+            'created_at': experiment[4],
+            'n_measurements': row[0],
+            'n_concepts': row[1],
+            'mean_distance': mean,
+            'std_distance': None if mean is None else max(mean_square - mean * mean, 0.0) ** 0.5,
+            'min_distance': row[4],
+            'max_distance': row[5],
+            'mean_love': row[6],
+            'mean_power': row[7],
+            'mean_wisdom': row[8],
+            'mean_justice': row[9]
+        }
+
+    def compare_experiments(self, experiment_a: int, experiment_b: int,
+                            top_n: int = 10) -> Dict:
+        """
+        Compare two experiments concept by concept, entirely inside SQLite.
+
+        Concepts measured in both experiments are joined on their latest
+        measurement in each. Correlations are computed from centered sums
+        (Spearman from average ranks, so ties are handled as in scipy).
+
+        Args:
+            experiment_a: Baseline experiment ID
+            experiment_b: Experiment compared against the baseline
+            top_n: Number of largest per-concept differences to return
+
+        Returns:
+            Dictionary with 'n_concepts', 'distance_correlation',
+            'dimension_correlations', 'distance_stats', 'ranking_agreement'
+            and 'top_differences' (mirroring compare_simulated_vs_api)
+        """
+        params = {'a': experiment_a, 'b': experiment_b}
+        dimensions = ('love', 'power', 'wisdom', 'justice', 'distance')
+        means = ', '.join(f"AVG({d}_a) AS {d}_ma, AVG({d}_b) AS {d}_mb" for d in dimensions)
+        sums = ', '.join(
+            f"TOTAL((p.{d}_a - {d}_ma) * (p.{d}_b - {d}_mb)), "
+            f"TOTAL((p.{d}_a - {d}_ma) * (p.{d}_a - {d}_ma)), "
+            f"TOTAL((p.{d}_b - {d}_mb) * (p.{d}_b - {d}_mb))"
+            for d in dimensions
+        )
+
+        with self._connections.read() as conn:
+            row = conn.execute(f"""
+                WITH {self._LATEST_MEASUREMENTS},
+                ranked AS (
+                    SELECT concept_id, distance_a, distance_b,
+                           RANK() OVER (ORDER BY distance_a)
+                               + (COUNT(*) OVER (PARTITION BY distance_a) - 1) / 2.0 AS rank_a,
+                           RANK() OVER (ORDER BY distance_b)
+                               + (COUNT(*) OVER (PARTITION BY distance_b) - 1) / 2.0 AS rank_b,
+                           ROW_NUMBER() OVER (ORDER BY distance_a, concept_id) AS row_a,
+                           ROW_NUMBER() OVER (ORDER BY distance_b, concept_id) AS row_b
+                    FROM pairs
+                ),
+                means AS (SELECT COUNT(*) AS n, {means} FROM pairs)
+                SELECT n, distance_ma, distance_mb, {sums},
+                    (SELECT TOTAL((rank_a - (n + 1) / 2.0) * (rank_b - (n + 1) / 2.0)) FROM ranked),
+                    (SELECT TOTAL((rank_a - (n + 1) / 2.0) * (rank_a - (n + 1) / 2.0)) FROM ranked),
+                    (SELECT TOTAL((rank_b - (n + 1) / 2.0) * (rank_b - (n + 1) / 2.0)) FROM ranked),
+                    (SELECT COUNT(*) FROM ranked
+                     WHERE row_a <= MIN(:top, n / 3) AND row_b <= MIN(:top, n / 3))
+                FROM means
+                LEFT JOIN pairs p
+                GROUP BY n
+            """, dict(params, top=10)).fetchone()
+
+            differences = conn.execute(f"""
+                WITH {self._LATEST_MEASUREMENTS}
+                SELECT c.concept, p.distance_a, p.distance_b,
+                       ABS(p.distance_a - p.distance_b) AS difference,
+                       p.love_a, p.power_a, p.wisdom_a, p.justice_a,
+                       p.love_b, p.power_b, p.wisdom_b, p.justice_b
+                FROM pairs p JOIN concepts c ON c.id = p.concept_id
+                ORDER BY difference DESC, c.concept
+                LIMIT :limit
+            """, dict(params, limit=top_n)).fetchall()
+
+        n = row[0]
+        if not n:
+            return {'error': 'No concepts measured in both experiments'}
+
+        def correlation(cross, left, right):
+            return cross / (left * right) ** 0.5 if left > 0 and right > 0 else float('nan')
+
+        stats = {d: row[3 + 3 * i:6 + 3 * i] for i, d in enumerate(dimensions)}
+        top = min(10, n // 3)
+        return {
+            'n_concepts': n,
+            'distance_correlation': {
+                'spearman_rho': correlation(*row[18:21]),
+                'pearson_r': correlation(*stats['distance'])
+            },
+            'dimension_correlations': {
+                d: {'pearson_r': correlation(*stats[d])} for d in dimensions[:4]
+            },
+            'distance_stats': {
+                'a_mean': row[1],
+                'b_mean': row[2],
+                'a_std': (stats['distance'][1] / n) ** 0.5,
+                'b_std': (stats['distance'][2] / n) ** 0.5,
+                'mean_difference': row[2] - row[1]
+            },
+            'ranking_agreement': {
+                'top_n': top,
+                'top_agreement': row[21] / top if top else float('nan')
+            },
+            'top_differences': [
+                {
+                    'concept': d[0],
+                    'a_distance': d[1],
+                    'b_distance': d[2],
+                    'difference': d[3],
+                    'a_coords': d[4:8],
+                    'b_coords': d[8:12]
+                }
+                for d in differences
+            ]
+        }
+
+    def experiment_deltas(self, experiment_a: int, experiment_b: int) -> pd.DataFrame:
+        """
+        Per-concept differences between two experiments, joined in SQLite.
+
+        Args:
+            experiment_a: Baseline experiment ID
+            experiment_b: Experiment compared against the baseline
+
+        Returns:
+            DataFrame with one row per concept measured in both experiments:
+            each dimension and the distance in both, their deltas (b - a),
+            and the distance rank in each experiment, largest change first
+        """
+        deltas = ', '.join(
+            f"p.{d}_a, p.{d}_b, p.{d}_b - p.{d}_a AS {d}_delta"
+            for d in ('love', 'power', 'wisdom', 'justice', 'distance')
+        )
+        with self._connections.read() as conn:
+            return pd.read_sql_query(f"""
+                WITH {self._LATEST_MEASUREMENTS}
+                SELECT c.concept, {deltas},
+                       RANK() OVER (ORDER BY p.distance_a) AS rank_a,
+                       RANK() OVER (ORDER BY p.distance_b) AS rank_b
+                FROM pairs p JOIN concepts c ON c.id = p.concept_id
+                ORDER BY ABS(p.distance_b - p.distance_a) DESC, c.concept
+            """, conn, params={'a': experiment_a, 'b': experiment_b})
+
+    def rank_in_experiment(self, experiment_id: int,
+                           concepts: Optional[Sequence[str]] = None,
+                           limit: Optional[int] = None,
+                           farthest: bool = False) -> List[Dict]:
+        """
+        Rank concepts by distance to the Anchor Point within an experiment.
+
+        Ranks are computed over the whole experiment (latest measurement per
+        concept) before any filtering, so they are comparable across calls.
+
+        Args:
+            experiment_id: ID of the experiment
+            concepts: Optional concept names to report (default: all)
+            limit: Optional maximum number of rows
+            farthest: Rank farthest-first instead of closest-first
+
+        Returns:
+            List of dictionaries with 'concept', 'distance', 'rank' (1 =
+            closest, or farthest), 'percentile' (0.0 to 1.0) and 'n'
+        """
+        direction = "DESC" if farthest else "ASC"
+        filter_sql = ""
+        params: List = [experiment_id]
+        if concepts is not None:
+            concepts = list(concepts)
+            if not concepts:
+                return []
+            filter_sql = f"WHERE concept IN ({','.join('?' * len(concepts))})"
+            params += concepts
+        params.append(-1 if limit is None else limit)
+
+        with self._connections.read() as conn:
+            rows = conn.execute(f"""
+                WITH latest AS (
+                    SELECT concept_id, distance_to_anchor AS distance
+                    FROM (
+                        SELECT concept_id, distance_to_anchor, ROW_NUMBER() OVER (
+                            PARTITION BY concept_id ORDER BY id DESC
+                        ) AS newest
+                        FROM measurements WHERE experiment_id = ?
+                    )
+                    WHERE newest = 1
+                ),
+                ranked AS (
+                    SELECT c.concept, l.distance,
+                           RANK() OVER (ORDER BY l.distance {direction}) AS rank,
+                           PERCENT_RANK() OVER (ORDER BY l.distance {direction}) AS percentile,
+                           COUNT(*) OVER () AS n
+                    FROM latest l JOIN concepts c ON c.id = l.concept_id
+                )
+                SELECT concept, distance, rank, percentile, n FROM ranked
+                {filter_sql}
+                ORDER BY rank, concept
+                LIMIT ?
+            """, params).fetchall()
+
+        return [
+            {'concept': r[0], 'distance': r[1], 'rank': r[2], 'percentile': r[3], 'n': r[4]}
+            for r in rows
+        ]
+
     def close(self):
-        """Close the database connection."""
-        self.conn.close()
+        """Close all database connections."""
+        self._connections.close()
 
     def __enter__(self):
         """Context manager entry."""
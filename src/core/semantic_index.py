@@ -0,0 +1,316 @@
+"""
+Semantic Spatial Index
+======================
+
+Nearest-neighbour and radius queries over 4D semantic space without a
+full scan of the corpus.
+
+Euclidean queries use a KD-tree (scipy.spatial.cKDTree). The golden
+spiral distance is not a metric: its spiral arc scales with the smaller
+radius, so a detour through a point near the origin can be shorter than
+the direct path, which breaks the triangle inequality a vantage-point or
+ball tree relies on. Phi-spiral queries therefore use a cell index that
+groups points by direction and radius and prunes whole cells with a
+lower bound derived from the distance formula itself. Results are exact
+for both metrics.
+"""
+
+import pickle
+import numpy as np
+from pathlib import Path
+from typing import List, Tuple, Union
+from scipy.spatial import cKDTree
+
+from .semantic_coordinates import CoordinateArray, _as_point, _coordinate_block
+from .phi_geometric import (
+    PHI,
+    PHI_INVERSE,
+    _ARC_SCALE,
+    _row_norms,
+    golden_spiral_distance_pairs
+)
+
+
+METRICS = ('euclidean', 'phi_spiral')
+
+# Relative slack so rounding can never push a cell bound above a true distance
+_BOUND_SLACK = 1e-9
+
+
+class _SpiralCells:
+    """
+    Direction/radius cells with per-cell lower bounds on the spiral distance.
+
+    For a cell with mean direction c, angular radius rho and norms in
+    [r_min, r_max], every member p satisfies angle(q, p) >= angle(q, c) - rho,
+    so the spiral arc term is at least its value at that angle with radius
+    min(r_q, r_min), and the radial term is at least the gap between r_q and
+    [r_min, r_max].
+    """
+
+    def __init__(self, values: np.ndarray, leaf_size: int):
+        n = len(values)
+        norms = _row_norms(values)
+        directions = np.full(values.shape, 0.5)
+        nonzero = norms > 0
+        directions[nonzero] = values[nonzero] / norms[nonzero, None]
+
+        # Quantize direction components and radius into ~n / leaf_size cells
+        bins = max(1, int(round((n / leaf_size) ** 0.25)))
+        columns = [directions[:, k] for k in range(directions.shape[1])] + [norms]
+        keys = np.zeros(n, dtype=np.int64)
+        for column in columns:
+            low, span = column.min(), np.ptp(column)
+            scaled = (column - low) / span * bins if span > 0 else np.zeros(n)
+            keys = keys * bins + np.minimum(scaled.astype(np.int64), bins - 1)
+
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        counts = np.diff(np.r_[starts, n])
+
+        self.order = order
+        self.values = np.ascontiguousarray(values[order])
+        self.starts = starts
+        self.stops = starts + counts
+
+        directions = directions[order]
+        norms = norms[order]
+        centers = np.add.reduceat(directions, starts, axis=0)
+        centers /= np.linalg.norm(centers, axis=1, keepdims=True)
+        cos_to_center = np.einsum('ij,ij->i', directions, np.repeat(centers, counts, axis=0))
+        self.centers = centers
+        self.rho = np.maximum.reduceat(np.arccos(np.clip(cos_to_center, -1, 1)), starts)
+        self.r_min = np.minimum.reduceat(norms, starts)
+        self.r_max = np.maximum.reduceat(norms, starts)
+
+    def lower_bounds(self, point: np.ndarray) -> np.ndarray:
+        """Lower bound of the spiral distance from point to every cell."""
+        r_q = float(np.sqrt(point @ point))
+        if r_q > 0:
+            angle = np.arccos(np.clip(self.centers @ (point / r_q), -1, 1))
+            angle = np.maximum(angle - self.rho, 0.0)
+        else:
+            angle = np.zeros(len(self.centers))
+
+        factor = np.minimum(r_q, self.r_min) * _ARC_SCALE * PHI ** 2
+        arc = factor * (np.power(PHI, angle / (np.pi / 2)) - 1.0)
+        gap = np.maximum(np.maximum(self.r_min - r_q, r_q - self.r_max), 0.0)
+        bound = PHI_INVERSE * arc + (1 - PHI_INVERSE) * gap
+        return bound * (1 - _BOUND_SLACK)
+
+    def _scan(self, cells: np.ndarray, point: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Exact distances to every member of the given cells."""
+        rows = np.concatenate([np.arange(self.starts[c], self.stops[c]) for c in cells])
+        return rows, golden_spiral_distance_pairs(self.values[rows], point)
+
+    def knn(self, point: np.ndarray, k: int) -> Tuple[np.ndarray, np.ndarray]:
+        bounds = self.lower_bounds(point)
+        cell_order = np.argsort(bounds, kind='stable')
+
+        rows = np.empty(0, dtype=np.intp)
+        distances = np.empty(0)
+        position = 0
+        while position < len(cell_order):
+            # Visit cells in bound order, a few at a time to amortize overhead
+            cells = cell_order[position:position + 8]
+            if len(distances) >= k:
+                kth = distances[k - 1]
+                cells = cells[bounds[cells] <= kth]
+                if not len(cells):
+                    break
+            position += 8
+
+            new_rows, new_distances = self._scan(cells, point)
+            rows = np.concatenate((rows, new_rows))
+            distances = np.concatenate((distances, new_distances))
+            keep = np.lexsort((self.order[rows], distances))[:k]
+            rows, distances = rows[keep], distances[keep]
+
+        return self.order[rows], distances
+
+    def radius(self, point: np.ndarray, r: float) -> Tuple[np.ndarray, np.ndarray]:
+        cells = np.flatnonzero(self.lower_bounds(point) <= r)
+        if not len(cells):
+            return np.empty(0, dtype=np.intp), np.empty(0)
+
+        rows, distances = self._scan(cells, point)
+        inside = distances <= r
+        rows, distances = self.order[rows[inside]], distances[inside]
+        keep = np.lexsort((rows, distances))
+        return rows[keep], distances[keep]
+
+
+class SemanticIndex:
+    """
+    Exact k-nearest-neighbour and radius queries over a coordinate corpus.
+
+    Indices returned by queries are row positions in ``coordinates``, so
+    ``index.coordinates[indices]`` gives the matching CoordinateArray.
+
+    Attributes:
+        coordinates: Indexed CoordinateArray
+        metric: 'euclidean' or 'phi_spiral'
+    """
+
+    def __init__(self, coordinates, metric: str = 'euclidean', leaf_size: int = 64):
+        """
+        Build the index.
+
+        Args:
+            coordinates: CoordinateArray, (N, 4) array or sequence of coordinates
+            metric: Distance metric ('euclidean' or 'phi_spiral')
+            leaf_size: Points per KD-tree leaf / spiral cell (approximate)
+        """
+        if metric not in METRICS:
+            raise ValueError(f"Unknown metric: {metric}")
+        if not isinstance(coordinates, CoordinateArray):
+            values = _coordinate_block(coordinates)
+            if isinstance(coordinates, np.ndarray):
+                coordinates = CoordinateArray(values, validate=False)
+            else:
+                coordinates = CoordinateArray.from_coordinates(coordinates)
+
+        self.coordinates = coordinates
+        self.metric = metric
+        values = np.ascontiguousarray(coordinates.values, dtype=np.float64)
+
+        if not len(values):
+            self._tree = None
+        elif metric == 'euclidean':
+            self._tree = cKDTree(values, leafsize=leaf_size)
+        else:
+            self._tree = _SpiralCells(values, leaf_size)
+
+    @classmethod
+    def from_database(cls, database, metric: str = 'euclidean',
+                      leaf_size: int = 64) -> 'SemanticIndex':
+        """
+        Build an index over every concept in a SemanticDatabase.
+
+        Args:
+            database: SemanticDatabase instance
+            metric: Distance metric ('euclidean' or 'phi_spiral')
+            leaf_size: Points per KD-tree leaf / spiral cell (approximate)
+
+        Returns:
+            SemanticIndex over the database contents
+        """
+        coordinates = database.to_arrays(packed=False)
+        return cls(coordinates, metric=metric, leaf_size=leaf_size)
+
+    def __len__(self) -> int:
+        return len(self.coordinates)
+
+    def knn(self, point, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k nearest concepts to a point.
+
+        Args:
+            point: SemanticCoordinate or 4-vector
+            k: Number of neighbours (capped at the index size)
+
+        Returns:
+            Tuple of (indices, distances), each (k,), nearest first
+        """
+        point = _as_point(point)
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty(0, dtype=np.intp), np.empty(0)
+
+        if self.metric == 'euclidean':
+            distances, indices = self._tree.query(point, k=k)
+            return np.atleast_1d(indices).astype(np.intp), np.atleast_1d(distances)
+        return self._tree.knn(point, k)
+
+    def knn_batch(self, points, k: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find the k nearest concepts to each of several points.
+
+        Args:
+            points: CoordinateArray, (Q, 4) array or sequence of coordinates
+            k: Number of neighbours (capped at the index size)
+
+        Returns:
+            Tuple of (indices, distances), each (Q, k), nearest first
+        """
+        points = _coordinate_block(points)
+        k = min(k, len(self))
+        if k <= 0:
+            return np.empty((len(points), 0), dtype=np.intp), np.empty((len(points), 0))
+
+        if self.metric == 'euclidean':
+            distances, indices = self._tree.query(points, k=k)
+            return (indices.reshape(len(points), k).astype(np.intp),
+                    distances.reshape(len(points), k))
+
+        results = [self._tree.knn(point, k) for point in points]
+        return (np.array([r[0] for r in results], dtype=np.intp).reshape(len(points), k),
+                np.array([r[1] for r in results]).reshape(len(points), k))
+
+    def radius(self, point, r: float) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Find every concept within distance r of a point.
+
+        Args:
+            point: SemanticCoordinate or 4-vector
+            r: Radius (inclusive)
+
+        Returns:
+            Tuple of (indices, distances), nearest first
+        """
+        point = _as_point(point)
+        if not len(self):
+            return np.empty(0, dtype=np.intp), np.empty(0)
+
+        if self.metric == 'euclidean':
+            indices = np.asarray(self._tree.query_ball_point(point, r), dtype=np.intp)
+            distances = np.linalg.norm(self.coordinates.values[indices] - point, axis=1)
+            keep = np.lexsort((indices, distances))
+            return indices[keep], distances[keep]
+        return self._tree.radius(point, r)
+
+    def radius_batch(self, points, r: float) -> List[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Find every concept within distance r of each of several points.
+
+        Args:
+            points: CoordinateArray, (Q, 4) array or sequence of coordinates
+            r: Radius (inclusive)
+
+        Returns:
+            List of (indices, distances) tuples, one per point, nearest first
+        """
+        return [self.radius(point, r) for point in _coordinate_block(points)]
+
+    def save(self, path: Union[str, Path]):
+        """
+        Save the built index (tree included) for fast reload.
+
+        Args:
+            path: Destination file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'wb') as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> 'SemanticIndex':
+        """
+        Load an index written by save().
+
+        Args:
+            path: File written by save()
+
+        Returns:
+            The SemanticIndex, ready to query
+        """
+        with open(path, 'rb') as f:
+            index = pickle.load(f)
+        if not isinstance(index, cls):
+            raise TypeError(f"{path} does not contain a {cls.__name__}")
+        return index
+
+    def __repr__(self) -> str:
+        return f"SemanticIndex(n={len(self)}, metric='{self.metric}')"
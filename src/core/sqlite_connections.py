@@ -0,0 +1,164 @@
+"""
+SQLite Connection Management
+============================
+
+Tuned, thread-safe access to a SQLite database file.
+
+SQLite in WAL mode lets any number of readers run concurrently with a
+single writer. ConnectionManager exploits that with one dedicated write
+connection, guarded by a lock, and one read-only connection per thread,
+all opened with the same tuning profile (journal mode, synchronous level,
+page cache and memory-mapped I/O sizes).
+
+In-memory databases exist only inside the connection that created them,
+so for ':memory:' every read shares the writer under the lock.
+"""
+
+import sqlite3
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, List
+
+
+@dataclass(frozen=True)
+class SQLiteTuning:
+    """
+    Pragmas applied to every connection.
+
+    Attributes:
+        journal_mode: 'WAL' lets readers run alongside the writer
+        synchronous: 'OFF', 'NORMAL' or 'FULL' ('NORMAL' is durable
+            across application crashes in WAL mode and skips most fsyncs)
+        cache_size: Page cache per connection (negative = KiB, as in SQLite)
+        mmap_size: Bytes of the file to memory-map for reads (0 disables)
+        busy_timeout: Milliseconds to wait on a locked database
+        temp_store: Where temporary tables and indexes live
+    """
+    journal_mode: str = 'WAL'
+    synchronous: str = 'NORMAL'
+    cache_size: int = -65536
+    mmap_size: int = 268435456
+    busy_timeout: int = 5000
+    temp_store: str = 'MEMORY'
+
+    def apply(self, conn: sqlite3.Connection):
+        """
+        Apply the profile to an open connection.
+
+        Args:
+            conn: Connection to configure
+        """
+        conn.execute(f"PRAGMA journal_mode = {self.journal_mode}")
+        conn.execute(f"PRAGMA synchronous = {self.synchronous}")
+        conn.execute(f"PRAGMA cache_size = {int(self.cache_size)}")
+        conn.execute(f"PRAGMA mmap_size = {int(self.mmap_size)}")
+        conn.execute(f"PRAGMA busy_timeout = {int(self.busy_timeout)}")
+        conn.execute(f"PRAGMA temp_store = {self.temp_store}")
+
+
+class ConnectionManager:
+    """
+    One locked writer plus per-thread readers for a SQLite database.
+
+    Attributes:
+        path: Database path (or ':memory:')
+        tuning: SQLiteTuning applied to every connection
+        writer: The single write connection
+    """
+
+    def __init__(self, path: str, tuning: SQLiteTuning = None):
+        """
+        Open the write connection.
+
+        Args:
+            path: Database path (or ':memory:')
+            tuning: Pragma profile (defaults to SQLiteTuning())
+        """
+        self.path = str(path)
+        self.tuning = tuning or SQLiteTuning()
+        self._shared = self.path == ':memory:' or 'mode=memory' in self.path
+
+        self._lock = threading.RLock()
+        self._owner = None
+        self._depth = 0
+        self._local = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+
+        self.writer = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open and tune a connection usable from any thread."""
+        conn = sqlite3.connect(
+            self.path,
+            timeout=self.tuning.busy_timeout / 1000,
+            check_same_thread=False,
+            uri=self.path.startswith('file:')
+        )
+        self.tuning.apply(conn)
+        return conn
+
+    def _thread_reader(self) -> sqlite3.Connection:
+        """Return this thread's read-only connection, opening it on first use."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = self._connect()
+            conn.execute("PRAGMA query_only = ON")
+            self._local.conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrow a connection for reading.
+
+        A thread inside write() reads through the writer, so it sees its
+        own uncommitted changes; every other thread gets its own reader.
+
+        Yields:
+            sqlite3.Connection
+        """
+        if self._shared or self._owner == threading.get_ident():
+            with self._lock:
+                yield self.writer
+        else:
+            yield self._thread_reader()
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """
+        Hold the writer for one transaction.
+
+        Blocks nest: only the outermost block commits (when it exits
+        normally) or rolls back (when an exception reaches it), so an outer
+        block turns any number of inner writes into a single transaction.
+
+        Yields:
+            The write connection
+        """
+        with self._lock:
+            previous, self._owner = self._owner, threading.get_ident()
+            self._depth += 1
+            try:
+                yield self.writer
+                if self._depth == 1:
+                    self.writer.commit()
+            except BaseException:
+                if self._depth == 1:
+                    self.writer.rollback()
+                raise
+            finally:
+                self._depth -= 1
+                self._owner = previous
+
+    def close(self):
+        """Close every reader and the writer."""
+        with self._readers_lock:
+            readers, self._readers = self._readers, []
+        for conn in readers:
+            conn.close()
+        with self._lock:
+            self.writer.close()
@@ -0,0 +1,219 @@
+"""
+Anthropic API Stub Server
+=========================
+
+Local stand-in for the Anthropic Messages and Message Batches APIs, used
+to exercise the real SDK end to end without network access or an API key.
+
+Each rating is derived from the quoted concept in the prompt, so results
+are deterministic; multi-concept prompts get a JSON array with one rating
+per listed concept. Batches report `in_progress` for the first
+`batch_polls` status checks and `ended` after that. `connect_delay` is
+slept once per new TCP connection to stand in for the TCP and TLS
+handshakes a real endpoint costs.
+"""
+
+import json
+import re
+import threading
+import time
+from urllib.parse import urlparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def stub_rating(prompt: str) -> dict:
+    """Deterministic rating for the first quoted concept in a prompt."""
+    concept = prompt.split('"')[1] if '"' in prompt else prompt
+    value = (sum(map(ord, concept)) % 90 + 5) / 100
+    return {'love': value, 'power': 0.5, 'wisdom': 0.5, 'justice': 0.5}
+
+
+def listed_concepts(prompt: str) -> list:
+    """Concepts listed in a multi-concept prompt (empty for single prompts)."""
+    return [json.loads(line.split('. ', 1)[1]) for line in prompt.splitlines()
+            if re.match(r'^\d+\. "', line)]
+
+
+def message_body(model: str, prompt: str) -> dict:
+    """Messages API response rating the concept(s) in prompt."""
+    group = listed_concepts(prompt)
+    if group:
+        text = json.dumps([dict(stub_rating(f'"{c}"'), concept=c) for c in group])
+    else:
+        text = json.dumps(stub_rating(prompt))
+    return {
+        'id': f"msg_{abs(hash(prompt)) % 10 ** 12}",
+        'type': 'message',
+        'role': 'assistant',
+        'model': model,
+        'content': [{'type': 'text', 'text': text}],
+        'stop_reason': 'end_turn',
+        'stop_sequence': None,
+        'usage': {'input_tokens': len(prompt) // 4, 'output_tokens': 30}
+    }
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def setup(self):
+        super().setup()
+        stub = self.server.stub
+        with stub.lock:
+            stub.connections += 1
+        time.sleep(stub.connect_delay)
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status: int, body, content_type: str = 'application/json'):
+        payload = body if isinstance(body, bytes) else json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _not_found(self):
+        self._send(404, {'type': 'error', 'error': {'type': 'not_found_error',
+                                                    'message': self.path}})
+
+    def _read_json(self) -> dict:
+        length = int(self.headers.get('Content-Length', 0))
+        return json.loads(self.rfile.read(length) or b'{}')
+
+    def do_POST(self):
+        stub = self.server.stub
+        body = self._read_json()
+        with stub.lock:
+            stub.requests.append((self.path, body))
+        time.sleep(stub.latency)
+
+        path = urlparse(self.path).path.rstrip('/')
+        if path == '/v1/messages':
+            prompt = body['messages'][0]['content']
+            self._send(200, message_body(body['model'], prompt))
+        elif path == '/v1/messages/batches':
+            self._send(200, stub.create_batch(body['requests']))
+        else:
+            self._not_found()
+
+    def do_GET(self):
+        stub = self.server.stub
+        with stub.lock:
+            stub.requests.append((self.path, None))
+        parts = urlparse(self.path).path.strip('/').split('/')
+
+        if parts[:3] != ['v1', 'messages', 'batches'] or len(parts) not in (4, 5) \
+                or parts[3] not in stub.batches:
+            self._not_found()
+        elif len(parts) == 4:
+            self._send(200, stub.retrieve_batch(parts[3]))
+        elif parts[4] == 'results':
+            self._send(200, stub.batch_results(parts[3]), 'application/binary')
+        else:
+            self._not_found()
+
+
+class StubAnthropicServer:
+    """
+    Threaded local HTTP server speaking the Messages and Batches APIs.
+
+    Attributes:
+        base_url: URL to pass as the client's base_url
+        connections: TCP connections accepted so far
+        requests: (path, JSON body) of every request received
+        batches: Submitted batches by id, with their requests and polls
+    """
+
+    handler_class = _Handler
+
+    def __init__(self, latency: float = 0.0, connect_delay: float = 0.0,
+                 batch_polls: int = 1, fail_ids=()):
+        """
+        Args:
+            latency: Seconds slept before answering each request
+            connect_delay: Seconds slept once per new connection
+            batch_polls: Status checks a batch stays in_progress for
+            fail_ids: custom_ids whose batch results are errors
+        """
+        self.latency = latency
+        self.connect_delay = connect_delay
+        self.batch_polls = batch_polls
+        self.fail_ids = set(fail_ids)
+        self.connections = 0
+        self.requests = []
+        self.batches = {}
+        self.lock = threading.Lock()
+        self._server = None
+        self._thread = None
+
+    def __enter__(self) -> 'StubAnthropicServer':
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), self.handler_class)
+        self._server.daemon_threads = True
+        self._server.stub = self
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._server.shutdown()
+        self._server.server_close()
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def create_batch(self, requests: list) -> dict:
+        """Store a submitted batch and return its MessageBatch object."""
+        with self.lock:
+            batch_id = f"msgbatch_{len(self.batches):04d}"
+            self.batches[batch_id] = {'requests': requests, 'polls': 0}
+        return self._batch_object(batch_id)
+
+    def retrieve_batch(self, batch_id: str) -> dict:
+        """Count a status check and return the MessageBatch object."""
+        with self.lock:
+            self.batches[batch_id]['polls'] += 1
+        return self._batch_object(batch_id)
+
+    def _ended(self, batch_id: str) -> bool:
+        return self.batches[batch_id]['polls'] >= self.batch_polls
+
+    def _batch_object(self, batch_id: str) -> dict:
+        requests = self.batches[batch_id]['requests']
+        ended = self._ended(batch_id)
+        errored = sum(1 for r in requests if r['custom_id'] in self.fail_ids)
+        return {
+            'id': batch_id,
+            'type': 'message_batch',
+            'processing_status': 'ended' if ended else 'in_progress',
+            'request_counts': {
+                'processing': 0 if ended else len(requests),
+                'succeeded': len(requests) - errored if ended else 0,
+                'errored': errored if ended else 0,
+                'canceled': 0,
+                'expired': 0
+            },
+            'created_at': '2024-01-01T00:00:00Z',
+            'expires_at': '2024-01-02T00:00:00Z',
+            'ended_at': '2024-01-01T01:00:00Z' if ended else None,
+            'archived_at': None,
+            'cancel_initiated_at': None,
+            'results_url': f"{self.base_url}/v1/messages/batches/{batch_id}/results" if ended else None
+        }
+
+    def batch_results(self, batch_id: str) -> bytes:
+        """JSON Lines results of an ended batch."""
+        lines = []
+        for request in self.batches[batch_id]['requests']:
+            if request['custom_id'] in self.fail_ids:
+                result = {'type': 'errored', 'error': {'type': 'error', 'error': {
+                    'type': 'invalid_request_error', 'message': 'stub failure'}}}
+            else:
+                params = request['params']
+                prompt = params['messages'][0]['content']
+                result = {'type': 'succeeded', 'message': message_body(params['model'], prompt)}
+            lines.append(json.dumps({'custom_id': request['custom_id'], 'result': result}))
+        return ("\n".join(lines) + "\n").encode()
@@ -0,0 +1,145 @@
+"""
+Anthropic Client Reuse Tests
+============================
+
+Runs ClaudeAPIGenerator through the real SDK against a local stub server
+and checks that one pooled client (and its connections) is reused, with
+a small latency benchmark against building a client per request.
+"""
+
+import sys
+import time
+import threading
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+import pytest
+
+anthropic = pytest.importorskip('anthropic')
+
+from core.claude_api_generator import ClaudeAPIGenerator, MAX_RESPONSE_TOKENS
+from tests.core.anthropic_stub import StubAnthropicServer, stub_rating
+
+
+def make_generator(tmp_path, server, **kwargs):
+    return ClaudeAPIGenerator(api_key="test-key", cache_path=str(tmp_path / 'cache.db'),
+                              base_url=server.base_url, **kwargs)
+
+
+class TestClientReuse:
+    """Test suite for the shared, pooled Anthropic client."""
+
+    def test_generate_through_stub(self, tmp_path):
+        with StubAnthropicServer() as server:
+            generator = make_generator(tmp_path, server)
+            coord = generator.generate("mercy", use_cache=False)
+            generator.close()
+
+        assert coord.love == stub_rating('"mercy"')['love']
+        path, body = server.requests[0]
+        assert path == '/v1/messages' and body['max_tokens'] == MAX_RESPONSE_TOKENS
+
+    def test_one_client_and_connection_for_sequential_calls(self, tmp_path):
+        with StubAnthropicServer() as server:
+            generator = make_generator(tmp_path, server)
+            client = generator.client
+            for i in range(10):
+                assert generator.generate(f"concept {i}", use_cache=False) is not None
+            assert generator.client is client
+            generator.close()
+
+        assert server.connections == 1
+
+    def test_client_shared_across_threads(self, tmp_path):
+        with StubAnthropicServer(latency=0.02) as server:
+            generator = make_generator(tmp_path, server, max_connections=4)
+            clients = []
+
+            def worker(i):
+                clients.append(generator.client)
+                generator.generate(f"thread {i}", use_cache=False)
+
+            threads = [threading.Thread(target=worker, args=(i,)) for i in range(16)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            results = generator.generate_batch([f"batch {i}" for i in range(16)], max_concurrency=4,
+                                               requests_per_minute=None, tokens_per_minute=None)
+            generator.close()
+
+        assert len({id(client) for client in clients}) == 1
+        assert all(results)
+        assert server.connections <= 4
+
+    def test_multi_concept_requests(self, tmp_path):
+        concepts = [f"concept {i}" for i in range(12)]
+        with StubAnthropicServer() as server:
+            generator = make_generator(tmp_path, server)
+            results = generator.generate_batch(concepts, concepts_per_request=5,
+                                               requests_per_minute=None, tokens_per_minute=None)
+            generator.close()
+
+        assert len(server.requests) == 3
+        assert [r.love for r in results] == [stub_rating(f'"{c}"')['love'] for c in concepts]
+
+    def test_latency_benchmark(self, tmp_path):
+        n = 20
+        with StubAnthropicServer(connect_delay=0.01) as server:
+            generator = make_generator(tmp_path, server)
+            generator.generate("warm up", use_cache=False)
+            started = time.perf_counter()
+            for i in range(n):
+                generator.generate(f"pooled {i}", use_cache=False)
+            pooled = (time.perf_counter() - started) / n
+            generator.close()
+
+            # The previous behaviour: a brand-new client for every request
+            started = time.perf_counter()
+            for i in range(n):
+                client = anthropic.Anthropic(api_key="test-key", base_url=server.base_url)
+                client.messages.create(model=generator.model, max_tokens=MAX_RESPONSE_TOKENS,
+                                       messages=[{"role": "user", "content": f'"fresh {i}"'}])
+                client.close()
+            fresh = (time.perf_counter() - started) / n
+
+        print(f"\nper call: pooled {pooled * 1000:.2f} ms, client per call {fresh * 1000:.2f} ms")
+        assert pooled < fresh
+
+
+class TestBulkJobs:
+    """Test suite for submit_bulk/collect_bulk over the Message Batches API."""
+
+    def test_submit_and_collect(self, tmp_path):
+        concepts = [f"concept {i}" for i in range(7)]
+        with StubAnthropicServer(batch_polls=2, fail_ids={"r1"}) as server:
+            generator = make_generator(tmp_path, server)
+            generator.generate("concept 0")
+            job_id = generator.submit_bulk(concepts + ["concept 1"], concepts_per_request=2,
+                                           max_requests_per_batch=2)
+
+            assert generator.collect_bulk(job_id, wait=False) is None
+            results = generator.collect_bulk(job_id, poll_interval=0.01, timeout=5)
+            generator.close()
+
+        # concept 0 was cached; r1 (concepts 3 and 4) errored
+        assert len(server.batches) == 2
+        assert [r['custom_id'] for b in server.batches.values() for r in b['requests']] == \
+            ["r0", "r1", "r2"]
+        assert list(results) == concepts
+        assert results["concept 3"] is None and results["concept 4"] is None
+        assert results["concept 6"].love == stub_rating('"concept 6"')['love']
+
+        job = generator.load_bulk_job(job_id)
+        assert job['collected'] and job['counts'] == {'succeeded': 4, 'failed': 2}
+
+    def test_collect_from_new_process_state(self, tmp_path):
+        with StubAnthropicServer() as server:
+            job_id = make_generator(tmp_path, server).submit_bulk(["mercy", "war"])
+            generator = make_generator(tmp_path, server)
+            results = generator.collect_bulk(job_id, poll_interval=0.01)
+            generator.close()
+
+        assert results["war"].love == stub_rating('"war"')['love']
+        assert generator.generate("mercy").source.endswith("_cached")
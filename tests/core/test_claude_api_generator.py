@@ -0,0 +1,343 @@
+"""
+Claude API Generator Tests
+==========================
+
+Checks caching, concurrent batch generation and rate limiting of
+ClaudeAPIGenerator with the network call replaced by a local fake.
+"""
+
+import sys
+import re
+import json
+import time
+import asyncio
+import threading
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+import pytest
+
+from core.claude_api_generator import ClaudeAPIGenerator, create_anthropic_client
+from core.rate_limiting import TokenBucket
+from core.response_cache import ResponseCache
+
+
+def fake_rating(prompt):
+    """Deterministic JSON rating derived from the concept in the prompt."""
+    concept = prompt.split('"')[1]
+    value = (sum(map(ord, concept)) % 90 + 5) / 100
+    return json.dumps({'love': value, 'power': 0.5, 'wisdom': 0.5, 'justice': 0.5})
+
+
+def listed_concepts(prompt):
+    """Concepts listed in a multi-concept prompt (empty for single prompts)."""
+    return [json.loads(line.split('. ', 1)[1]) for line in prompt.splitlines()
+            if re.match(r'^\d+\. "', line)]
+
+
+class FakeAPI:
+    """Stands in for ClaudeAPIGenerator._call_api, recording concurrency."""
+
+    def __init__(self, latency=0.05, fail=(), omit=(), malformed=()):
+        self.latency = latency
+        self.fail = set(fail)
+        self.omit = set(omit)
+        self.malformed = set(malformed)
+        self.calls = []
+        self.max_tokens = []
+        self.in_flight = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, prompt, max_tokens=200):
+        group = listed_concepts(prompt)
+        concept = group or prompt.split('"')[1]
+        with self._lock:
+            self.calls.append(concept)
+            self.max_tokens.append(max_tokens)
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        time.sleep(self.latency)
+        with self._lock:
+            self.in_flight -= 1
+        if not group:
+            return None if concept in self.fail else fake_rating(prompt)
+
+        items = []
+        for name in group:
+            if name in self.omit:
+                continue
+            item = dict(json.loads(fake_rating(f'"{name}"')), concept=name.upper())
+            if name in self.malformed:
+                item['love'] = 7
+            items.append(item)
+        return "Here are the ratings:\n" + json.dumps(items, indent=1)
+
+
+class FakeBatches:
+    """Stands in for client.messages.batches; batches end after `polls` checks."""
+
+    def __init__(self, polls=1, fail=()):
+        self.polls = polls
+        self.fail = set(fail)
+        self.submitted = {}
+
+    def create(self, requests):
+        batch_id = f"batch_{len(self.submitted)}"
+        self.submitted[batch_id] = {'requests': requests, 'polls': 0}
+        return self.retrieve(batch_id, count=False)
+
+    def retrieve(self, batch_id, count=True):
+        batch = self.submitted[batch_id]
+        batch['polls'] += count
+        status = 'ended' if batch['polls'] >= self.polls else 'in_progress'
+        return SimpleNamespace(id=batch_id, processing_status=status)
+
+    def results(self, batch_id):
+        api = FakeAPI(latency=0.0)
+        for request in self.submitted[batch_id]['requests']:
+            if request['custom_id'] in self.fail:
+                result = SimpleNamespace(type='errored')
+            else:
+                text = api(request['params']['messages'][0]['content'])
+                message = SimpleNamespace(content=[SimpleNamespace(text=text)])
+                result = SimpleNamespace(type='succeeded', message=message)
+            yield SimpleNamespace(custom_id=request['custom_id'], result=result)
+
+
+def make_generator(tmp_path, api):
+    generator = ClaudeAPIGenerator(api_key="test-key", cache_path=str(tmp_path / 'cache.json'))
+    generator.api_available = True
+    generator._call_api = api
+    return generator
+
+
+def fake_sdk(monkeypatch, http=None):
+    """Install a minimal `anthropic` module, optionally built on a fake HTTP library."""
+    sdk = ModuleType('anthropic')
+    sdk.Anthropic = lambda **kwargs: kwargs
+    if http is not None:
+        base = ModuleType('anthropic_fake_base')
+        base.httpx = http
+
+        class DefaultHttpxClient(http.Client):
+            __module__ = base.__name__
+
+        sdk.DefaultHttpxClient = DefaultHttpxClient
+        monkeypatch.setitem(sys.modules, base.__name__, base)
+    monkeypatch.setitem(sys.modules, 'anthropic', sdk)
+    return sdk
+
+
+class TestCreateClient:
+    """Test suite for create_anthropic_client across SDK versions."""
+
+    def test_without_httpx_falls_back_to_sdk_defaults(self, monkeypatch):
+        fake_sdk(monkeypatch)
+        monkeypatch.setitem(sys.modules, 'httpx', None)
+
+        kwargs = create_anthropic_client(api_key="k", timeout=5.0, max_retries=4)
+        assert kwargs == {'api_key': "k", 'base_url': None, 'timeout': 5.0, 'max_retries': 4}
+
+    def test_limits_come_from_the_sdk_http_library(self, monkeypatch):
+        http = SimpleNamespace(Limits=lambda **kwargs: kwargs)
+        http.Client = type('Client', (), {'__init__': lambda self, **kwargs: setattr(self, 'kwargs', kwargs)})
+        sdk = fake_sdk(monkeypatch, http)
+        monkeypatch.setitem(sys.modules, 'httpx', None)
+
+        kwargs = create_anthropic_client(api_key="k", max_connections=7)
+        client = kwargs['http_client']
+        assert isinstance(client, sdk.DefaultHttpxClient)
+        assert client.kwargs['limits'] == {'max_connections': 7, 'max_keepalive_connections': 7}
+
+
+class TestTokenBucket:
+    """Test suite for the token-bucket rate limiter."""
+
+    def test_delay_and_refill(self):
+        now = [0.0]
+        bucket = TokenBucket(60, capacity=2, clock=lambda: now[0])
+
+        assert bucket.delay(2) == 0.0
+        bucket.tokens -= 2
+        assert bucket.delay(1) == pytest.approx(1.0)
+
+        now[0] = 0.5
+        assert bucket.delay(1) == pytest.approx(0.5)
+        now[0] = 10.0
+        assert bucket.delay(1) == 0.0 and bucket.tokens == 2
+
+        # Oversized requests wait for a full bucket, not forever
+        assert bucket.delay(5) == 0.0
+
+    def test_acquire_paces_requests(self):
+        bucket = TokenBucket(1200, capacity=1)
+
+        async def run():
+            started = time.perf_counter()
+            for _ in range(5):
+                await bucket.acquire()
+            return time.perf_counter() - started
+
+        # One token every 50 ms after the initial one
+        assert asyncio.run(run()) >= 0.19
+
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+
+
+class TestConcurrentBatch:
+    """Test suite for generate_batch_async."""
+
+    def test_results_in_input_order(self, tmp_path):
+        api = FakeAPI()
+        generator = make_generator(tmp_path, api)
+        concepts = [f"concept {i}" for i in range(24)]
+
+        started = time.perf_counter()
+        results = generator.generate_batch(concepts, max_concurrency=8,
+                                           requests_per_minute=None, tokens_per_minute=None)
+        elapsed = time.perf_counter() - started
+
+        assert [r.concept for r in results] == concepts
+        assert [r.love for r in results] == [json.loads(fake_rating(f'"{c}"'))['love'] for c in concepts]
+        assert 1 < api.peak <= 8
+        assert elapsed < 24 * api.latency / 2
+
+    def test_cache_hits_skip_slots_and_duplicates_call_once(self, tmp_path):
+        api = FakeAPI()
+        generator = make_generator(tmp_path, api)
+        generator.generate("warm")
+        api.calls.clear()
+
+        results = asyncio.run(generator.generate_batch_async(
+            ["warm", "cold", "Cold", "warm"], max_concurrency=2))
+
+        assert api.calls == ["cold"]
+        assert [r.concept for r in results] == ["warm", "cold", "Cold", "warm"]
+        assert results[0].source.endswith("_cached")
+        with ResponseCache(tmp_path / 'cache.db') as stored:
+            assert set(stored) == {"claude-3-5-sonnet-20241022:warm", "claude-3-5-sonnet-20241022:cold"}
+
+    def test_failures_and_unavailable_api(self, tmp_path):
+        generator = make_generator(tmp_path, FakeAPI(fail={"bad"}))
+        results = generator.generate_batch(["good", "bad"], max_concurrency=2)
+        assert results[0] is not None and results[1] is None
+
+        generator.api_available = False
+        assert generator.generate_batch(["good"], max_concurrency=2) == [None]
+
+    def test_request_quota_limits_throughput(self, tmp_path):
+        api = FakeAPI(latency=0.0)
+        generator = make_generator(tmp_path, api)
+
+        async def run():
+            started = time.perf_counter()
+            # 600 requests/minute: a burst of 10, then one every 100 ms
+            await generator.generate_batch_async([f"c{i}" for i in range(12)], max_concurrency=12,
+                                                 requests_per_minute=600, tokens_per_minute=None)
+            return time.perf_counter() - started
+
+        assert asyncio.run(run()) >= 0.15
+        assert len(api.calls) == 12
+
+
+class TestMultiConceptPrompts:
+    """Test suite for rating several concepts per request."""
+
+    def test_batch_prompt_carries_rubric_once(self, tmp_path):
+        generator = make_generator(tmp_path, FakeAPI())
+        concepts = ["mercy", 'say "hi"', "war"]
+        prompt = generator._create_batch_prompt(concepts)
+
+        assert listed_concepts(prompt) == concepts
+        assert prompt.count("**1. LOVE") == 1
+        assert len(prompt) < 1.2 * len(generator._create_prompt("mercy"))
+
+    def test_parse_batch_response(self, tmp_path):
+        generator = make_generator(tmp_path, FakeAPI())
+        response = json.dumps([
+            {'concept': 'Mercy', 'love': 0.9, 'power': 0.5, 'wisdom': 0.7, 'justice': 0.8},
+            {'concept': 'war', 'love': 0.1, 'power': 0.9, 'wisdom': 0.3},
+            {'concept': 'hope', 'love': 1.4, 'power': 0.5, 'wisdom': 0.5, 'justice': 0.5},
+            {'concept': 'stranger', 'love': 0.5, 'power': 0.5, 'wisdom': 0.5, 'justice': 0.5},
+        ])
+        parsed = generator._parse_batch_response(response, ["mercy", "war", "hope"])
+
+        assert list(parsed) == ["mercy"]
+        assert parsed["mercy"][0] == (0.9, 0.5, 0.7, 0.8)
+        assert generator._parse_batch_response("no json here", ["mercy"]) == {}
+
+    def test_grouped_requests_with_fallback(self, tmp_path):
+        api = FakeAPI(latency=0.0, omit={"c3"}, malformed={"c5"})
+        generator = make_generator(tmp_path, api)
+        concepts = [f"c{i}" for i in range(10)]
+
+        results = generator.generate_batch(concepts, concepts_per_request=4,
+                                           requests_per_minute=None, tokens_per_minute=None)
+
+        assert [r.concept for r in results] == concepts
+        assert [r.love for r in results] == [json.loads(fake_rating(f'"{c}"'))['love'] for c in concepts]
+        groups = [call for call in api.calls if isinstance(call, list)]
+        assert groups == [concepts[0:4], concepts[4:8], concepts[8:10]]
+        assert sorted(call for call in api.calls if isinstance(call, str)) == ["c3", "c5"]
+        assert max(api.max_tokens) > 200
+
+        # Every rating, batched or not, is cached under its own concept
+        api.calls.clear()
+        again = generator.generate_batch(concepts, concepts_per_request=4)
+        assert api.calls == [] and all(r.source.endswith("_cached") for r in again)
+
+
+class TestBulkJobs:
+    """Test suite for submit_bulk/collect_bulk with a fake batches resource."""
+
+    def make_bulk_generator(self, tmp_path, batches):
+        generator = make_generator(tmp_path, FakeAPI())
+        generator._batches = lambda: batches
+        return generator
+
+    def test_submit_groups_and_persists(self, tmp_path):
+        batches = FakeBatches(polls=3)
+        generator = self.make_bulk_generator(tmp_path, batches)
+        generator.generate("c0")
+        job_id = generator.submit_bulk([f"c{i}" for i in range(8)] + ["c2"],
+                                       concepts_per_request=3, max_requests_per_batch=2)
+
+        job = generator.load_bulk_job(job_id)
+        assert [b['requests'] for b in job['batches']] == [
+            {'r0': ["c1", "c2", "c3"], 'r1': ["c4", "c5", "c6"]}, {'r2': ["c7"]}]
+        params = batches.submitted['batch_1']['requests'][0]['params']
+        assert params['model'] == generator.model and '"c7"' in params['messages'][0]['content']
+
+        assert generator.collect_bulk(job_id, wait=False) is None
+        with pytest.raises(TimeoutError):
+            generator.collect_bulk(job_id, poll_interval=0.01, timeout=0.001)
+        with pytest.raises(KeyError):
+            generator.load_bulk_job("missing")
+
+    def test_collect_merges_into_cache(self, tmp_path):
+        concepts = [f"c{i}" for i in range(6)]
+        batches = FakeBatches(polls=2, fail={"r1"})
+        generator = self.make_bulk_generator(tmp_path, batches)
+        job_id = generator.submit_bulk(concepts, concepts_per_request=2)
+
+        results = generator.collect_bulk(job_id, poll_interval=0.01)
+
+        assert list(results) == concepts
+        assert results["c2"] is None and results["c3"] is None
+        assert results["c5"].love == json.loads(fake_rating('"c5"'))['love']
+        assert generator.load_bulk_job(job_id)['counts'] == {'succeeded': 4, 'failed': 2}
+
+        # Collected jobs are served from the cache without touching the API
+        generator._batches = None
+        assert generator.collect_bulk(job_id)["c0"].source.endswith("_cached")
+        with ResponseCache(tmp_path / 'cache.db') as stored:
+            assert len(stored) == 4
+
+    def test_unavailable_api(self, tmp_path):
+        generator = self.make_bulk_generator(tmp_path, FakeBatches())
+        generator.api_available = False
+        with pytest.raises(RuntimeError):
+            generator.submit_bulk(["c0"])
@@ -0,0 +1,71 @@
+"""
+Compact Coordinate Tests
+========================
+
+Checks that the slotted, frozen CompactSemanticCoordinate is a drop-in
+replacement for SemanticCoordinate.
+"""
+
+import sys
+import pickle
+from pathlib import Path
+from dataclasses import FrozenInstanceError
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+import pytest
+
+from core.semantic_coordinates import (
+    CompactSemanticCoordinate,
+    CoordinateArray,
+    HashBasedCoordinateGenerator,
+    find_closest_to_anchor
+)
+
+
+class TestCompactSemanticCoordinate:
+    """Test suite for the compact coordinate variant."""
+
+    def setup_method(self):
+        generator = HashBasedCoordinateGenerator('sha256')
+        self.coords = [generator.generate(f"concept_{i}") for i in range(100)]
+        self.compact = [CompactSemanticCoordinate.from_coordinate(c) for c in self.coords]
+
+    def test_metrics_match(self):
+        target = self.coords[0]
+        for regular, compact in zip(self.coords, self.compact):
+            assert compact.distance_to_anchor() == pytest.approx(regular.distance_to_anchor(), rel=1e-12)
+            assert compact.similarity_to_anchor() == pytest.approx(regular.similarity_to_anchor(), rel=1e-12)
+            assert compact.distance_to(target) == pytest.approx(regular.distance_to(target), rel=1e-12)
+            assert compact.phi_distance_to_anchor() == pytest.approx(regular.phi_distance_to_anchor(), rel=1e-12)
+            assert compact.nearest_dodecahedral_anchor()[0] == regular.nearest_dodecahedral_anchor()[0]
+
+    def test_equality_and_conversion(self):
+        for regular, compact in zip(self.coords, self.compact):
+            assert compact == regular
+            assert regular == compact
+            assert compact.to_coordinate() == regular
+        assert len(set(self.compact)) == len(self.compact)
+
+    def test_cached_metrics(self):
+        compact = self.compact[0]
+        assert compact.distance_to_anchor() is compact.distance_to_anchor()
+        assert compact.vector is compact.vector
+        with pytest.raises(ValueError):
+            compact.vector[0] = 0.0
+
+    def test_frozen_and_slotted(self):
+        compact = self.compact[0]
+        assert not hasattr(compact, '__dict__')
+        with pytest.raises(FrozenInstanceError):
+            compact.love = 0.5
+        with pytest.raises(ValueError):
+            CompactSemanticCoordinate("bad", 0.5, 0.5, 0.5, 1.5)
+
+    def test_pickle(self):
+        compact = self.compact[0]
+        assert pickle.loads(pickle.dumps(compact)) == compact
+
+    def test_works_with_collections(self):
+        array = CoordinateArray.from_coordinates(self.compact)
+        assert array.to_coordinates(compact=True) == self.compact
+        assert find_closest_to_anchor(self.compact, n=5) == find_closest_to_anchor(self.coords, n=5)
@@ -0,0 +1,111 @@
+"""
+Columnar Coordinate Tests
+=========================
+
+Checks that CoordinateArray agrees with the per-object SemanticCoordinate
+API it accelerates.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+import pytest
+import numpy as np
+
+from core.semantic_coordinates import (
+    CoordinateArray,
+    HashBasedCoordinateGenerator,
+    calculate_statistics,
+    find_closest_to_anchor
+)
+
+
+def make_coords(n: int = 200):
+    """Generate n reproducible hash-based coordinates."""
+    generator = HashBasedCoordinateGenerator('sha256')
+    return [generator.generate(f"concept_{i}") for i in range(n)]
+
+
+class TestCoordinateArray:
+    """Test suite for the struct-of-arrays container."""
+
+    def test_round_trip(self):
+        coords = make_coords()
+        array = CoordinateArray.from_coordinates(coords)
+
+        assert len(array) == len(coords)
+        assert array.values.shape == (len(coords), 4)
+        assert array.to_coordinates() == coords
+        assert list(array) == coords
+
+    def test_vectorized_anchor_metrics(self):
+        coords = make_coords()
+        array = CoordinateArray.from_coordinates(coords)
+
+        expected = [c.distance_to_anchor() for c in coords]
+        np.testing.assert_allclose(array.distance_to_anchor(), expected, rtol=1e-12)
+
+        expected = [c.similarity_to_anchor() for c in coords]
+        np.testing.assert_allclose(array.similarity_to_anchor(), expected, rtol=1e-12)
+
+    def test_distance_to_point_and_rows(self):
+        coords = make_coords()
+        array = CoordinateArray.from_coordinates(coords)
+        target = coords[0]
+
+        expected = [c.distance_to(target) for c in coords]
+        np.testing.assert_allclose(array.distance_to(target), expected, rtol=1e-12)
+        np.testing.assert_allclose(array.distance_to(target.vector), expected, rtol=1e-12)
+
+        reversed_array = array[::-1]
+        expected = [a.distance_to(b) for a, b in zip(coords, reversed(coords))]
+        np.testing.assert_allclose(array.distance_to(reversed_array), expected, rtol=1e-12)
+
+    def test_slicing_and_masking(self):
+        coords = make_coords()
+        array = CoordinateArray.from_coordinates(coords)
+
+        assert array[3] == coords[3]
+        assert array[10:20].to_coordinates() == coords[10:20]
+        assert np.shares_memory(array[10:20].values, array.values)
+
+        mask = array.love > 0.5
+        assert array[mask].to_coordinates() == [c for c in coords if c.love > 0.5]
+
+        picked = array[np.array([5, 1, 7])]
+        assert picked.to_coordinates() == [coords[5], coords[1], coords[7]]
+
+    def test_shared_source(self):
+        array = CoordinateArray(np.full((3, 4), 0.5), concepts=['a', 'b', 'c'], sources='test')
+
+        assert array[1].source == 'test'
+        assert array[1:].sources == 'test'
+        assert CoordinateArray.concatenate([array, array]).sources == 'test'
+
+    def test_validation(self):
+        with pytest.raises(ValueError):
+            CoordinateArray(np.array([[0.5, 0.5, 0.5, 1.5]]))
+        with pytest.raises(ValueError):
+            CoordinateArray(np.array([[0.5, 0.5, 0.5, np.nan]]))
+        with pytest.raises(ValueError):
+            CoordinateArray(np.zeros((2, 3)))
+
+    def test_statistics_accept_both_layouts(self):
+        coords = make_coords()
+        array = CoordinateArray.from_coordinates(coords)
+
+        from_list = calculate_statistics(coords)
+        from_array = calculate_statistics(array)
+        for key, value in from_list.items():
+            assert from_array[key] == pytest.approx(value, rel=1e-12)
+
+        assert from_list['mean_love'] == pytest.approx(np.mean([c.love for c in coords]))
+
+    def test_closest_to_anchor(self):
+        coords = make_coords()
+        array = CoordinateArray.from_coordinates(coords)
+
+        expected = sorted(coords, key=lambda c: c.distance_to_anchor())[:10]
+        assert find_closest_to_anchor(coords, n=10) == expected
+        assert find_closest_to_anchor(array, n=10).to_coordinates() == expected
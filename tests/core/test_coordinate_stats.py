@@ -0,0 +1,74 @@
+"""
+Streaming Statistics Tests
+==========================
+
+Checks that CoordinateStats reproduces NumPy's two-pass statistics when
+fed in one batch, in chunks, from iterators, cursors and merged groups.
+"""
+
+import sys
+import sqlite3
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+import pytest
+import numpy as np
+
+from core.semantic_coordinates import HashBasedCoordinateGenerator
+from core.coordinate_stats import CoordinateStats
+
+
+class TestCoordinateStats:
+    """Test suite for the mergeable statistics accumulator."""
+
+    def setup_method(self):
+        generator = HashBasedCoordinateGenerator('sha256')
+        self.array = generator.generate_many(f"concept_{i}" for i in range(3000))
+        values = self.array.values
+        self.block = np.column_stack((values, self.array.distance_to_anchor()))
+
+    def assert_matches(self, stats, block):
+        assert stats.count == len(block)
+        np.testing.assert_allclose(stats.mean, block.mean(axis=0), rtol=1e-12)
+        np.testing.assert_allclose(stats.std, block.std(axis=0), rtol=1e-10)
+        np.testing.assert_array_equal(stats.min, block.min(axis=0))
+        np.testing.assert_array_equal(stats.max, block.max(axis=0))
+
+    def test_single_batch(self):
+        self.assert_matches(CoordinateStats().update(self.array), self.block)
+
+    def test_chunked_merge(self):
+        parts = [CoordinateStats().update(self.array[i:i + 700]) for i in range(0, len(self.array), 700)]
+        self.assert_matches(CoordinateStats.combine(parts), self.block)
+        self.assert_matches(parts[0] + parts[1], self.block[:1400])
+
+    def test_iterators(self):
+        coords = self.array.to_coordinates()
+        self.assert_matches(CoordinateStats().update_iter(iter(coords), chunk_size=256), self.block)
+        self.assert_matches(CoordinateStats().update_iter(self.array[i:i + 500] for i in range(0, 3000, 500)), self.block)
+
+    def test_cursor(self):
+        conn = sqlite3.connect(':memory:')
+        conn.execute("CREATE TABLE c (love REAL, power REAL, wisdom REAL, justice REAL, concept TEXT)")
+        conn.executemany("INSERT INTO c VALUES (?, ?, ?, ?, ?)",
+                         [tuple(v) + (name,) for v, name in zip(self.array.values.tolist(), self.array.concepts)])
+        cursor = conn.execute("SELECT love, power, wisdom, justice, concept FROM c")
+
+        self.assert_matches(CoordinateStats.from_cursor(cursor, batch_size=128), self.block)
+
+    def test_grouped(self):
+        labels = np.where(self.array.love > 0.5, 'high', 'low')
+        groups = CoordinateStats.grouped(self.array, labels)
+
+        assert set(groups) == {'high', 'low'}
+        for label, stats in groups.items():
+            self.assert_matches(stats, self.block[labels == label])
+        self.assert_matches(CoordinateStats.combine(groups.values()), self.block)
+
+    def test_as_dict(self):
+        summary = CoordinateStats().update(self.array).as_dict()
+
+        assert summary['n'] == len(self.array)
+        assert summary['mean_distance'] == pytest.approx(self.block[:, 4].mean())
+        assert summary['std_love'] == pytest.approx(self.block[:, 0].std())
+        assert np.isnan(CoordinateStats().as_dict()['mean_love'])
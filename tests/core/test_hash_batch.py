@@ -0,0 +1,64 @@
+"""
+Batch Hash Generation Tests
+===========================
+
+Checks that HashBasedCoordinateGenerator.generate_many reproduces the
+per-concept generate() values exactly, in one process and in a pool.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+import pytest
+import numpy as np
+
+from core.semantic_coordinates import (
+    CoordinateArray,
+    HashBasedCoordinateGenerator,
+    _decode_digests
+)
+
+
+CONCEPTS = ["JEHOVAH", "AGAPE", "Love", "", "Holy Spirit", "Ωmega"] + [f"concept_{i}" for i in range(2000)]
+
+
+class TestGenerateMany:
+    """Test suite for batch hash-based generation."""
+
+    @pytest.mark.parametrize('algorithm', ['sha256', 'sha512', 'md5', 'sha1', 'blake2b', 'sha224', 'sha384'])
+    def test_matches_generate_exactly(self, algorithm):
+        generator = HashBasedCoordinateGenerator(algorithm)
+        expected = np.array([generator.generate(c).coordinates for c in CONCEPTS])
+
+        result = generator.generate_many(iter(CONCEPTS))
+
+        assert isinstance(result, CoordinateArray)
+        assert np.array_equal(result.values, expected)
+        assert list(result.concepts) == CONCEPTS
+        assert result[0] == generator.generate(CONCEPTS[0])
+
+    def test_process_pool(self):
+        generator = HashBasedCoordinateGenerator('sha256')
+        single = generator.generate_many(CONCEPTS)
+        pooled = generator.generate_many(CONCEPTS, workers=2, chunk_size=300)
+
+        assert np.array_equal(single.values, pooled.values)
+        assert list(pooled.concepts) == CONCEPTS
+
+    @pytest.mark.parametrize('segment_size', [8, 16])
+    def test_rounding_edge_cases(self, segment_size):
+        bits = 8 * segment_size
+        values = [
+            0, 1, (1 << 53) - 1, 1 << 53, (1 << 53) + 1,
+            (1 << 63) | (1 << 10),              # exact half-way case
+            (1 << 63) | (1 << 11) | (1 << 10),  # half-way, odd mantissa
+            (1 << bits) - 1, (1 << bits) - 2, (1 << (bits - 1)) + 12345,
+            (1 << 52) << (bits - 64), 7 << (bits - 62),
+        ]
+        digests = b''.join(v.to_bytes(segment_size, 'big') for v in values)
+
+        decoded = _decode_digests(digests, 4 * segment_size).ravel()
+
+        expected = [v / (2 ** bits - 1) for v in values]
+        assert decoded.tolist() == expected
@@ -0,0 +1,83 @@
+"""
+Pairwise Distance Engine Tests
+==============================
+
+Checks the tiled pairwise distance engine against the per-pair
+SemanticCoordinate.distance_to() definition.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+import pytest
+import numpy as np
+from scipy.spatial.distance import pdist
+
+from core.semantic_coordinates import (
+    CoordinateArray,
+    HashBasedCoordinateGenerator,
+    calculate_pairwise_distances,
+    iter_pairwise_distance_blocks,
+    pairwise_distances_condensed,
+    condensed_index
+)
+
+
+class TestPairwiseDistances:
+    """Test suite for blocked pairwise distances."""
+
+    def setup_method(self):
+        generator = HashBasedCoordinateGenerator('sha256')
+        self.coords = [generator.generate(f"concept_{i}") for i in range(157)]
+        self.array = CoordinateArray.from_coordinates(self.coords)
+
+    def test_dense_matches_reference(self):
+        n = len(self.coords)
+        expected = np.zeros((n, n))
+        for i in range(n):
+            for j in range(i + 1, n):
+                expected[i, j] = expected[j, i] = self.coords[i].distance_to(self.coords[j])
+
+        result = calculate_pairwise_distances(self.coords, block_size=40)
+
+        np.testing.assert_allclose(result, expected, rtol=1e-12, atol=1e-15)
+        assert np.array_equal(result, result.T)
+        assert not np.diagonal(result).any()
+
+    def test_condensed_layout(self):
+        condensed = pairwise_distances_condensed(self.array, block_size=32)
+
+        assert condensed.dtype == np.float32
+        np.testing.assert_allclose(condensed, pdist(self.array.values), rtol=1e-6)
+
+        n = len(self.array)
+        assert condensed[condensed_index(3, 90, n)] == pytest.approx(self.coords[3].distance_to(self.coords[90]), rel=1e-6)
+
+    def test_memmap_output(self, tmp_path):
+        path = tmp_path / "distances.f32"
+        condensed = pairwise_distances_condensed(self.array, block_size=50, memmap_path=str(path))
+
+        assert isinstance(condensed, np.memmap)
+        reloaded = np.memmap(path, dtype=np.float32, mode='r')
+        np.testing.assert_array_equal(reloaded, pairwise_distances_condensed(self.array))
+
+    def test_streaming_reduction(self):
+        threshold = 0.5
+        dense = calculate_pairwise_distances(self.array)
+        expected = int((np.triu(dense, k=1)[np.triu_indices(len(dense), k=1)] < threshold).sum())
+
+        close_pairs = 0
+        for row_start, col_start, tile in iter_pairwise_distance_blocks(self.array, block_size=25):
+            rows = np.arange(row_start, row_start + tile.shape[0])[:, None]
+            cols = np.arange(col_start, col_start + tile.shape[1])[None, :]
+            close_pairs += int(((tile < threshold) & (cols > rows)).sum())
+
+        assert close_pairs == expected
+
+    def test_cross_distances(self):
+        other = self.array[:10]
+        tiles = {(r, c): t for r, c, t in iter_pairwise_distance_blocks(self.array, other, block_size=64)}
+
+        assert (128, 0) in tiles
+        assert tiles[(64, 0)][1, 2] == pytest.approx(self.coords[65].distance_to(self.coords[2]))
@@ -0,0 +1,190 @@
+"""
+Batch Phi-Geometric Tests
+=========================
+
+Checks that the broadcasting phi-geometric kernels return exactly the
+values of their scalar counterparts.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+import pytest
+import numpy as np
+
+from core.semantic_coordinates import (
+    CoordinateArray,
+    HashBasedCoordinateGenerator,
+    SemanticCoordinate,
+    distance_metrics_batch
+)
+from core.phi_geometric import (
+    PHI,
+    PHI_INVERSE,
+    golden_spiral_distance_4d,
+    golden_spiral_distance_pairs,
+    golden_spiral_distance_matrix,
+    golden_spiral_distance_to_anchor,
+    DODECAHEDRAL_ANCHORS,
+    generate_dodecahedral_anchors,
+    nearest_anchor,
+    nearest_anchor_batch,
+    phi_harmony_score,
+    phi_harmony_score_batch
+)
+
+
+def reference_spiral_distance(v1, v2):
+    """Original closed-form golden spiral distance, written out directly."""
+    r1, r2 = np.linalg.norm(v1), np.linalg.norm(v2)
+    cos_angle = np.clip(np.dot(v1, v2) / (r1 * r2), -1, 1) if r1 * r2 > 0 else 1.0
+    angular_dist = np.arccos(cos_angle)
+    factor = min(r1, r2) * np.sqrt(1 + np.log(PHI) ** 2) * PHI ** 2
+    spiral_arc = factor * abs(PHI ** (angular_dist / (np.pi / 2)) - 1.0)
+    return PHI_INVERSE * spiral_arc + (1 - PHI_INVERSE) * abs(r2 - r1)
+
+
+class TestGoldenSpiralBatch:
+    """Test suite for vectorized golden spiral distances."""
+
+    def setup_method(self):
+        rng = np.random.default_rng(42)
+        self.a = rng.random((120, 4))
+        self.b = rng.random((35, 4))
+        self.a[0] = 0.0            # zero vector
+        self.b[1] = self.a[2]      # identical pair
+
+    def test_matrix_identical_to_scalar(self):
+        matrix = golden_spiral_distance_matrix(self.a, self.b)
+        scalar = np.array([[golden_spiral_distance_4d(x, y) for y in self.b] for x in self.a])
+
+        assert matrix.shape == (120, 35)
+        assert np.array_equal(matrix, scalar)
+
+    def test_pairs_and_anchor_identical_to_scalar(self):
+        pairs = golden_spiral_distance_pairs(self.a[:35], self.b)
+        assert np.array_equal(pairs, [golden_spiral_distance_4d(x, y) for x, y in zip(self.a, self.b)])
+
+        anchor = np.ones(4)
+        to_anchor = golden_spiral_distance_to_anchor(self.a)
+        assert np.array_equal(to_anchor, [golden_spiral_distance_4d(x, anchor) for x in self.a])
+
+    def test_matches_closed_form(self):
+        scalar = [golden_spiral_distance_4d(x, y) for x, y in zip(self.a, self.b)]
+        expected = [reference_spiral_distance(x, y) for x, y in zip(self.a, self.b)]
+        np.testing.assert_allclose(scalar, expected, rtol=1e-12, atol=1e-15)
+
+    def test_coordinate_array(self):
+        generator = HashBasedCoordinateGenerator('sha256')
+        array = generator.generate_many(f"concept_{i}" for i in range(200))
+
+        expected = [c.phi_distance_to_anchor() for c in array]
+        assert np.array_equal(array.phi_distance_to_anchor(), expected)
+
+
+class TestNearestAnchorBatch:
+    """Test suite for the precomputed anchor network and batch assignment."""
+
+    def setup_method(self):
+        rng = np.random.default_rng(7)
+        self.points = rng.random((500, 4))
+        self.points[0] = DODECAHEDRAL_ANCHORS[3]
+
+    def test_network_is_read_only(self):
+        assert DODECAHEDRAL_ANCHORS.shape == (12, 4)
+        with pytest.raises(ValueError):
+            DODECAHEDRAL_ANCHORS[0, 0] = 0.0
+
+        copies = generate_dodecahedral_anchors()
+        copies[0][0] = 0.0
+        assert DODECAHEDRAL_ANCHORS[0, 0] == 1.0
+
+    @pytest.mark.parametrize('metric', ['euclidean', 'phi_spiral'])
+    def test_batch_matches_scalar(self, metric):
+        indices, distances = nearest_anchor_batch(self.points, metric=metric, chunk_size=64)
+        scalar = [nearest_anchor(p, metric=metric) for p in self.points]
+
+        assert indices.tolist() == [i for i, _ in scalar]
+        np.testing.assert_allclose(distances, [d for _, d in scalar], rtol=1e-12)
+        assert indices[0] == 3
+
+    def test_brute_force_reference(self):
+        indices, distances = nearest_anchor_batch(self.points)
+        brute = np.linalg.norm(self.points[:, None, :] - DODECAHEDRAL_ANCHORS[None], axis=2)
+
+        assert np.array_equal(indices, brute.argmin(axis=1))
+        np.testing.assert_allclose(distances, brute.min(axis=1), rtol=1e-12)
+
+    def test_custom_anchors_and_errors(self):
+        anchors = [np.zeros(4), np.ones(4)]
+        indices, _ = nearest_anchor_batch([[0.1] * 4, [0.9] * 4], anchors=anchors)
+        assert indices.tolist() == [0, 1]
+
+        with pytest.raises(ValueError):
+            nearest_anchor_batch(self.points, metric='manhattan')
+
+    def test_coordinate_array(self):
+        array = CoordinateArray(self.points)
+        indices, distances = array.nearest_dodecahedral_anchor()
+        expected = [c.nearest_dodecahedral_anchor() for c in array]
+
+        assert indices.tolist() == [i for i, _ in expected]
+        assert np.array_equal(distances, [d for _, d in expected])
+
+
+def reference_harmony(vector):
+    """Original loop-based phi-harmony score, written out directly."""
+    ratios = [min(abs(vector[i + 1] / vector[i] - PHI), abs(vector[i + 1] / vector[i] - PHI_INVERSE))
+              for i in range(len(vector) - 1) if vector[i] != 0]
+    return float(np.exp(-np.mean(ratios) * 2)) if ratios else 0.0
+
+
+class TestDistanceMetricsBatch:
+    """Test suite for batch phi-harmony and fused distance metrics."""
+
+    def setup_method(self):
+        rng = np.random.default_rng(11)
+        self.points = rng.random((300, 4))
+        self.points[0] = 0.0                      # no valid ratios
+        self.points[1] = [0.0, 0.5, 0.0, 0.25]    # zero denominators skipped
+        self.points[2] = [PHI_INVERSE ** 3, PHI_INVERSE ** 2, PHI_INVERSE, 1.0]
+
+    def test_harmony_batch_matches_reference(self):
+        batch = phi_harmony_score_batch(self.points)
+        expected = [reference_harmony(p) for p in self.points]
+
+        np.testing.assert_allclose(batch, expected, rtol=1e-12)
+        assert batch[0] == 0.0
+        assert batch[2] == pytest.approx(1.0)
+        assert np.array_equal(batch, [phi_harmony_score(p) for p in self.points])
+
+    def test_metrics_match_per_concept(self):
+        array = CoordinateArray(self.points, concepts=[f"c{i}" for i in range(300)])
+        result = distance_metrics_batch(array, chunk_size=64)
+        expected = [c.distance_metrics() for c in array]
+
+        assert result.dtype.names == ('euclidean', 'phi_spiral', 'phi_harmony')
+        np.testing.assert_allclose(result['euclidean'], [m['euclidean'] for m in expected], rtol=1e-12)
+        assert np.array_equal(result['phi_spiral'], [m['phi_spiral'] for m in expected])
+        assert np.array_equal(result['phi_harmony'], [m['phi_harmony'] for m in expected])
+
+    def test_subset_and_frame(self):
+        array = CoordinateArray(self.points[:5], concepts=list('abcde'))
+        frame = array.distance_metrics(metrics=('phi_harmony',), as_frame=True)
+
+        assert list(frame.columns) == ['phi_harmony']
+        assert list(frame.index) == list('abcde')
+
+        with pytest.raises(ValueError):
+            distance_metrics_batch(self.points, metrics=('manhattan',))
+
+    def test_one_shot_iterable_and_repeated_metrics(self):
+        coords = [SemanticCoordinate(f"c{i}", *p) for i, p in enumerate(self.points[:4])]
+        frame = distance_metrics_batch((c for c in coords), metrics=('euclidean',), as_frame=True)
+
+        assert list(frame.index) == ["c0", "c1", "c2", "c3"]
+        np.testing.assert_allclose(frame['euclidean'], [c.distance_to_anchor() for c in coords])
+
+        with pytest.raises(ValueError, match="Repeated"):
+            distance_metrics_batch(self.points, metrics=('euclidean', 'euclidean'))
@@ -0,0 +1,93 @@
+"""
+Response Cache Tests
+====================
+
+Checks the SQLite-backed response cache: mapping behaviour, batched
+flushes, legacy JSON migration and concurrent writers.
+"""
+
+import sys
+import json
+import multiprocessing
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+import pytest
+
+from core.response_cache import ResponseCache
+
+
+def write_entries(path, worker, n):
+    """Child-process writer for the concurrency test."""
+    with ResponseCache(path, flush_every=7) as cache:
+        for i in range(n):
+            cache[f"model:w{worker}_{i}"] = {'love': i / n}
+
+
+class TestResponseCache:
+    """Test suite for ResponseCache."""
+
+    def test_mapping_behaviour(self, tmp_path):
+        with ResponseCache(tmp_path / 'cache.db') as cache:
+            cache["model:a"] = {'love': 0.1}
+            cache["model:b"] = {'love': 0.2}
+            cache["model:a"] = {'love': 0.3}
+
+            assert cache["model:a"] == {'love': 0.3}
+            assert "model:b" in cache and "model:c" not in cache
+            assert cache.get("model:c") is None
+            assert list(cache) == ["model:a", "model:b"] and len(cache) == 2
+
+            del cache["model:b"]
+            assert "model:b" not in cache
+            with pytest.raises(KeyError):
+                del cache["model:b"]
+
+        with ResponseCache(tmp_path / 'cache.db') as reopened:
+            assert dict(reopened) == {"model:a": {'love': 0.3}}
+
+    def test_batched_flush(self, tmp_path):
+        cache = ResponseCache(tmp_path / 'cache.db', flush_every=3)
+        reader = ResponseCache(tmp_path / 'cache.db')
+
+        cache["k1"] = 1
+        cache["k2"] = 2
+        assert "k1" not in reader
+        cache["k3"] = 3
+        assert reader["k1"] == 1 and reader["k3"] == 3
+
+        cache["k4"] = 4
+        cache.close()
+        assert reader["k4"] == 4
+        reader.close()
+
+    def test_legacy_json_migrated_once(self, tmp_path):
+        legacy = tmp_path / 'claude_api_cache.json'
+        legacy.write_text(json.dumps({"model:love": {'love': 1.0}, "model:hate": {'love': 0.0}}, indent=2))
+
+        with ResponseCache(legacy) as cache:
+            assert cache.path == tmp_path / 'claude_api_cache.db'
+            assert cache["model:love"] == {'love': 1.0}
+            cache["model:love"] = {'love': 0.9}
+            del cache["model:hate"]
+
+        # A later open neither re-imports nor overwrites newer entries
+        legacy.write_text(json.dumps({"model:love": {'love': 1.0}, "model:new": {'love': 0.5}}))
+        with ResponseCache(legacy) as cache:
+            assert dict(cache) == {"model:love": {'love': 0.9}}
+
+    def test_concurrent_processes(self, tmp_path):
+        path = tmp_path / 'shared.db'
+        ResponseCache(path).close()
+
+        context = multiprocessing.get_context('spawn')
+        workers = [context.Process(target=write_entries, args=(path, w, 50)) for w in range(4)]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(timeout=60)
+            assert worker.exitcode == 0
+
+        with ResponseCache(path) as cache:
+            assert len(cache) == 200
+            assert cache["model:w3_49"] == {'love': 0.98}
@@ -0,0 +1,783 @@
+"""
+Semantic Database Tests
+=======================
+
+Checks connection tuning, concurrent access and the ingestion and query
+APIs of SemanticDatabase.
+"""
+
+import sys
+import json
+import sqlite3
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+import pytest
+import numpy as np
+
+from core.semantic_coordinates import (
+    SemanticCoordinate,
+    CoordinateArray,
+    HashBasedCoordinateGenerator
+)
+from core.coordinate_stats import CoordinateStats
+from core.semantic_database import SemanticDatabase
+from core.sqlite_connections import ConnectionManager, SQLiteTuning
+
+
+def make_coords(n, prefix="concept"):
+    generator = HashBasedCoordinateGenerator('sha256')
+    return [generator.generate(f"{prefix}_{i}") for i in range(n)]
+
+
+class TestConnections:
+    """Test suite for the tuned connection manager."""
+
+    def test_tuning_applied(self, tmp_path):
+        tuning = SQLiteTuning(synchronous='OFF', cache_size=-1024, mmap_size=1 << 20)
+        manager = ConnectionManager(str(tmp_path / 'tuned.db'), tuning)
+        try:
+            with manager.read() as conn:
+                assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+                assert conn.execute("PRAGMA synchronous").fetchone()[0] == 0
+                assert conn.execute("PRAGMA cache_size").fetchone()[0] == -1024
+                assert conn.execute("PRAGMA mmap_size").fetchone()[0] == 1 << 20
+        finally:
+            manager.close()
+
+    def test_readers_are_per_thread_and_read_only(self, tmp_path):
+        manager = ConnectionManager(str(tmp_path / 'readers.db'))
+        try:
+            def reader_id():
+                with manager.read() as conn:
+                    return id(conn)
+
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                ids = set(pool.map(lambda _: reader_id(), range(2)))
+            assert id(manager.writer) not in ids
+
+            with manager.read() as conn:
+                with pytest.raises(sqlite3.OperationalError):
+                    conn.execute("CREATE TABLE t (x)")
+        finally:
+            manager.close()
+
+    def test_write_rolls_back_on_error(self, tmp_path):
+        with SemanticDatabase(str(tmp_path / 'rollback.db')) as db:
+            coord = make_coords(1)[0]
+            with pytest.raises(RuntimeError):
+                with db._connections.write() as conn:
+                    conn.execute("INSERT INTO experiments (name) VALUES ('lost')")
+                    raise RuntimeError("abort")
+            db.add_concept(coord)
+            with db._connections.read() as conn:
+                assert conn.execute("SELECT COUNT(*) FROM experiments").fetchone()[0] == 0
+            assert db.get_concept(coord.concept) == coord
+
+
+class TestConcurrentAccess:
+    """Test suite for reads running alongside ingestion."""
+
+    @pytest.mark.parametrize('path', ['file', ':memory:'])
+    def test_readers_during_ingestion(self, path, tmp_path):
+        db_path = ':memory:' if path == ':memory:' else str(tmp_path / 'concurrent.db')
+        coords = make_coords(400)
+        errors = []
+
+        with SemanticDatabase(db_path) as db:
+            db.add_concepts_bulk(coords[:100])
+
+            def ingest():
+                for start in range(100, 400, 50):
+                    db.add_concepts_bulk(coords[start:start + 50])
+
+            def read():
+                try:
+                    for _ in range(20):
+                        count = db.get_statistics()['count']
+                        assert 100 <= count <= 400
+                        assert db.get_concept('concept_5') == coords[5]
+                except Exception as error:  # collected for the main thread
+                    errors.append(error)
+
+            threads = [threading.Thread(target=ingest)]
+            threads += [threading.Thread(target=read) for _ in range(4)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+            assert not errors
+            assert db.get_statistics()['count'] == 400
+
+
+class TestBatchIngestion:
+    """Test suite for transactional measurement ingestion."""
+
+    def setup_method(self):
+        self.db = SemanticDatabase(':memory:')
+        self.experiment = self.db.create_experiment("bulk", "test", "hash_sha256", {})
+
+    def teardown_method(self):
+        self.db.close()
+
+    def measurements(self):
+        with self.db._connections.read() as conn:
+            return conn.execute("""
+                SELECT m.id, c.concept, m.love, m.experiment_id
+                FROM measurements m JOIN concepts c ON c.id = m.concept_id
+                ORDER BY m.id
+            """).fetchall()
+
+    def test_bulk_ids_and_rows(self):
+        coords = make_coords(1200)
+        coords.append(coords[3])  # repeated concept in one batch
+        ids = self.db.add_measurements_bulk(self.experiment, coords, chunk_size=100)
+
+        rows = self.measurements()
+        assert ids == [row[0] for row in rows]
+        assert [row[1] for row in rows] == [c.concept for c in coords]
+        assert [row[2] for row in rows] == [c.love for c in coords]
+        assert self.db.get_statistics()['count'] == 1200
+
+        more = self.db.add_measurements_bulk(self.experiment, make_coords(5, "extra"))
+        assert more == list(range(ids[-1] + 1, ids[-1] + 6))
+        assert self.db.add_measurements_bulk(self.experiment, []) == []
+
+    def test_bulk_keeps_existing_concept_ids(self):
+        coord = make_coords(1)[0]
+        self.db.add_concept(coord, metadata={'note': 'kept'})
+        with self.db._connections.read() as conn:
+            before = conn.execute("SELECT id, metadata FROM concepts").fetchone()
+
+        self.db.add_measurements_bulk(self.experiment, [coord, coord])
+        with self.db._connections.read() as conn:
+            assert conn.execute("SELECT id, metadata FROM concepts").fetchall() == [before]
+
+    def test_batch_defers_single_row_commits(self, tmp_path):
+        coords = make_coords(20)
+        with SemanticDatabase(str(tmp_path / 'batch.db')) as db:
+            experiment = db.create_experiment("batch", "test", "hash_sha256", {})
+            seen_elsewhere = []
+
+            with db.batch():
+                for coord in coords:
+                    db.add_measurement(experiment, coord)
+                assert db.get_statistics()['count'] == 20
+                reader = threading.Thread(
+                    target=lambda: seen_elsewhere.append(db.get_statistics()['count']))
+                reader.start()
+                reader.join()
+
+            assert seen_elsewhere == [0]
+            assert db.get_statistics()['count'] == 20
+
+    def test_batch_rolls_back(self):
+        with pytest.raises(RuntimeError):
+            with self.db.batch():
+                self.db.add_concepts_bulk(make_coords(10))
+                self.db.add_measurements_bulk(self.experiment, make_coords(3))
+                raise RuntimeError("abort")
+
+        assert self.db.get_statistics()['count'] == 0
+        assert self.measurements() == []
+
+
+class TestSpatialQueries:
+    """Test suite for R*Tree-backed box, radius and nearest queries."""
+
+    def setup_method(self):
+        self.coords = make_coords(2000)
+        self.values = np.array([c.coordinates for c in self.coords])
+        self.db = SemanticDatabase(':memory:')
+        self.db.add_concepts_bulk(self.coords)
+
+    def teardown_method(self):
+        self.db.close()
+
+    def brute_nearest(self, point, k):
+        distances = np.linalg.norm(self.values - point, axis=1)
+        return [self.coords[i].concept for i in np.argsort(distances, kind='stable')[:k]]
+
+    @pytest.mark.parametrize('rtree', [True, False])
+    def test_box_radius_nearest(self, rtree):
+        self.db.has_rtree = rtree
+        mins, maxs = (0.0, 0.6, 0.0, 0.2), (0.3, 1.0, 1.0, 0.9)
+        inside = ((self.values >= mins) & (self.values <= maxs)).all(axis=1)
+        box = self.db.query_box(mins, maxs)
+        assert sorted(c.concept for c in box) == sorted(self.coords[i].concept for i in np.flatnonzero(inside))
+        assert box == sorted(box, key=lambda c: c.distance_to_anchor())
+
+        point = np.array([0.4, 0.5, 0.6, 0.7])
+        within = self.db.within_radius(point, 0.25)
+        assert [c.concept for c in within] == self.brute_nearest(point, len(within))
+        assert len(within) == (np.linalg.norm(self.values - point, axis=1) <= 0.25).sum()
+
+        for k in (1, 10, 2500):
+            nearest = self.db.nearest(point, k)
+            assert [c.concept for c in nearest] == self.brute_nearest(point, k)
+
+        anchor_nearest = self.db.nearest(np.ones(4), 5)
+        assert anchor_nearest == self.db.get_closest_to_anchor(5)
+
+    def test_rtree_tracks_writes(self):
+        moved = SemanticCoordinate("concept_0", 0.99, 0.99, 0.99, 0.99, source="manual")
+        self.db.add_concept(moved)
+        self.db.add_measurements_bulk(self.db.create_experiment("e", "", "", {}), [
+            SemanticCoordinate("concept_1", 0.98, 0.98, 0.98, 0.98, source="manual")
+        ])
+
+        near_anchor = [c.concept for c in self.db.query_box((0.95,) * 4, (1.0,) * 4)]
+        assert near_anchor[:2] == ["concept_0", "concept_1"]
+        with self.db._connections.read() as conn:
+            counts = conn.execute(
+                "SELECT (SELECT COUNT(*) FROM concepts), (SELECT COUNT(*) FROM concepts_rtree)"
+            ).fetchone()
+        assert counts == (2000, 2000)
+
+    def test_existing_database_is_backfilled(self, tmp_path):
+        path = str(tmp_path / 'legacy.db')
+        with SemanticDatabase(path) as db:
+            db.add_concepts_bulk(self.coords[:50])
+            with db._connections.write() as conn:
+                conn.execute("DROP TABLE concepts_rtree")
+
+        with SemanticDatabase(path) as db:
+            assert len(db.query_box()) == 50
+
+
+class TestStreaming:
+    """Test suite for fetchmany-based streaming readers."""
+
+    def setup_method(self):
+        self.coords = make_coords(1050)
+        self.db = SemanticDatabase(':memory:')
+        self.db.add_concepts_bulk(self.coords)
+
+    def teardown_method(self):
+        self.db.close()
+
+    def test_modes_agree(self):
+        streamed = list(self.db.iter_concepts(batch_size=100))
+        assert streamed == self.db.get_all_concepts()
+        assert sorted(c.concept for c in streamed) == sorted(c.concept for c in self.coords)
+
+        tuples = list(self.db.iter_concepts(batch_size=100, mode='tuples'))
+        assert [t[0] for t in tuples] == [c.concept for c in streamed]
+
+        chunks = list(self.db.iter_concepts(batch_size=100, mode='arrays'))
+        assert [len(chunk) for chunk in chunks] == [100] * 10 + [50]
+        assert CoordinateArray.concatenate(chunks).to_coordinates() == streamed
+
+        with pytest.raises(ValueError):
+            next(self.db.iter_concepts(mode='frames'))
+
+    def test_ordering_and_search(self):
+        closest = list(self.db.iter_concepts(batch_size=64, closest_first=True))
+        assert closest[:10] == self.db.get_closest_to_anchor(10)
+        assert closest == sorted(closest, key=lambda c: c.distance_to_anchor())
+
+        matches = list(self.db.iter_search('concept_10%', batch_size=3))
+        assert matches == self.db.search_concepts('concept_10%')
+        assert len(matches) == 1 + 10 + 50  # concept_10, _100-_109, _1000-_1049
+
+    def test_trigram_search_queries_index_once(self):
+        if not self.db.has_trigram:
+            pytest.skip("SQLite built without the trigram tokenizer")
+        statements = []
+        self.db._connections.writer.set_trace_callback(statements.append)
+        matches = list(self.db.iter_search('%ept_10%', batch_size=3))
+        self.db._connections.writer.set_trace_callback(None)
+
+        assert len(matches) == 61
+        # Statements starting with '--' are FTS5's own internal queries
+        queries = [sql for sql in statements if not sql.lstrip().startswith('--')]
+        assert sum('concepts_trigram' in sql for sql in queries) == 1
+
+    def test_abandoned_iterator_holds_no_lock(self):
+        stream = self.db.iter_concepts(batch_size=10, closest_first=True)
+        first = next(stream)
+
+        writer = threading.Thread(
+            target=self.db.add_concept, args=(SemanticCoordinate("late", 0.5, 0.5, 0.5, 0.5),))
+        writer.start()
+        writer.join(timeout=5)
+        assert not writer.is_alive()
+
+        rest = list(stream)
+        assert len(rest) == 1050 and first not in rest
+
+    def test_stats_from_stream(self):
+        stats = CoordinateStats().update_iter(self.db.iter_concepts(batch_size=128, mode='arrays'))
+        assert stats.count == 1050
+        assert stats.as_dict()['mean_distance'] == pytest.approx(self.db.get_statistics()['mean_distance'])
+
+
+class TestArrayExport:
+    """Test suite for columnar export and packed vector storage."""
+
+    def test_to_arrays_matches_rows(self):
+        coords = make_coords(700)
+        with SemanticDatabase(':memory:') as db:
+            db.add_concepts_bulk(coords)
+            array = db.to_arrays(batch_size=64)
+
+            assert array.values.dtype == np.float64
+            assert array.to_coordinates() == db.get_all_concepts()
+            assert len(SemanticDatabase(':memory:').to_arrays()) == 0
+
+            with pytest.raises(ValueError):
+                db.to_arrays(packed=True)
+
+    def test_packed_vectors_migration_and_sync(self, tmp_path):
+        path = str(tmp_path / 'packed.db')
+        coords = make_coords(300)
+        with SemanticDatabase(path) as db:
+            db.add_concepts_bulk(coords)
+            assert not db.packed_vectors
+
+        with SemanticDatabase(path, packed_vectors=True) as db:
+            packed = db.to_arrays()
+            assert packed.values.dtype == np.float32
+            np.testing.assert_allclose(packed.values, db.to_arrays(packed=False).values, atol=1e-7)
+
+        # Maintained on later opens, including rows written by other tools
+        with SemanticDatabase(path) as db:
+            assert db.packed_vectors
+            db.add_concept(SemanticCoordinate("moved", 0.25, 0.5, 0.75, 1.0))
+            db.add_measurements_bulk(db.create_experiment("e", "", "", {}), [
+                SemanticCoordinate("concept_0", 0.125, 0.25, 0.375, 0.5)
+            ])
+            with db._connections.write() as conn:
+                conn.execute("""
+                    INSERT INTO concepts (concept, love, power, wisdom, justice, distance_to_anchor)
+                    VALUES ('external', 0.5, 0.5, 0.5, 0.5, 1.0)
+                """)
+
+            array = db.to_arrays()
+            rows = dict(zip(array.concepts, array.values.tolist()))
+            assert rows['moved'] == [0.25, 0.5, 0.75, 1.0]
+            assert rows['concept_0'] == [0.125, 0.25, 0.375, 0.5]
+            assert rows['external'] == [0.5, 0.5, 0.5, 0.5]
+            hashed = [source for source in array.sources if source == 'hash_sha256']
+            assert len(hashed) == 299 and all(source is hashed[0] for source in hashed)
+
+        with SemanticDatabase(path) as db:
+            with db._connections.read() as conn:
+                assert conn.execute(
+                    "SELECT COUNT(*) FROM concepts WHERE vector IS NULL").fetchone()[0] == 0
+
+
+class TestTextSearch:
+    """Test suite for FTS5 text search and trigram-backed LIKE."""
+
+    def setup_method(self):
+        self.db = SemanticDatabase(':memory:')
+        self.db.add_concepts_bulk(make_coords(500))
+        generator = HashBasedCoordinateGenerator('sha256')
+        for name, category in [("Love of God", "virtue"), ("loving kindness", "virtue"),
+                               ("self-love", "emotion"), ("Justice", "virtue")]:
+            self.db.add_concept(generator.generate(name), metadata={'category': category})
+
+    def teardown_method(self):
+        self.db.close()
+
+    @pytest.mark.parametrize('pattern', [
+        '%love%', 'LOVE%', '%of god', 'concept_1_%', '%ncept\\_4%', 'concept_49_', 'lo%', '%', 'x'
+    ])
+    def test_like_matches_scan(self, pattern):
+        indexed = self.db.search_concepts(pattern)
+        self.db.has_trigram = False
+        assert indexed == self.db.search_concepts(pattern)
+
+    def test_search_text(self):
+        prefix = {c.concept for c in self.db.search_text('lov*')}
+        assert prefix == {"Love of God", "loving kindness", "self-love"}
+
+        by_metadata = self.db.search_text('metadata: virtue', order_by='distance')
+        assert {c.concept for c in by_metadata} == {"Love of God", "loving kindness", "Justice"}
+        assert by_metadata == sorted(by_metadata, key=lambda c: c.distance_to_anchor())
+
+        assert [c.concept for c in self.db.search_text('"love of god"')] == ["Love of God"]
+        assert len(self.db.search_text('concept', limit=7)) == 7
+
+        with pytest.raises(ValueError):
+            self.db.search_text('love', order_by='name')
+
+    def test_index_follows_writes(self):
+        generator = HashBasedCoordinateGenerator('sha256')
+        self.db.add_concept(generator.generate("Justice"), metadata={'category': 'law'})
+
+        assert {c.concept for c in self.db.search_text('virtue')} == {"Love of God", "loving kindness"}
+        assert [c.concept for c in self.db.search_text('law')] == ["Justice"]
+        assert [c.concept for c in self.db.search_concepts('%stic%')] == ["Justice"]
+
+
+class TestRunningStatistics:
+    """Test suite for trigger-maintained aggregate statistics."""
+
+    def setup_method(self):
+        self.db = SemanticDatabase(':memory:')
+
+    def teardown_method(self):
+        self.db.close()
+
+    def assert_consistent(self, **scope):
+        running = self.db.get_statistics(**scope)
+        direct = self.db.get_statistics(recompute=True, **scope)
+        assert running.keys() == direct.keys()
+        for key, value in direct.items():
+            assert running[key] == (value if value is None else pytest.approx(value, rel=1e-9, abs=1e-12))
+
+    def test_upserts_deletes_and_scopes(self):
+        coords = make_coords(300)
+        self.db.add_concepts_bulk(coords)
+        self.db.add_concepts_bulk(make_coords(50, "other"))
+        experiment = self.db.create_experiment("e", "", "", {})
+        self.db.add_measurements_bulk(experiment, coords[:40])
+
+        # Replace the concepts holding both extremes, via both write paths
+        by_distance = sorted(coords, key=lambda c: c.distance_to_anchor())
+        self.db.add_concept(SemanticCoordinate(by_distance[0].concept, 0.5, 0.5, 0.5, 0.5, source="manual"))
+        self.db.add_measurements_bulk(experiment, [
+            SemanticCoordinate(by_distance[-1].concept, 0.6, 0.6, 0.6, 0.6, source="manual")
+        ])
+        with self.db._connections.write() as conn:
+            conn.execute("DELETE FROM concepts WHERE concept = 'other_3'")
+            conn.execute("DELETE FROM measurements WHERE id = 5")
+
+        assert self.db.get_statistics()['count'] == 349
+        assert self.db.get_statistics(source='manual')['count'] == 2
+        assert self.db.get_statistics(experiment_id=experiment)['count'] == 40
+        for scope in ({}, {'source': 'hash_sha256'}, {'source': 'manual'},
+                      {'experiment_id': experiment}):
+            self.assert_consistent(**scope)
+
+        empty = self.db.get_statistics(source='missing')
+        assert empty['count'] == 0 and empty['mean_distance'] is None
+        with pytest.raises(ValueError):
+            self.db.get_statistics(source='manual', experiment_id=experiment)
+
+    def test_reads_do_not_scan(self):
+        self.db.add_concepts_bulk(make_coords(100))
+        statements = []
+        with self.db._connections.read() as conn:
+            conn.set_trace_callback(statements.append)
+            try:
+                self.db.get_statistics()
+            finally:
+                conn.set_trace_callback(None)
+        assert len(statements) == 1 and 'concept_stats' in statements[0]
+
+    def test_refresh_and_existing_databases(self, tmp_path):
+        path = str(tmp_path / 'stats.db')
+        with SemanticDatabase(path) as db:
+            db.add_concepts_bulk(make_coords(80))
+            with db._connections.write() as conn:
+                # Simulate a database created before concept_stats existed
+                for table in ('concepts', 'measurements'):
+                    for event in ('insert', 'delete', 'update'):
+                        conn.execute(f"DROP TRIGGER {table}_stats_{event}")
+                conn.execute("DROP TABLE concept_stats")
+                conn.execute("UPDATE concepts SET love = 0.0 WHERE id < 10")
+
+        with SemanticDatabase(path) as db:
+            assert db.get_statistics() == pytest.approx(db.get_statistics(recompute=True))
+            with db._connections.write() as conn:
+                conn.execute("UPDATE concept_stats SET count = 1")
+            db.refresh_statistics()
+            assert db.get_statistics()['count'] == 80
+
+
+def concept_ids(db, names):
+    """Stored id of each named concept."""
+    with db._connections.read() as conn:
+        return [conn.execute("SELECT id FROM concepts WHERE concept = ?", (name,)).fetchone()[0]
+                for name in names]
+
+
+class TestExperimentAnalytics:
+    """Test suite for experiment summaries and comparisons run in SQL."""
+
+    def setup_method(self):
+        rng = np.random.default_rng(5)
+        self.db = SemanticDatabase(':memory:')
+        self.names = [f"concept_{i}" for i in range(120)]
+        self.sim = [SemanticCoordinate(n, *rng.random(4)) for n in self.names]
+        self.api = [SemanticCoordinate(n, *np.clip(c.vector + rng.normal(0, 0.1, 4), 0, 1))
+                    for n, c in zip(self.names, self.sim)]
+        self.api[7] = SemanticCoordinate(self.names[7], *self.sim[3].coordinates)  # tied distances
+        self.api[8] = SemanticCoordinate(self.names[8], *self.sim[3].coordinates)
+
+        self.a = self.db.create_experiment("simulated", "", "heuristic", {'seed': 5})
+        self.b = self.db.create_experiment("api", "", "claude", {})
+        stale = [SemanticCoordinate(n, 0.0, 0.0, 0.0, 0.0) for n in self.names[:10]]
+        self.db.add_measurements_bulk(self.a, stale + self.sim)   # latest measurement wins
+        self.db.add_measurements_bulk(self.b, self.api + [SemanticCoordinate("only_b", 1, 1, 1, 1)])
+
+    def teardown_method(self):
+        self.db.close()
+
+    def test_summary(self):
+        summary = self.db.experiment_summary(self.a)
+        distances = [c.distance_to_anchor() for c in self.sim] + [2.0] * 10
+
+        assert summary['name'] == "simulated" and summary['parameters'] == {'seed': 5}
+        assert summary['n_measurements'] == 130 and summary['n_concepts'] == 120
+        assert summary['mean_distance'] == pytest.approx(np.mean(distances))
+        assert summary['std_distance'] == pytest.approx(np.std(distances))
+        assert summary['max_distance'] == pytest.approx(2.0)
+
+        with pytest.raises(KeyError):
+            self.db.experiment_summary(999)
+
+    def test_compare_matches_python_reference(self):
+        from validation.compare_methods import compare_simulated_vs_api
+
+        expected = compare_simulated_vs_api(self.names, self.sim, self.api)
+        result = self.db.compare_experiments(self.a, self.b)
+
+        assert result['n_concepts'] == expected['n_concepts'] == 120
+        for key in ('spearman_rho', 'pearson_r'):
+            assert result['distance_correlation'][key] == pytest.approx(
+                expected['distance_correlation'][key], rel=1e-9)
+        assert result['distance_stats']['mean_difference'] == pytest.approx(
+            expected['distance_stats']['mean_difference'])
+        assert result['distance_stats']['b_std'] == pytest.approx(expected['distance_stats']['api_std'])
+        assert result['ranking_agreement'] == pytest.approx(expected['ranking_agreement'])
+        assert [d['concept'] for d in result['top_differences']] == \
+            [d['concept'] for d in expected['top_differences']]
+
+        love = [c.love for c in self.sim], [c.love for c in self.api]
+        assert result['dimension_correlations']['love']['pearson_r'] == pytest.approx(
+            np.corrcoef(*love)[0, 1])
+
+        assert 'error' in self.db.compare_experiments(self.a, 999)
+
+    def test_deltas_and_ranks(self):
+        deltas = self.db.experiment_deltas(self.a, self.b)
+        assert len(deltas) == 120
+        np.testing.assert_allclose(deltas['distance_delta'], deltas['distance_b'] - deltas['distance_a'])
+        assert deltas['distance_delta'].abs().is_monotonic_decreasing
+
+        ranked = self.db.rank_in_experiment(self.b)
+        assert [r['concept'] for r in ranked[:1]] == ["only_b"]
+        assert [r['rank'] for r in ranked] == sorted(r['rank'] for r in ranked)
+        assert ranked[-1]['percentile'] == pytest.approx(1.0)
+
+        subset = self.db.rank_in_experiment(self.b, concepts=[self.names[7], self.names[8]])
+        assert [r['rank'] for r in subset] == [r['rank'] for r in ranked if r['concept'] in self.names[7:9]]
+        assert subset[0]['rank'] == subset[1]['rank']
+
+        farthest = self.db.rank_in_experiment(self.b, limit=3, farthest=True)
+        assert len(farthest) == 3 and farthest[0]['distance'] == max(r['distance'] for r in ranked)
+
+    def test_single_measurements_keep_concept_ids(self):
+        db = SemanticDatabase(':memory:')
+        db.add_concept(self.sim[0], metadata={'note': 'kept'})
+        a = db.create_experiment("first", "", "heuristic", {})
+        b = db.create_experiment("second", "", "claude", {})
+        for coord in self.sim[:6]:
+            db.add_measurement(a, coord)
+        for coord in self.api[:6]:
+            db.add_measurement(b, coord)
+
+        assert db.compare_experiments(a, b)['n_concepts'] == 6
+        assert len(db.experiment_deltas(a, b)) == 6
+        assert len(db.rank_in_experiment(a)) == 6
+        assert db.get_concept(self.names[0]).love == self.api[0].love
+        with db._connections.read() as conn:
+            metadata = conn.execute("SELECT metadata FROM concepts WHERE concept = ?",
+                                    (self.names[0],)).fetchone()[0]
+        assert json.loads(metadata) == {'note': 'kept'}
+        db.close()
+
+    def test_bulk_readd_keeps_measurements(self):
+        before = self.db.compare_experiments(self.a, self.b)
+        ids = concept_ids(self.db, self.names[:3])
+        self.db.add_concepts_bulk(self.api[:3])
+
+        assert concept_ids(self.db, self.names[:3]) == ids
+
+        after = self.db.compare_experiments(self.a, self.b)
+        assert after['n_concepts'] == before['n_concepts'] == 120
+        assert [d['concept'] for d in after['top_differences']] == \
+            [d['concept'] for d in before['top_differences']]
+        assert len(self.db.rank_in_experiment(self.a)) == 120
+
+    def test_query_plans_use_indexes(self):
+        with self.db._connections.read() as conn:
+            plan = ' '.join(str(row) for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT * FROM measurements WHERE experiment_id = ?", (self.a,)))
+        assert 'idx_measurements' in plan
+
+
+class TestFileLoading:
+    """Test suite for bulk loading CSV and JSON Lines dumps."""
+
+    def setup_method(self):
+        self.db = SemanticDatabase(":memory:")
+        self.coords = make_coords(300, prefix="loaded")
+
+    def teardown_method(self):
+        self.db.close()
+
+    def write_csv(self, path, coords, extra=""):
+        lines = ["concept,love,power,wisdom,justice,source"]
+        lines += [f"{c.concept},{c.love!r},{c.power!r},{c.wisdom!r},{c.justice!r},dump" for c in coords]
+        path.write_text("\n".join(lines) + "\n" + extra)
+        return path
+
+    def test_csv_round_trip(self, tmp_path):
+        path = self.write_csv(tmp_path / 'dump.csv', self.coords, extra="NA,0.5,0.5,0.5,0.5,\n")
+        report = self.db.load_file(path, chunk_size=64)
+
+        assert report['rows'] == 301 and report['skipped'] == 0
+        assert report['rows_per_second'] > 0
+        assert len(self.db.get_all_concepts()) == 301
+        assert self.db.get_concept("NA").source is None
+
+        stored = self.db.get_concept(self.coords[5].concept)
+        assert stored.love == self.coords[5].love and stored.source == "dump"
+
+    def test_jsonl_with_metadata(self, tmp_path):
+        import json
+        path = tmp_path / 'dump.jsonl'
+        path.write_text("".join(
+            json.dumps({'concept': c.concept, 'love': c.love, 'power': c.power,
+                        'wisdom': c.wisdom, 'justice': c.justice, 'metadata': {'tag': 'gold'}}) + "\n"
+            for c in self.coords[:50]
+        ))
+        report = self.db.load_file(path, source="jsonl")
+
+        assert report['rows'] == 50
+        assert self.db.get_concept(self.coords[0].concept).source == "jsonl"
+        assert len(self.db.search_text("gold")) == 50
+
+    def test_invalid_rows(self, tmp_path):
+        path = self.write_csv(tmp_path / 'bad.csv', self.coords[:10], extra="broken,1.5,0.1,0.1,0.1,x\n")
+        with pytest.raises(ValueError):
+            self.db.load_file(path)
+        assert self.db.get_concept("broken") is None
+
+        report = self.db.load_file(path, on_error='skip')
+        assert report['rows'] == 10 and report['skipped'] == 1
+
+        with pytest.raises(ValueError):
+            self.db.load_file(tmp_path / 'dump.parquet')
+
+    def test_indexes_and_aggregates_rebuilt(self, tmp_path):
+        self.db.add_concepts_bulk(make_coords(20, prefix="existing"))
+        self.db.load_file(self.write_csv(tmp_path / 'dump.csv', self.coords), chunk_size=100)
+
+        with self.db._connections.read() as conn:
+            names = {row[0] for row in conn.execute("SELECT name FROM sqlite_master")}
+        assert {'idx_distance', 'idx_concept', 'concepts_fts_insert', 'concepts_stats_insert'} <= names
+
+        stats = self.db.get_statistics()
+        assert stats['count'] == 320
+        assert stats['mean_distance'] == pytest.approx(
+            self.db.get_statistics(recompute=True)['mean_distance'])
+        assert self.db.get_statistics(source="dump")['count'] == 300
+        assert len(self.db.search_concepts("%loaded_29%")) == 11
+        assert len(self.db.query_box()) == 320
+
+        # Triggers are live again after the load
+        self.db.add_concept(SemanticCoordinate("after", 0.5, 0.5, 0.5, 0.5))
+        assert self.db.get_statistics()['count'] == 321
+
+    def test_load_over_measured_concepts(self, tmp_path):
+        a = self.db.create_experiment("first", "", "heuristic", {})
+        b = self.db.create_experiment("second", "", "claude", {})
+        self.db.add_measurements_bulk(a, self.coords[:20])
+        self.db.add_measurements_bulk(b, [SemanticCoordinate(c.concept, *(1 - v for v in c.coordinates))
+                                          for c in self.coords[:20]])
+        names = [c.concept for c in self.coords[:20]]
+        ids = concept_ids(self.db, names)
+        before = self.db.compare_experiments(a, b)
+
+        self.db.load_file(self.write_csv(tmp_path / 'dump.csv', self.coords), chunk_size=64)
+
+        assert concept_ids(self.db, names) == ids
+        assert self.db.get_concept(names[0]).source == "dump"
+        after = self.db.compare_experiments(a, b)
+        assert after['n_concepts'] == 20
+        assert after['top_differences'] == before['top_differences']
+        assert len(self.db.rank_in_experiment(a)) == 20
+
+    def test_packed_vectors(self, tmp_path):
+        with SemanticDatabase(":memory:", packed_vectors=True) as db:
+            db.load_file(self.write_csv(tmp_path / 'dump.csv', self.coords))
+            array = db.to_arrays(packed=True)
+            expected = {c.concept: (c.love, c.power, c.wisdom, c.justice) for c in self.coords}
+
+            assert len(array) == 300
+            np.testing.assert_allclose(
+                array.values, [expected[name] for name in array.concepts], rtol=1e-6)
+
+
+class TestConceptCache:
+    """Test suite for the get_concept() LRU cache and batch lookups."""
+
+    def setup_method(self):
+        self.db = SemanticDatabase(":memory:", cache_size=4)
+        self.coords = make_coords(10)
+        self.db.add_concepts_bulk(self.coords)
+
+    def teardown_method(self):
+        self.db.close()
+
+    def test_hits_misses_and_eviction(self):
+        for _ in range(3):
+            assert self.db.get_concept("concept_1") == self.coords[1]
+        assert self.db.get_concept("missing") is None
+        assert self.db.get_concept("missing") is None
+
+        info = self.db.cache_info()
+        assert (info['hits'], info['misses'], info['currsize']) == (3, 2, 2)
+
+        for coord in self.coords[2:6]:
+            self.db.get_concept(coord.concept)
+        assert self.db.cache_info()['currsize'] == 4
+        assert "concept_1" not in self.db._cache
+
+        self.db.cache_clear()
+        assert self.db.cache_info() == {'hits': 0, 'misses': 0, 'maxsize': 4, 'currsize': 0}
+
+    def test_writes_invalidate(self):
+        assert self.db.get_concept("fresh") is None
+        self.db.add_concept(SemanticCoordinate("fresh", 0.1, 0.2, 0.3, 0.4))
+        assert self.db.get_concept("fresh").love == 0.1
+
+        self.db.add_concepts_bulk([SemanticCoordinate("fresh", 0.5, 0.2, 0.3, 0.4)])
+        assert self.db.get_concept("fresh").love == 0.5
+
+        experiment = self.db.create_experiment("cache", "invalidation", "hash", {})
+        self.db.add_measurement(experiment, SemanticCoordinate("fresh", 0.6, 0.2, 0.3, 0.4))
+        assert self.db.get_concept("fresh").love == 0.6
+
+        self.db.add_measurements_bulk(experiment, [SemanticCoordinate("fresh", 0.7, 0.2, 0.3, 0.4)])
+        assert self.db.get_concept("fresh").love == 0.7
+
+    def test_rolled_back_batch_is_not_cached(self):
+        with pytest.raises(RuntimeError):
+            with self.db.batch():
+                self.db.add_concept(SemanticCoordinate("ghost", 0.1, 0.2, 0.3, 0.4))
+                assert self.db.get_concept("ghost") is not None
+                raise RuntimeError("abort")
+        assert self.db.get_concept("ghost") is None
+
+    def test_get_concepts(self):
+        names = ["concept_3", "nope", "concept_0", "concept_3"]
+        result = self.db.get_concepts(names)
+        assert result == [self.coords[3], None, self.coords[0], self.coords[3]]
+
+        self.db.get_concepts(names)
+        assert self.db.cache_info()['hits'] == 3
+
+        with SemanticDatabase(":memory:") as uncached:
+            uncached.add_concepts_bulk(self.coords)
+            assert uncached.get_concepts([c.concept for c in self.coords], chunk_size=3) == self.coords
+            assert uncached.cache_info()['currsize'] == 0
@@ -0,0 +1,105 @@
+"""
+Semantic Index Tests
+====================
+
+Checks that KD-tree and spiral-cell queries return exactly what a brute
+force scan would, and that indexes survive a save/load round trip.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+import pytest
+import numpy as np
+
+from core.semantic_coordinates import CoordinateArray, HashBasedCoordinateGenerator
+from core.semantic_database import SemanticDatabase
+from core.semantic_index import SemanticIndex
+from core.phi_geometric import golden_spiral_distance_4d, golden_spiral_distance_matrix
+
+
+def brute_force(metric, points, values):
+    if metric == 'euclidean':
+        return np.linalg.norm(points[:, None, :] - values[None], axis=2)
+    return golden_spiral_distance_matrix(points, values)
+
+
+class TestSemanticIndex:
+    """Test suite for exact nearest-neighbour and radius queries."""
+
+    def setup_method(self):
+        rng = np.random.default_rng(3)
+        self.values = rng.random((3000, 4))
+        self.values[0] = 0.0
+        self.values[1] = 1.0
+        self.queries = np.vstack([rng.random((20, 4)), np.zeros(4), np.ones(4)])
+
+    @pytest.mark.parametrize('metric', ['euclidean', 'phi_spiral'])
+    def test_knn_matches_brute_force(self, metric):
+        index = SemanticIndex(self.values, metric=metric, leaf_size=16)
+        indices, distances = index.knn_batch(self.queries, k=7)
+        full = brute_force(metric, self.queries, self.values)
+
+        assert indices.shape == distances.shape == (len(self.queries), 7)
+        np.testing.assert_allclose(distances, np.sort(full, axis=1)[:, :7], rtol=1e-12)
+        np.testing.assert_allclose(np.take_along_axis(full, indices, axis=1), distances, rtol=1e-12)
+
+        single, single_distances = index.knn(self.queries[3], k=7)
+        assert single.tolist() == indices[3].tolist()
+
+    @pytest.mark.parametrize('metric', ['euclidean', 'phi_spiral'])
+    def test_radius_matches_brute_force(self, metric):
+        index = SemanticIndex(self.values, metric=metric)
+        full = brute_force(metric, self.queries, self.values)
+
+        for row, (indices, distances) in enumerate(index.radius_batch(self.queries, 0.2)):
+            assert sorted(indices.tolist()) == np.flatnonzero(full[row] <= 0.2).tolist()
+            assert np.all(np.diff(distances) >= 0)
+
+    def test_small_and_empty_indexes(self):
+        index = SemanticIndex(self.values[:3], metric='phi_spiral')
+        indices, _ = index.knn(np.ones(4), k=10)
+        assert sorted(indices.tolist()) == [0, 1, 2]
+
+        empty = SemanticIndex(np.empty((0, 4)))
+        assert len(empty.knn(np.ones(4), k=3)[0]) == 0
+        assert len(empty.radius(np.ones(4), 1.0)[0]) == 0
+
+        with pytest.raises(ValueError):
+            SemanticIndex(self.values, metric='manhattan')
+
+    def test_spiral_distance_is_not_a_metric(self):
+        # Why phi_spiral cannot use a vantage-point tree: a detour through a
+        # point near the origin beats the direct path.
+        x = np.array([1.0, 0.0, 0.0, 0.0])
+        y = np.array([0.0, 1.0, 0.0, 0.0])
+        z = np.array([0.01, 0.01, 0.0, 0.0])
+        direct = golden_spiral_distance_4d(x, y)
+        detour = golden_spiral_distance_4d(x, z) + golden_spiral_distance_4d(z, y)
+        assert detour < direct
+
+    @pytest.mark.parametrize('metric', ['euclidean', 'phi_spiral'])
+    def test_save_and_load(self, metric, tmp_path):
+        generator = HashBasedCoordinateGenerator('sha256')
+        array = generator.generate_many([f"concept_{i}" for i in range(500)])
+        index = SemanticIndex(array, metric=metric)
+        index.save(tmp_path / 'index.pkl')
+
+        loaded = SemanticIndex.load(tmp_path / 'index.pkl')
+        assert loaded.metric == metric
+        indices, distances = loaded.knn(array[42], k=5)
+        assert indices[0] == 42
+        assert loaded.coordinates[indices].concepts[0] == 'concept_42'
+        assert np.array_equal(distances, index.knn(array[42], k=5)[1])
+
+    def test_from_database(self, tmp_path):
+        generator = HashBasedCoordinateGenerator('sha256')
+        coords = [generator.generate(f"concept_{i}") for i in range(200)]
+        with SemanticDatabase(str(tmp_path / 'index.db')) as db:
+            db.add_concepts_bulk(coords)
+            index = SemanticIndex.from_database(db)
+
+        indices, _ = index.knn(coords[10], k=1)
+        assert index.coordinates[int(indices[0])].concept == 'concept_10'
+        assert isinstance(index.coordinates, CoordinateArray)
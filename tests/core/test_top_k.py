@@ -0,0 +1,93 @@
+"""
+Top-k Selection Tests
+=====================
+
+Checks that argpartition- and heap-based selection return exactly what a
+stable full sort would.
+"""
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent / 'src'))
+
+import numpy as np
+
+from core.semantic_coordinates import (
+    CoordinateArray,
+    HashBasedCoordinateGenerator,
+    SemanticCoordinate,
+    find_top_k,
+    find_closest_to_anchor,
+    top_k_indices
+)
+from analysis.common_utils import find_extremes
+
+
+class TestTopK:
+    """Test suite for shared top-k selection."""
+
+    def setup_method(self):
+        generator = HashBasedCoordinateGenerator('sha256')
+        self.coords = [generator.generate(f"concept_{i}") for i in range(500)]
+        self.array = CoordinateArray.from_coordinates(self.coords)
+
+    def test_indices_match_stable_sort(self):
+        scores = np.array([3, 1, 2, 1, 5, 1, 0, 2])
+        for k in range(len(scores) + 2):
+            assert top_k_indices(scores, k).tolist() == np.argsort(scores, kind='stable')[:k].tolist()
+            assert top_k_indices(scores, k, largest=True).tolist() == \
+                np.argsort(scores, kind='stable')[::-1][:k].tolist()
+
+    def test_largest_ties_and_unsigned_scores(self):
+        assert top_k_indices(np.array([7, 0, 255, 3], dtype=np.uint8), 2, largest=True).tolist() == [2, 0]
+
+        # Farthest ties come back latest first, as reversed(sorted(...)[-n:]) did
+        tied = [SemanticCoordinate(f"c{i}", v, v, v, v) for i, v in enumerate((0.2, 0.1, 0.2, 0.5, 0.2))]
+        coordinates = {c.concept: c for c in tied}
+        _, farthest = find_extremes(coordinates, n=3)
+        assert [name for name, _ in farthest] == ["c1", "c4", "c2"]
+
+        columnar, _ = find_top_k(tied, k=3, farthest=True)
+        streamed, _ = find_top_k(iter(tied), k=3, farthest=True)
+        assert columnar == streamed == [tied[1], tied[4], tied[2]]
+
+    def test_closest_and_farthest(self):
+        by_distance = sorted(self.coords, key=lambda c: c.distance_to_anchor())
+
+        closest, distances = find_top_k(self.coords, k=10)
+        assert closest == by_distance[:10]
+        assert np.all(np.diff(distances) >= 0)
+
+        farthest, _ = find_top_k(self.array, k=10, farthest=True)
+        assert farthest.to_coordinates() == sorted(self.coords, key=lambda c: -c.distance_to_anchor())[:10]
+
+    def test_streaming_matches_columnar(self):
+        target = self.coords[7]
+        columnar, columnar_distances = find_top_k(self.coords, k=15, target=target)
+        streamed, streamed_distances = find_top_k(iter(self.coords), k=15, target=target)
+
+        assert streamed == columnar
+        assert streamed[0] == target
+        np.testing.assert_allclose(streamed_distances, columnar_distances, rtol=1e-12)
+
+    def test_phi_and_custom_metrics(self):
+        phi, _ = find_top_k(self.coords, k=5, metric='phi_spiral')
+        assert phi == sorted(self.coords, key=lambda c: c.phi_distance_to_anchor())[:5]
+
+        def love_gap(values, target):
+            return np.abs(values[:, 0] - target[0])
+
+        selected, _ = find_top_k(iter(self.coords), k=5, target=[0.5, 0.5, 0.5, 0.5], metric=love_gap)
+        assert selected == sorted(self.coords, key=lambda c: abs(c.love - 0.5))[:5]
+
+    def test_array_input_returns_indices(self):
+        indices, distances = find_top_k(self.array.values, k=3)
+        assert [self.coords[i] for i in indices] == find_closest_to_anchor(self.coords, n=3)
+
+    def test_find_extremes(self):
+        coordinates = {c.concept: c for c in self.coords}
+        closest, farthest = find_extremes(coordinates, n=5)
+
+        ranked = sorted(coordinates.items(), key=lambda item: item[1].distance_to_anchor())
+        assert [name for name, _ in closest] == [name for name, _ in ranked[:5]]
+        assert [name for name, _ in farthest] == [name for name, _ in ranked[::-1][:5]]
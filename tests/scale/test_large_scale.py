@@ -24,7 +24,8 @@ from scipy import stats
 from core.semantic_coordinates import (
     HashBasedCoordinateGenerator,
     AnchorPoint,
-    calculate_statistics
+    calculate_statistics,
+    find_closest_to_anchor
 )
 from core.semantic_database import SemanticDatabase
 
@@ -132,7 +133,7 @@ class TestLargeScale:
         print(f"  Q3 (75%): {np.percentile(distances, 75):.4f}")
 
         # Find closest to Anchor
-        closest = sorted(coords, key=lambda c: c.distance_to_anchor())[:10]
+        closest = find_closest_to_anchor(coords, n=10)
 
         print("\nTop 10 Closest to Anchor:")
         for i, c in enumerate(closest, 1):
@@ -177,6 +178,33 @@ class TestLargeScale:
         else:
             print("  → Distribution deviates from uniform (non-random pattern)")
 
+    def test_batch_generation(self):
+        """Test columnar batch generation against per-concept generation."""
+        n_concepts = 10000
+        print(f"\n\nBatch Generation Test ({n_concepts} concepts)")
+        print("=" * 60)
+
+        concepts = generate_word_list(n_concepts)
+        generator = HashBasedCoordinateGenerator('sha256')
+
+        start_time = time.time()
+        coords = [generator.generate(c) for c in concepts]
+        per_concept = time.time() - start_time
+
+        start_time = time.time()
+        batch = generator.generate_many(concepts)
+        batched = time.time() - start_time
+
+        print(f"Per-concept generation: {per_concept:.3f} seconds")
+        print(f"Batch generation:       {batched:.3f} seconds")
+        print(f"Speedup: {per_concept / batched:.1f}x")
+
+        assert np.array_equal(batch.values, np.array([c.coordinates for c in coords]))
+
+        # Statistics straight from the columnar block
+        stats_dict = calculate_statistics(batch)
+        assert stats_dict['mean_distance'] == pytest.approx(calculate_statistics(coords)['mean_distance'])
+
     def test_database_performance(self):
         """Test database storage and retrieval at scale."""
         n_concepts = 5000